@@ -17,6 +17,9 @@ REMOVE_PATHS_NO_ACTION_PLUGINS = [
     '{% if cookiecutter.include_example_action_plugins != "y" %}templates/ios{% endif %}',
     '{% if cookiecutter.include_example_action_plugins != "y" %}templates/iosxr{% endif %}',
     '{% if cookiecutter.include_example_action_plugins != "y" %}templates/nxos{% endif %}',
+    '{% if cookiecutter.include_example_action_plugins != "y" %}tests/benchmarks/bench_native_environment.py{% endif %}',
+    '{% if cookiecutter.include_example_action_plugins != "y" %}tests/benchmarks/bench_parallel_render.py{% endif %}',
+    '{% if cookiecutter.include_example_action_plugins != "y" %}tests/unit/test_standard_acls.py{% endif %}',
 ]
 
 
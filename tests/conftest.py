@@ -29,11 +29,15 @@ def simple_generation_directories() -> List[str]:
         "plugins/filter",
         "plugins/inventory",
         "plugins/module_utils/abcs",
+        "plugins/module_utils/acl",
         "plugins/module_utils/mongo",
         "plugins/module_utils/normalizers",
+        "plugins/module_utils/render",
+        "plugins/module_utils/tracing",
         "plugins/module_utils/validators",
         "plugins/modules",
         "templates",
+        "tests/benchmarks",
         "tests/unit",
     ]
 
@@ -49,6 +53,7 @@ def simple_generation_files() -> List[str]:
         "docs/README.md",
         "meta/runtime.yml",
         "plugins/action/README.md",
+        "plugins/action/render_features.py",
         "plugins/action/standard_acls.py",
         "plugins/filter/README.md",
         "plugins/filter/render_filters.py",
@@ -57,9 +62,26 @@ def simple_generation_files() -> List[str]:
         "plugins/module_utils/abcs/abcs_code_render.py",
         "plugins/module_utils/abcs/abcs_module_arg_specs.py",
         "plugins/module_utils/abcs/abcs_template_render.py",
+        "plugins/module_utils/acl/running_config_parser.py",
+        "plugins/module_utils/acl/standard_acl_diff.py",
+        "plugins/module_utils/acl/standard_acl_validation.py",
         "plugins/module_utils/mongo/mongo_client.py",
         "plugins/module_utils/normalizers/ansible_network_os_normalizers.py",
         "plugins/module_utils/normalizers/conversion_normalizers.py",
+        "plugins/module_utils/render/bytecode_cache.py",
+        "plugins/module_utils/render/filter_memo.py",
+        "plugins/module_utils/render/native_environment.py",
+        "plugins/module_utils/render/precompiled_templates.py",
+        "plugins/module_utils/render/render_cache.py",
+        "plugins/module_utils/render/render_pool.py",
+        "plugins/module_utils/render/render_settings.py",
+        "plugins/module_utils/render/render_stream.py",
+        "plugins/module_utils/render/render_timings.py",
+        "plugins/module_utils/render/standard_acl_lines.py",
+        "plugins/module_utils/render/template_cache.py",
+        "plugins/module_utils/render/template_index.py",
+        "plugins/module_utils/render/template_locator.py",
+        "plugins/module_utils/tracing/tracer.py",
         "plugins/module_utils/validators/action_validators.py",
         "plugins/module_utils/validators/general_validators.py",
         "plugins/module_utils/validators/ip_address_validators.py",
@@ -73,15 +95,38 @@ def simple_generation_files() -> List[str]:
         "plugins/modules/README.md",
         "templates/README.md",
         "tests/conftest.py",
+        "tests/unit/test_abcs_template_render.py",
+        "tests/benchmarks/bench_conversion_normalizers.py",
+        "tests/benchmarks/bench_native_environment.py",
+        "tests/benchmarks/bench_parallel_render.py",
         "tests/unit/test_action_validators.py",
         "tests/unit/test_ansible_network_os_normalizers.py",
+        "tests/unit/test_bytecode_cache.py",
         "tests/unit/test_conversion_normalizers.py",
+        "tests/unit/test_filter_memo.py",
         "tests/unit/test_general_validators.py",
         "tests/unit/test_ip_address_validators.py",
         "tests/unit/test_match_validators.py",
+        "tests/unit/test_native_environment.py",
+        "tests/unit/test_precompiled_templates.py",
         "tests/unit/test_range_validators.py",
+        "tests/unit/test_render_cache.py",
+        "tests/unit/test_render_features.py",
         "tests/unit/test_render_filters.py",
+        "tests/unit/test_render_pool.py",
+        "tests/unit/test_render_settings.py",
+        "tests/unit/test_render_stream.py",
+        "tests/unit/test_render_timings.py",
+        "tests/unit/test_running_config_parser.py",
+        "tests/unit/test_standard_acl_diff.py",
+        "tests/unit/test_standard_acl_lines.py",
+        "tests/unit/test_standard_acls.py",
+        "tests/unit/test_standard_acl_validation.py",
         "tests/unit/test_string_validators.py",
+        "tests/unit/test_template_cache.py",
+        "tests/unit/test_template_index.py",
+        "tests/unit/test_template_locator.py",
+        "tests/unit/test_tracer.py",
         ".editorconfig",
         ".gitattributes",
         ".gitignore",
@@ -119,10 +164,14 @@ def generation_no_inventory_plugins_directories() -> List[str]:
         "plugins/filter",
         "plugins/inventory",
         "plugins/module_utils/abcs",
+        "plugins/module_utils/acl",
         "plugins/module_utils/normalizers",
+        "plugins/module_utils/render",
+        "plugins/module_utils/tracing",
         "plugins/module_utils/validators",
         "plugins/modules",
         "templates",
+        "tests/benchmarks",
         "tests/unit",
     ]
 
@@ -138,6 +187,7 @@ def generation_no_inventory_plugins_files() -> List[str]:
         "docs/README.md",
         "meta/runtime.yml",
         "plugins/action/README.md",
+        "plugins/action/render_features.py",
         "plugins/action/standard_acls.py",
         "plugins/filter/README.md",
         "plugins/filter/render_filters.py",
@@ -145,8 +195,25 @@ def generation_no_inventory_plugins_files() -> List[str]:
         "plugins/module_utils/abcs/abcs_code_render.py",
         "plugins/module_utils/abcs/abcs_module_arg_specs.py",
         "plugins/module_utils/abcs/abcs_template_render.py",
+        "plugins/module_utils/acl/running_config_parser.py",
+        "plugins/module_utils/acl/standard_acl_diff.py",
+        "plugins/module_utils/acl/standard_acl_validation.py",
         "plugins/module_utils/normalizers/ansible_network_os_normalizers.py",
         "plugins/module_utils/normalizers/conversion_normalizers.py",
+        "plugins/module_utils/render/bytecode_cache.py",
+        "plugins/module_utils/render/filter_memo.py",
+        "plugins/module_utils/render/native_environment.py",
+        "plugins/module_utils/render/precompiled_templates.py",
+        "plugins/module_utils/render/render_cache.py",
+        "plugins/module_utils/render/render_pool.py",
+        "plugins/module_utils/render/render_settings.py",
+        "plugins/module_utils/render/render_stream.py",
+        "plugins/module_utils/render/render_timings.py",
+        "plugins/module_utils/render/standard_acl_lines.py",
+        "plugins/module_utils/render/template_cache.py",
+        "plugins/module_utils/render/template_index.py",
+        "plugins/module_utils/render/template_locator.py",
+        "plugins/module_utils/tracing/tracer.py",
         "plugins/module_utils/validators/action_validators.py",
         "plugins/module_utils/validators/general_validators.py",
         "plugins/module_utils/validators/ip_address_validators.py",
@@ -160,15 +227,38 @@ def generation_no_inventory_plugins_files() -> List[str]:
         "templates/nxos/main/standard_acl.j2",
         "templates/README.md",
         "tests/conftest.py",
+        "tests/unit/test_abcs_template_render.py",
+        "tests/benchmarks/bench_conversion_normalizers.py",
+        "tests/benchmarks/bench_native_environment.py",
+        "tests/benchmarks/bench_parallel_render.py",
         "tests/unit/test_action_validators.py",
         "tests/unit/test_ansible_network_os_normalizers.py",
+        "tests/unit/test_bytecode_cache.py",
         "tests/unit/test_conversion_normalizers.py",
+        "tests/unit/test_filter_memo.py",
         "tests/unit/test_general_validators.py",
         "tests/unit/test_ip_address_validators.py",
         "tests/unit/test_match_validators.py",
+        "tests/unit/test_native_environment.py",
+        "tests/unit/test_precompiled_templates.py",
         "tests/unit/test_range_validators.py",
+        "tests/unit/test_render_cache.py",
+        "tests/unit/test_render_features.py",
         "tests/unit/test_render_filters.py",
+        "tests/unit/test_render_pool.py",
+        "tests/unit/test_render_settings.py",
+        "tests/unit/test_render_stream.py",
+        "tests/unit/test_render_timings.py",
+        "tests/unit/test_running_config_parser.py",
+        "tests/unit/test_standard_acl_diff.py",
+        "tests/unit/test_standard_acl_lines.py",
+        "tests/unit/test_standard_acls.py",
+        "tests/unit/test_standard_acl_validation.py",
         "tests/unit/test_string_validators.py",
+        "tests/unit/test_template_cache.py",
+        "tests/unit/test_template_index.py",
+        "tests/unit/test_template_locator.py",
+        "tests/unit/test_tracer.py",
         ".editorconfig",
         ".gitattributes",
         ".gitignore",
@@ -206,11 +296,15 @@ def generation_no_action_plugins_directories() -> List[str]:
         "plugins/filter",
         "plugins/inventory",
         "plugins/module_utils/abcs",
+        "plugins/module_utils/acl",
         "plugins/module_utils/mongo",
         "plugins/module_utils/normalizers",
+        "plugins/module_utils/render",
+        "plugins/module_utils/tracing",
         "plugins/module_utils/validators",
         "plugins/modules",
         "templates",
+        "tests/benchmarks",
         "tests/unit",
     ]
 
@@ -226,6 +320,7 @@ def generation_no_action_plugins_files() -> List[str]:
         "docs/README.md",
         "meta/runtime.yml",
         "plugins/action/README.md",
+        "plugins/action/render_features.py",
         "plugins/filter/README.md",
         "plugins/filter/render_filters.py",
         "plugins/inventory/mongo_inventory.py",
@@ -233,9 +328,26 @@ def generation_no_action_plugins_files() -> List[str]:
         "plugins/module_utils/abcs/abcs_code_render.py",
         "plugins/module_utils/abcs/abcs_module_arg_specs.py",
         "plugins/module_utils/abcs/abcs_template_render.py",
+        "plugins/module_utils/acl/running_config_parser.py",
+        "plugins/module_utils/acl/standard_acl_diff.py",
+        "plugins/module_utils/acl/standard_acl_validation.py",
         "plugins/module_utils/mongo/mongo_client.py",
         "plugins/module_utils/normalizers/ansible_network_os_normalizers.py",
         "plugins/module_utils/normalizers/conversion_normalizers.py",
+        "plugins/module_utils/render/bytecode_cache.py",
+        "plugins/module_utils/render/filter_memo.py",
+        "plugins/module_utils/render/native_environment.py",
+        "plugins/module_utils/render/precompiled_templates.py",
+        "plugins/module_utils/render/render_cache.py",
+        "plugins/module_utils/render/render_pool.py",
+        "plugins/module_utils/render/render_settings.py",
+        "plugins/module_utils/render/render_stream.py",
+        "plugins/module_utils/render/render_timings.py",
+        "plugins/module_utils/render/standard_acl_lines.py",
+        "plugins/module_utils/render/template_cache.py",
+        "plugins/module_utils/render/template_index.py",
+        "plugins/module_utils/render/template_locator.py",
+        "plugins/module_utils/tracing/tracer.py",
         "plugins/module_utils/validators/action_validators.py",
         "plugins/module_utils/validators/general_validators.py",
         "plugins/module_utils/validators/ip_address_validators.py",
@@ -246,15 +358,35 @@ def generation_no_action_plugins_files() -> List[str]:
         "plugins/modules/README.md",
         "templates/README.md",
         "tests/conftest.py",
+        "tests/unit/test_abcs_template_render.py",
+        "tests/benchmarks/bench_conversion_normalizers.py",
         "tests/unit/test_action_validators.py",
         "tests/unit/test_ansible_network_os_normalizers.py",
+        "tests/unit/test_bytecode_cache.py",
         "tests/unit/test_conversion_normalizers.py",
+        "tests/unit/test_filter_memo.py",
         "tests/unit/test_general_validators.py",
         "tests/unit/test_ip_address_validators.py",
         "tests/unit/test_match_validators.py",
+        "tests/unit/test_native_environment.py",
+        "tests/unit/test_precompiled_templates.py",
         "tests/unit/test_range_validators.py",
+        "tests/unit/test_render_cache.py",
+        "tests/unit/test_render_features.py",
         "tests/unit/test_render_filters.py",
+        "tests/unit/test_render_pool.py",
+        "tests/unit/test_render_settings.py",
+        "tests/unit/test_render_stream.py",
+        "tests/unit/test_render_timings.py",
+        "tests/unit/test_running_config_parser.py",
+        "tests/unit/test_standard_acl_diff.py",
+        "tests/unit/test_standard_acl_lines.py",
+        "tests/unit/test_standard_acl_validation.py",
         "tests/unit/test_string_validators.py",
+        "tests/unit/test_template_cache.py",
+        "tests/unit/test_template_index.py",
+        "tests/unit/test_template_locator.py",
+        "tests/unit/test_tracer.py",
         ".editorconfig",
         ".gitattributes",
         ".gitignore",
@@ -0,0 +1,236 @@
+"""
+render_features action plugin
+"""
+
+__metaclass__ = type
+
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Optional
+
+from ansible.plugins.action import ActionBase
+from ansible.errors import AnsibleActionFail
+from ansible.template import Templar
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.abcs.abcs_template_render import (
+    RenderConfigFromTemplate,
+    TemplateVariablesError,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.acl.standard_acl_validation import (
+    standard_acl_errors,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.tracing.tracer import (
+    get_tracer,
+)
+
+# The validator of each feature that has one, it returns every error of one item of the feature data with its path
+FEATURE_VALIDATORS: Dict[str, Callable[[Mapping], List[str]]] = {
+    "standard_acls": standard_acl_errors,
+}
+
+OUTPUTS = ("text", "lines", "both")
+
+
+class FeatureRenderConfigFromTemplate(RenderConfigFromTemplate):
+    """Class for rendering a feature, each item of the feature data is checked with the validator of the feature
+
+    :type templar: ansible.template.Templar
+    :param templar: The passed in templar from the action
+    :type template_variables: Optional[dict]
+    :param template_variables: The variables to fill the template with, can be None when using render_many
+    :type ansible_network_os: String
+    :param ansible_network_os: The ansible network os
+    :type validator: Optional[Callable[[Mapping], List[str]]] = None
+    :param validator: The validator of the feature, nothing is validated if None
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    def __init__(
+        self,
+        templar: Templar,
+        template_variables: Optional[dict],
+        ansible_network_os: str,
+        validator: Optional[Callable[[Mapping], List[str]]] = None,
+    ) -> None:
+        self._validator = validator
+        super().__init__(templar=templar, template_variables=template_variables, ansible_network_os=ansible_network_os)
+
+    def validate_module_params(self, template_variables: Mapping) -> None:
+        """Method to validate an item of the feature data with the validator of the feature
+
+        :type template_variables: Mapping
+        :param template_variables: The item of the feature data
+
+        :rtype: None
+        :returns: Nothing
+
+        :raises TemplateVariablesError: With every error of the item
+        """
+        if self._validator is None:
+            return
+
+        errors = self._validator(template_variables)
+
+        if errors:
+            raise TemplateVariablesError(errors=errors)
+
+
+class ActionModule(ActionBase):
+
+    @staticmethod
+    def _get_features(features_arg: Optional[Mapping]) -> Mapping:
+        """Protected method to get the feature table from the task option 'features'
+
+        :type features_arg: Optional[Mapping]
+        :param features_arg: The task option 'features'
+
+        :rtype: Mapping
+        :returns: The feature table Example: {"standard_acls": {"template_name": "standard_acl.j2",
+                  "from_hostvars": true}}
+
+        :raises TypeError: If features is not a dict of dicts
+        :raises ValueError: If features is empty, a feature has no template_name or src, or its validator is unknown
+        """
+        if not isinstance(features_arg, Mapping):
+            raise TypeError(f"'features' must be of type dict but received a {type(features_arg)}")
+
+        if not features_arg:
+            raise ValueError("'features' must have at least one feature")
+
+        for feature_name, feature in features_arg.items():
+            if not isinstance(feature, Mapping):
+                raise TypeError(f"feature '{feature_name}' must be of type dict but received a {type(feature)}")
+
+            if not feature.get("template_name") and not feature.get("src"):
+                raise ValueError(f"feature '{feature_name}' requires option 'template_name' or 'src'")
+
+            if "validator" in feature and feature["validator"] not in FEATURE_VALIDATORS:
+                raise ValueError(
+                    f"feature '{feature_name}' option 'validator' must be one of {sorted(FEATURE_VALIDATORS)} but "
+                    f"received '{feature['validator']}'"
+                )
+
+        return features_arg
+
+    @staticmethod
+    def _get_feature_data(feature_name: str, feature: Mapping, current_hostvars: dict) -> List[dict]:
+        """Protected method to get the data of a feature from the feature option 'data', or from hostvars
+
+        :type feature_name: String
+        :param feature_name: The feature name, the hostvar the data is in when 'from_hostvars' is true
+        :type feature: Mapping
+        :param feature: The feature options
+        :type current_hostvars: Dict
+        :param current_hostvars: The current devices hostvars
+
+        :rtype: List[dict]
+        :returns: The feature data, one dict per render
+
+        :raises KeyError: If data can not be retrieved from feature option 'data'
+        :raises ValueError: If the data is empty
+        """
+        if not feature.get("from_hostvars"):
+            try:
+                feature_data = feature["data"]
+
+            except KeyError as error:
+                raise KeyError(
+                    f"feature '{feature_name}' required option 'data' was not supplied, set option 'from_hostvars' "
+                    "to true if you want to get data from the hostvars"
+                ) from error
+
+        else:
+            feature_data = current_hostvars.get(feature_name)
+
+        if not feature_data:
+            raise ValueError(f"could not find data for feature '{feature_name}'")
+
+        return feature_data
+
+    def _render_feature(
+        self, feature_name: str, feature: Mapping, current_hostvars: dict, output: str
+    ) -> Dict[str, object]:
+        """Protected method to render a feature
+
+        :type feature_name: String
+        :param feature_name: The feature name
+        :type feature: Mapping
+        :param feature: The feature options, the validator is the one of the feature option 'validator', or of the
+                        feature name
+        :type current_hostvars: Dict
+        :param current_hostvars: The current devices hostvars
+        :type output: String
+        :param output: text for only rendered, lines for only rendered_lines, or both
+
+        :rtype: Dict[str, object]
+        :returns: The feature result with rendered, rendered_lines, or both, and render_cache if it is enabled
+        """
+        renderer = FeatureRenderConfigFromTemplate(
+            templar=self._templar,
+            template_variables=None,
+            ansible_network_os=current_hostvars.get("ansible_network_os"),
+            validator=FEATURE_VALIDATORS.get(feature.get("validator", feature_name)),
+        )
+        rendered = renderer.render_many(
+            template_variables_list=self._get_feature_data(
+                feature_name=feature_name, feature=feature, current_hostvars=current_hostvars
+            ),
+            src=feature.get("src"),
+            template_name=feature.get("template_name"),
+            solution=current_hostvars.get("solution"),
+            family=current_hostvars.get("family"),
+            model=current_hostvars.get("model"),
+        )
+        feature_result = {}
+
+        if output in ("text", "both"):
+            feature_result["rendered"] = rendered
+
+        if output in ("lines", "both"):
+            feature_result["rendered_lines"] = [
+                line for rendered_template in rendered for line in rendered_template.splitlines()
+            ]
+
+        render_cache_stats = renderer.render_cache_stats()
+        if render_cache_stats is not None:
+            feature_result["render_cache"] = render_cache_stats
+
+        return feature_result
+
+    def run(self, tmp=None, task_vars=None):
+        super(ActionModule, self).run(tmp, task_vars)
+
+        errors = []
+        features_result = {}
+
+        try:
+            features = self._get_features(features_arg=self._task.args.get("features"))
+            output = self._task.args.get("output", "both")
+            if output not in OUTPUTS:
+                raise ValueError(f"'output' must be one of {list(OUTPUTS)} but received '{output}'")
+
+            inventory_hostname = task_vars["inventory_hostname"]
+            current_hostvars = task_vars["hostvars"].get(inventory_hostname, {})
+
+            with get_tracer().span("render_features", host=inventory_hostname, features=list(features), output=output):
+                # Every feature is rendered before failing, so the data errors of all the features are found at once
+                for feature_name, feature in features.items():
+                    try:
+                        features_result[feature_name] = self._render_feature(
+                            feature_name=feature_name,
+                            feature=feature,
+                            current_hostvars=current_hostvars,
+                            output=output,
+                        )
+
+                    except TemplateVariablesError as error:
+                        errors.extend(f"{feature_name}{item_error}" for item_error in error.errors)
+
+        except Exception as error:
+            raise AnsibleActionFail(f"{error}")
+
+        if errors:
+            raise AnsibleActionFail(f"{len(errors)} features errors: {'; '.join(errors)}", result={"errors": errors})
+
+        return {"changed": False, "features": features_result}
@@ -4,61 +4,292 @@ prefix_lists_from_template action plugin
 
 __metaclass__ = type
 
+import time
+from collections.abc import Mapping
 from typing import Optional, Tuple, List, Union
 from ansible.plugins.action import ActionBase
 from ansible.errors import AnsibleActionFail
+from ansible.module_utils.parsing.convert_bool import boolean
 
 from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.abcs.abcs_template_render import (
     RenderConfigFromTemplate,
+    TemplateVariablesError,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.acl.running_config_parser import (
+    RunningConfigError,
+    parse_running_config_acls,
+    validate_running_config_acls,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.acl.standard_acl_diff import (
+    diff_standard_acls,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.acl.standard_acl_validation import (
+    standard_acl_errors,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_pool import (
+    PARALLEL_MIN_BATCH,
+    available_processes,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    get_bool_setting,
+    get_int_setting,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_stream import (
+    replace_lines,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_timings import (
+    DISABLED_RENDER_TIMINGS,
+    RenderTimings,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.tracing.tracer import (
+    get_tracer,
 )
 
 
 class StandardAclRenderConfigFromTemplate(RenderConfigFromTemplate):
 
     @staticmethod
-    def validate_module_params(template_variables: dict) -> None:
-        pass
+    def validate_module_params(template_variables: Mapping) -> None:
+        """Static Method to validate a standard ACL, the sequence numbers, actions, sources, and options
+
+        :type template_variables: Mapping
+        :param template_variables: The ACL
+
+        :rtype: None
+        :returns: Nothing
+
+        :raises TemplateVariablesError: With every error of the ACL
+        """
+        errors = standard_acl_errors(acl=template_variables)
+
+        if errors:
+            raise TemplateVariablesError(errors=errors)
+
+
+OUTPUTS = ("text", "lines", "both", "file")
 
 
 class ActionModule(ActionBase):
 
+    def _get_renderer(self, current_hostvars: dict, timings: RenderTimings) -> StandardAclRenderConfigFromTemplate:
+        """Protected method to get the renderer
+
+        :type current_hostvars: Dict
+        :param current_hostvars: The current devices hostvars
+        :type timings: RenderTimings
+        :param timings: The timings to record the render stages in
+
+        :rtype: StandardAclRenderConfigFromTemplate
+        :returns: The renderer
+        """
+        return StandardAclRenderConfigFromTemplate(
+            templar=self._templar,
+            template_variables=None,
+            ansible_network_os=current_hostvars.get("ansible_network_os"),
+            timings=timings,
+        )
+
+    def _get_timings(self) -> RenderTimings:
+        """Protected method to get the render timings, enabled by the task option 'perf' or the PERF setting
+
+        :rtype: RenderTimings
+        :returns: The render timings
+        """
+        perf_arg = self._task.args.get("perf")
+        perf = get_bool_setting("PERF") if perf_arg is None else boolean(perf_arg, strict=False)
+
+        return RenderTimings() if perf else DISABLED_RENDER_TIMINGS
+
+    def _get_processes(self, config_data: List[dict]) -> int:
+        """Protected method to get the number of processes to render in, enabled by the task option 'parallel' or the
+        PARALLEL setting
+
+        A pool only helps large batches, so with fewer ACL entries than the PARALLEL_MIN_BATCH setting the ACLs are
+        rendered in one process
+
+        :type config_data: List[dict]
+        :param config_data: The ACLs to render
+
+        :rtype: Integer
+        :returns: The number of cores the controller can run on if enabled for a large batch, otherwise 1
+        """
+        parallel_arg = self._task.args.get("parallel")
+        parallel = get_bool_setting("PARALLEL") if parallel_arg is None else boolean(parallel_arg, strict=False)
+
+        if not parallel:
+            return 1
+
+        entry_count = sum(
+            len(acl["sequences"])
+            for acl in config_data
+            if isinstance(acl, Mapping) and isinstance(acl.get("sequences"), list)
+        )
+
+        if entry_count < get_int_setting("PARALLEL_MIN_BATCH", default=PARALLEL_MIN_BATCH):
+            return 1
+
+        return available_processes()
+
+    def _get_output(self, dest_arg: Optional[str]) -> str:
+        """Protected method to get what goes into the result, set by the task option 'output'
+
+        text returns rendered, lines returns rendered_lines, both returns both, and file writes the config to dest and
+        returns its path, checksum, and line count. The default is file if dest is given, otherwise both
+
+        :type dest_arg: Optional[str]
+        :param dest_arg: The task option 'dest'
+
+        :rtype: String
+        :returns: The output
+
+        :raises ValueError: If output is not one of OUTPUTS, or dest is not given with output file, or only with it
+        """
+        output_arg = self._task.args.get("output")
+        output = ("file" if dest_arg else "both") if output_arg is None else output_arg
+
+        if output not in OUTPUTS:
+            raise ValueError(f"'output' must be one of {', '.join(OUTPUTS)} but received '{output}'")
+
+        if output == "file" and not dest_arg:
+            raise ValueError("option 'dest' is required with output 'file'")
+
+        if output != "file" and dest_arg:
+            raise ValueError(f"option 'dest' is only used with output 'file' but output is '{output}'")
+
+        return output
+
+    @staticmethod
+    def _get_perf(timings: RenderTimings, config_data: List[dict], total: float) -> dict:
+        """Protected method to get the perf result of the render timings
+
+        :type timings: RenderTimings
+        :param timings: The render timings
+        :type config_data: List[dict]
+        :param config_data: The variables the template was rendered with
+        :type total: Float
+        :param total: The seconds the whole render took
+
+        :rtype: Dict
+        :returns: The total seconds, the seconds of each stage, and the seconds of each stage for each ACL
+        """
+        return {
+            "total": round(total, 6),
+            "stages": timings.totals(),
+            "per_acl": [
+                {"name": acl.get("name"), **acl_timings} for acl, acl_timings in zip(config_data, timings.items())
+            ],
+        }
+
+    @staticmethod
     def _render_config(
-        self, current_hostvars: dict, config_data: List[dict], src: Optional[str] = None
-    ) -> Tuple[List[str], List[str]]:
+        renderer: StandardAclRenderConfigFromTemplate,
+        current_hostvars: dict,
+        config_data: List[dict],
+        src: Optional[str] = None,
+        timings: RenderTimings = DISABLED_RENDER_TIMINGS,
+        processes: int = 1,
+        output: str = "both",
+    ) -> Tuple[Optional[List[str]], Optional[List[str]]]:
         """Protected method to render the config
 
+        :type renderer: StandardAclRenderConfigFromTemplate
+        :param renderer: The renderer
         :type current_hostvars: Dict
         :param current_hostvars: The current devices hostvars
         :type config_data: List[dict]
         :param config_data: The variables to render the template with
         :type src: src: Optional[str] = None
         :param src: A template path for a specific template not built in to the collection
+        :type timings: RenderTimings
+        :param timings: The timings to record the split stage in
+        :type processes: Integer
+        :param processes: The number of processes to render in
+        :type output: String
+        :param output: text for only rendered, lines for only rendered_lines, or both
 
-        :rtype: Tuple[List[str], List[str]]
-        :returns: rendered, rendered_lines
+        :rtype: Tuple[Optional[List[str]], Optional[List[str]]]
+        :returns: rendered, rendered_lines, None for the one output does not ask for
         """
-        rendered = []
+        rendered = renderer.render_many(
+            template_variables_list=config_data,
+            src=src,
+            template_name="standard_acl.j2",
+            solution=current_hostvars.get("solution"),
+            family=current_hostvars.get("family"),
+            model=current_hostvars.get("model"),
+            processes=processes,
+        )
+
+        if output == "text":
+            return rendered, None
+
         rendered_lines = []
+        for item, rendered_template in enumerate(rendered):
+            with timings.stage("split", item=item):
+                rendered_lines.extend(rendered_template.splitlines())
 
-        for single_config in config_data:
-            renderer = StandardAclRenderConfigFromTemplate(
-                templar=self._templar,
-                template_variables=single_config,
-                ansible_network_os=current_hostvars.get("ansible_network_os"),
-            )
+        if output == "lines":
+            return None, rendered_lines
+
+        return rendered, rendered_lines
+
+    @staticmethod
+    def _stream_config(
+        renderer: StandardAclRenderConfigFromTemplate,
+        current_hostvars: dict,
+        config_data: List[dict],
+        dest: str,
+        src: Optional[str] = None,
+        processes: int = 1,
+        check_mode: bool = False,
+    ) -> Tuple[int, str, bool]:
+        """Protected method to stream the rendered config lines straight to a file on the controller
 
-            rendered_template = renderer.render_config(
+        The file is atomically replaced, and only if the rendered config differs from what it has. With more than one
+        process each ACL is rendered whole in the process pool, then its lines are written. In check mode the file is
+        only compared to the rendered config
+
+        :type renderer: StandardAclRenderConfigFromTemplate
+        :param renderer: The renderer
+        :type current_hostvars: Dict
+        :param current_hostvars: The current devices hostvars
+        :type config_data: List[dict]
+        :param config_data: The variables to render the template with
+        :type dest: String
+        :param dest: The file on the controller to write the rendered lines to
+        :type src: src: Optional[str] = None
+        :param src: A template path for a specific template not built in to the collection
+        :type processes: Integer
+        :param processes: The number of processes to render in
+        :type check_mode: Boolean
+        :param check_mode: If the file is only compared to the rendered config, not written
+
+        :rtype: Tuple[int, str, bool]
+        :returns: The number of lines, the SHA-256 hex digest of the content, and if the file was, or would be, changed
+        """
+        if processes > 1:
+            rendered = renderer.render_many(
+                template_variables_list=config_data,
                 src=src,
                 template_name="standard_acl.j2",
                 solution=current_hostvars.get("solution"),
                 family=current_hostvars.get("family"),
                 model=current_hostvars.get("model"),
+                processes=processes,
             )
+            rendered_lines = (line for rendered_template in rendered for line in rendered_template.splitlines())
 
-            rendered.append(rendered_template)
-            rendered_lines.extend(rendered_template.splitlines())
+        else:
+            rendered_lines = renderer.stream_lines(
+                template_variables_list=config_data,
+                src=src,
+                template_name="standard_acl.j2",
+                solution=current_hostvars.get("solution"),
+                family=current_hostvars.get("family"),
+                model=current_hostvars.get("model"),
+            )
 
-        return rendered, rendered_lines
+        return replace_lines(lines=rendered_lines, file_path=dest, check_mode=check_mode)
 
     def _get_config_data(self, from_hostvars_arg: Union[bool, None], current_hostvars: dict) -> List[dict]:
         """Protected method to get the config data from hostvars or from given data
@@ -98,22 +329,107 @@ class ActionModule(ActionBase):
 
         try:
             src_arg = self._task.args.get("src")
+            dest_arg = self._task.args.get("dest")
+            output = self._get_output(dest_arg=dest_arg)
+            current_arg = self._task.args.get("current")
+            running_config_arg = self._task.args.get("running_config")
             from_hostvars_arg = self._task.args.get("from_hostvars")
 
             inventory_hostname = task_vars["inventory_hostname"]
             current_hostvars = task_vars["hostvars"].get(inventory_hostname, {})
 
-            config_data = self._get_config_data(from_hostvars_arg=from_hostvars_arg, current_hostvars=current_hostvars)
+            timings = self._get_timings()
+            start = time.monotonic()
+
+            with get_tracer().span(
+                "standard_acls", host=inventory_hostname, src=src_arg, dest=dest_arg, output=output
+            ) as span:
+                config_data = self._get_config_data(
+                    from_hostvars_arg=from_hostvars_arg, current_hostvars=current_hostvars
+                )
+                renderer = self._get_renderer(current_hostvars=current_hostvars, timings=timings)
+
+                if output == "file":
+                    line_count, checksum, changed = self._stream_config(
+                        renderer=renderer,
+                        current_hostvars=current_hostvars,
+                        config_data=config_data,
+                        dest=dest_arg,
+                        src=src_arg,
+                        processes=self._get_processes(config_data=config_data),
+                        check_mode=bool(self._task.check_mode),
+                    )
+
+                else:
+                    rendered, rendered_lines = self._render_config(
+                        renderer=renderer,
+                        current_hostvars=current_hostvars,
+                        config_data=config_data,
+                        src=src_arg,
+                        timings=timings,
+                        processes=self._get_processes(config_data=config_data),
+                        output=output,
+                    )
+
+                if current_arg is None and running_config_arg is not None:
+                    current_arg = validate_running_config_acls(
+                        acls=parse_running_config_acls(
+                            running_config=running_config_arg,
+                            ansible_network_os=current_hostvars.get("ansible_network_os"),
+                        )
+                    )
+
+                if current_arg is None:
+                    commands = None
+
+                else:
+                    commands = diff_standard_acls(
+                        intended=config_data,
+                        current=current_arg,
+                        ansible_network_os=current_hostvars.get("ansible_network_os"),
+                    )
+
+                span.set("acls", len(config_data))
 
-            rendered, rendered_lines = self._render_config(
-                current_hostvars=current_hostvars, config_data=config_data, src=src_arg
+            total = time.monotonic() - start
+
+        except TemplateVariablesError as error:
+            errors = [f"standard_acls{item_error}" for item_error in error.errors]
+            raise AnsibleActionFail(
+                f"{len(errors)} standard_acls errors: {'; '.join(errors)}", result={"errors": errors}
             )
 
+        except RunningConfigError as error:
+            raise AnsibleActionFail(f"{error}", result={"errors": error.errors})
+
         except Exception as error:
             raise AnsibleActionFail(f"{error}")
 
-        return {
-            "changed": False,
-            "rendered": rendered,
-            "rendered_lines": rendered_lines,
-        }
+        if output == "file":
+            result = {
+                "changed": changed,
+                "dest": dest_arg,
+                "checksum": checksum,
+                "line_count": line_count,
+            }
+
+        else:
+            result = {"changed": False}
+
+            if rendered is not None:
+                result["rendered"] = rendered
+
+            if rendered_lines is not None:
+                result["rendered_lines"] = rendered_lines
+
+        if commands is not None:
+            result["commands"] = commands
+
+        render_cache_stats = renderer.render_cache_stats()
+        if render_cache_stats is not None:
+            result["render_cache"] = render_cache_stats
+
+        if timings.enabled:
+            result["perf"] = self._get_perf(timings=timings, config_data=config_data, total=total)
+
+        return result
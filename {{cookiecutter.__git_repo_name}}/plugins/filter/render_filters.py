@@ -3,8 +3,7 @@ Render filters
 """
 
 import inspect
-import ipaddress
-from typing import Dict, Callable, Union
+from typing import Dict, Callable, List, Optional, Union
 
 
 import jinja2
@@ -12,10 +11,11 @@ from ansible.plugins import to_native
 from ansible.errors import AnsibleUndefinedVariable, AnsibleFilterError
 
 from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.validators.ip_address_validators import (
+    IPv4Prefix,
     is_ipv4_host,
     is_ipv4_subnet,
-    is_ipv4_prefix,
     is_cidr_range,
+    parse_ipv4_prefix,
 )
 
 from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.validators.general_validators import (
@@ -40,12 +40,8 @@ from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils
 )
 
 from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.normalizers.conversion_normalizers import (
-    ios_standard_acl_ipv4_subnet_normalizer,
-    ios_extended_acl_ipv4_subnet_normalizer,
-    iosxr_standard_acl_ipv4_subnet_normalizer,
-    iosxr_extended_acl_ipv4_subnet_normalizer,
-    eos_standard_acl_ipv4_subnet_normalizer,
-    eos_extended_acl_ipv4_subnet_normalizer,
+    STANDARD_ACL_IPV4_SUBNET_NORMALIZERS,
+    EXTENDED_ACL_IPV4_SUBNET_NORMALIZERS,
     eos_port_normalizer,
 )
 
@@ -53,6 +49,22 @@ from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils
     network_os_normalize,
 )
 
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.standard_acl_lines import (
+    standard_acl_config_lines,
+)
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.acl.standard_acl_validation import (
+    standard_acl_errors,
+)
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.filter_memo import (
+    get_filter_memo,
+)
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.tracing.tracer import (
+    get_tracer,
+)
+
 
 def ipv4_host(value: str) -> str:
     """Filter plugin to validate a value is a ipv4_host address Example: 192.168.1.1
@@ -106,6 +118,26 @@ def ipv4_subnet(value: str) -> str:
     return value
 
 
+def _parse_acl_subnet(value: str) -> IPv4Prefix:
+    """Protected function to parse the subnet of an ACL entry, it must be a valid IPv4 prefix with no host bits set
+
+    :type value: String
+    :param value: The value to parse Example: 192.168.1.0/24
+
+    :rtype: IPv4Prefix
+    :returns: The parsed subnet
+
+    :raises AnsiblePluginError: If the value is not a valid IPv4 prefix
+    :raises ValueError: If the value has host bits set
+    """
+    prefix = parse_ipv4_prefix(value)
+
+    if not prefix.is_subnet:
+        raise ValueError(f"{value} has host bits set")
+
+    return prefix
+
+
 def standard_acl_ipv4_subnet_normalizer(value: str, nos: str) -> str:
     """Normalize subnets in a standard acl for various network operating system's
 
@@ -125,21 +157,15 @@ def standard_acl_ipv4_subnet_normalizer(value: str, nos: str) -> str:
             new_value = value
 
         else:
-            is_ipv4_prefix(value)
-
-            ipaddress.ip_network(value, strict=True)
+            # The value is parsed, and the network OS normalized, once for the whole call
+            prefix = _parse_acl_subnet(value)
+            normalizer = STANDARD_ACL_IPV4_SUBNET_NORMALIZERS.get(network_os_normalize(nos))
 
-            if network_os_normalize(nos) == "ios":
-                new_value = ios_standard_acl_ipv4_subnet_normalizer(value)
-
-            elif network_os_normalize(nos) == "iosxr":
-                new_value = iosxr_standard_acl_ipv4_subnet_normalizer(value)
-
-            elif network_os_normalize(nos) == "eos":
-                new_value = eos_standard_acl_ipv4_subnet_normalizer(value)
+            if normalizer is None:
+                new_value = value
 
             else:
-                new_value = value
+                new_value = normalizer(prefix)
 
     except jinja2.exceptions.UndefinedError as error:  # pragma: no cover
         raise AnsibleUndefinedVariable(f"jinja2 exception: {to_native(error)}") from error
@@ -171,21 +197,15 @@ def extended_acl_ipv4_subnet_normalizer(value: str, nos: str) -> str:
             new_value = value
 
         else:
-            is_ipv4_prefix(value)
-
-            ipaddress.ip_network(value, strict=True)
+            # The value is parsed, and the network OS normalized, once for the whole call
+            prefix = _parse_acl_subnet(value)
+            normalizer = EXTENDED_ACL_IPV4_SUBNET_NORMALIZERS.get(network_os_normalize(nos))
 
-            if network_os_normalize(nos) == "ios":
-                new_value = ios_extended_acl_ipv4_subnet_normalizer(value)
-
-            elif network_os_normalize(nos) == "iosxr":
-                new_value = iosxr_extended_acl_ipv4_subnet_normalizer(value)
-
-            elif network_os_normalize(nos) == "eos":
-                new_value = eos_extended_acl_ipv4_subnet_normalizer(value)
+            if normalizer is None:
+                new_value = value
 
             else:
-                new_value = value
+                new_value = normalizer(prefix)
 
     except jinja2.exceptions.UndefinedError as error:  # pragma: no cover
         raise AnsibleUndefinedVariable(f"jinja2 exception: {to_native(error)}") from error
@@ -250,6 +270,38 @@ def port_match(value: str) -> str:
     return value
 
 
+def _port_or_ports(value: Union[str, int], port_match_value: str, eos: bool) -> Union[str, int]:
+    """Protected function to validate a port or ports, with an already validated port match
+
+    :type value: Union[str, int]
+    :param value: The value to validate
+    :type port_match_value: String
+    :param port_match_value: The validated port match type
+    :type eos: Boolean
+    :param eos: If the network operating system is eos
+
+    :rtype: Union[str,int]
+    :returns: The validated value
+
+    :raises ValueError: If the value is not a valid port or ports
+    """
+    if port_match_value == "range":
+        split_value = value.split(",")
+
+        if len(split_value) != 2:
+            raise ValueError(f"port or ports is not valid '{value}'")
+
+        if int(split_value[0]) > int(split_value[1]):
+            raise ValueError(f"port or ports is not valid '{value}' first port greater than second")
+
+        return f"{split_value[0]} {split_value[1]}"
+
+    if eos:
+        return eos_port_normalizer(value)
+
+    return int(value)
+
+
 def port_or_ports(value: Union[str, int], port_match_value: str, nos: str) -> Union[str, int]:
     """Check for a valid port or ports, based on port_natch
 
@@ -268,24 +320,11 @@ def port_or_ports(value: Union[str, int], port_match_value: str, nos: str) -> Un
     """
     try:
         validated_port_match_value = is_eq_gt_lt_neq_range(port_match_value)
-
-        if validated_port_match_value == "range":
-            split_value = value.split(",")
-
-            if len(split_value) != 2:
-                raise ValueError(f"port or ports is not valid '{value}'")
-
-            if int(split_value[0]) > int(split_value[1]):
-                raise ValueError(f"port or ports is not valid '{value}' first port greater than second")
-
-            new_value = f"{split_value[0]} {split_value[1]}"
-
-        else:
-            if network_os_normalize(nos) == "eos":
-                new_value = eos_port_normalizer(value)
-
-            else:
-                new_value = int(value)
+        new_value = _port_or_ports(
+            value=value,
+            port_match_value=validated_port_match_value,
+            eos=validated_port_match_value != "range" and network_os_normalize(nos) == "eos",
+        )
 
     except jinja2.exceptions.UndefinedError as error:  # pragma: no cover
         raise AnsibleUndefinedVariable(f"jinja2 exception: {to_native(error)}") from error
@@ -519,16 +558,247 @@ def cidr_range(value: str) -> str:
     return value
 
 
+def _list_argument(value: Union[list, tuple], argument_name: str = "value") -> Union[list, tuple]:
+    """Protected function to check the argument of a list filter is a list
+
+    :type value: Union[list, tuple]
+    :param value: The argument
+    :type argument_name: String
+    :param argument_name: The argument name for the error message
+
+    :rtype: Union[list, tuple]
+    :returns: The argument
+
+    :raises TypeError: If the argument is not a list or a tuple
+    """
+    if not isinstance(value, (list, tuple)):
+        raise TypeError(f"'{argument_name}' must be of type list but received a {type(value)}")
+
+    return value
+
+
+def _list_error(index: Optional[int], error: Exception) -> str:
+    """Protected function to get the error message of a list filter, with the index of the invalid value
+
+    :type index: Optional[int]
+    :param index: The index of the invalid value, None if the error is not of a value
+    :type error: Exception
+    :param error: The error
+
+    :rtype: String
+    :returns: The error message Example: index 2 exception: is_protocol error: ...
+    """
+    if index is None:
+        return to_native(error)
+
+    return f"index {index} {to_native(error)}"
+
+
+def ipv4_subnet_list(value: List[str]) -> List[str]:
+    """Filter plugin to validate every value of a list is a ipv4_subnet address in one call Example: [192.168.1.0/24]
+
+    :type value: List[str]
+    :param value: The values to validate
+
+    :rtype: List[str]
+    :returns: The validated values
+
+    :raises AnsibleUndefinedVariable: If jinja2 undefined variable
+    :raises AnsibleFilterError: If any other exceptions occur, with the index of the invalid value
+    """
+    index = None
+
+    try:
+        for index, item in enumerate(_list_argument(value)):
+            is_ipv4_subnet(item)
+
+    except jinja2.exceptions.UndefinedError as error:  # pragma: no cover
+        raise AnsibleUndefinedVariable(f"jinja2 exception happened in ipv4_subnet_list: {to_native(error)}") from error
+
+    except Exception as error:
+        raise AnsibleFilterError(
+            f"exception: {inspect.currentframe().f_code.co_name} error: invalid ipv4_subnet "
+            f"{_list_error(index=index, error=error)}"
+        ) from error
+
+    return list(value)
+
+
+def standard_acl_ipv4_subnet_normalizer_list(value: List[str], nos: str) -> List[str]:
+    """Normalize every subnet of a list in a standard acl for various network operating system's in one call
+
+    :type value: List[str]
+    :param value: The values to validate
+    :type nos: String
+    :param nos: The network operating system to normalize for
+
+    :rtype: List[str]
+    :returns: The validated values
+
+    :raises AnsibleUndefinedVariable: If jinja2 undefined variable
+    :raises AnsibleFilterError: If any other exceptions occur, with the index of the invalid value
+    """
+    index = None
+
+    try:
+        # The network OS is normalized once for the whole list
+        normalizer = STANDARD_ACL_IPV4_SUBNET_NORMALIZERS.get(network_os_normalize(nos))
+        new_value = []
+
+        for index, item in enumerate(_list_argument(value)):
+            if item == "any":
+                new_value.append(item)
+
+            elif normalizer is None:
+                _parse_acl_subnet(item)
+                new_value.append(item)
+
+            else:
+                new_value.append(normalizer(_parse_acl_subnet(item)))
+
+    except jinja2.exceptions.UndefinedError as error:  # pragma: no cover
+        raise AnsibleUndefinedVariable(f"jinja2 exception: {to_native(error)}") from error
+
+    except Exception as error:
+        raise AnsibleFilterError(
+            f"exception: {inspect.currentframe().f_code.co_name} error: {_list_error(index=index, error=error)}"
+        ) from error
+
+    return new_value
+
+
+def protocol_list(value: List[str]) -> List[str]:
+    """Check every value of a list is a valid protocol in one call
+
+    :type value: List[str]
+    :param value: The values to validate
+
+    :rtype: List[str]
+    :returns: The validated values
+
+    :raises AnsibleUndefinedVariable: If jinja2 undefined variable
+    :raises AnsibleFilterError: If any other exceptions occur, with the index of the invalid value
+    """
+    index = None
+
+    try:
+        for index, item in enumerate(_list_argument(value)):
+            is_protocol(item)
+
+    except jinja2.exceptions.UndefinedError as error:  # pragma: no cover
+        raise AnsibleUndefinedVariable(f"jinja2 exception: {to_native(error)}") from error
+
+    except Exception as error:
+        raise AnsibleFilterError(
+            f"exception: {inspect.currentframe().f_code.co_name} error: {_list_error(index=index, error=error)}"
+        ) from error
+
+    return list(value)
+
+
+def port_or_ports_list(
+    value: List[Union[str, int]], port_match_value: Union[str, List[str]], nos: str
+) -> List[Union[str, int]]:
+    """Check every value of a list is a valid port or ports, based on port_match, in one call
+
+    :type value: List[Union[str, int]]
+    :param value: The values to validate
+    :type port_match_value: Union[str, List[str]]
+    :param port_match_value: The port match type of every value, or a list with the port match type of each value
+    :type nos: String
+    :param nos: The network operating system to normalize for
+
+    :rtype: List[Union[str,int]]
+    :returns: The validated values
+
+    :raises AnsibleUndefinedVariable: If jinja2 undefined variable
+    :raises AnsibleFilterError: If any other exceptions occur, with the index of the invalid value
+    """
+    index = None
+
+    try:
+        _list_argument(value)
+
+        # The port match types, and the network OS, are validated once for the whole list
+        if isinstance(port_match_value, str):
+            port_match_values = [is_eq_gt_lt_neq_range(port_match_value)] * len(value)
+
+        else:
+            port_match_values = [
+                is_eq_gt_lt_neq_range(item) for item in _list_argument(port_match_value, "port_match_value")
+            ]
+
+            if len(port_match_values) != len(value):
+                raise ValueError(
+                    f"'port_match_value' must have {len(value)} items but received {len(port_match_values)}"
+                )
+
+        eos = any(item != "range" for item in port_match_values) and network_os_normalize(nos) == "eos"
+        new_value = []
+
+        for index, (item, item_port_match_value) in enumerate(zip(value, port_match_values)):
+            new_value.append(_port_or_ports(value=item, port_match_value=item_port_match_value, eos=eos))
+
+    except jinja2.exceptions.UndefinedError as error:  # pragma: no cover
+        raise AnsibleUndefinedVariable(f"jinja2 exception: {to_native(error)}") from error
+
+    except Exception as error:
+        raise AnsibleFilterError(
+            f"exception: {inspect.currentframe().f_code.co_name} error: {_list_error(index=index, error=error)}"
+        ) from error
+
+    return new_value
+
+
+def standard_acl_lines(value: dict, nos: str) -> List[str]:
+    """Validate a whole standard acl, and get its config lines with every subnet normalized for the network operating
+    system in one call, so the loop over the sequences is not run by Jinja
+
+    :type value: Dict
+    :param value: The standard acl Example: {"name": "MGMT", "sequences": [{"sequence": 10, "action": "permit",
+                  "source": "192.168.1.0/24"}]}
+    :type nos: String
+    :param nos: The network operating system to normalize for
+
+    :rtype: List[str]
+    :returns: The config lines Example: ["ip access-list standard MGMT", " 10 permit 192.168.1.0 0.0.0.255"]
+
+    :raises AnsibleUndefinedVariable: If jinja2 undefined variable
+    :raises AnsibleFilterError: If any other exceptions occur, with every error of the acl
+    """
+    try:
+        errors = standard_acl_errors(value)
+
+        if errors:
+            raise ValueError(f"{len(errors)} standard acl errors: {'; '.join(errors)}")
+
+        new_value = standard_acl_config_lines(acl=value, ansible_network_os=nos)
+
+    except jinja2.exceptions.UndefinedError as error:  # pragma: no cover
+        raise AnsibleUndefinedVariable(f"jinja2 exception: {to_native(error)}") from error
+
+    except Exception as error:
+        raise AnsibleFilterError(
+            f"exception: {inspect.currentframe().f_code.co_name} error: {to_native(error)}"
+        ) from error
+
+    return new_value
+
+
 class FilterModule:  # pylint: disable=too-few-public-methods
     """Class required by Ansible to load filters"""
 
     def filters(self) -> Dict[str, Callable]:
         """Method to return a KV pair of the filter
 
+        The filters are pure, so when the FILTER_MEMO setting is true each is wrapped in a bounded cache of its results
+        and errors. Each call of a filter is traced as a span when the TRACE_PATH setting is set, otherwise the filters
+        are returned as they are
+
         :rtype: Dict[str, Callable]
         :returns: The dictionary of keys to callables
         """
-        return {
+        filters = {
             "ipv4_host": ipv4_host,
             "ipv4_subnet": ipv4_subnet,
             "standard_acl_ipv4_subnet_normalizer": standard_acl_ipv4_subnet_normalizer,
@@ -544,4 +814,25 @@ class FilterModule:  # pylint: disable=too-few-public-methods
             "permit_deny": permit_deny,
             "le_ge": le_ge,
             "cidr_range": cidr_range,
+            "ipv4_subnet_list": ipv4_subnet_list,
+            "standard_acl_ipv4_subnet_normalizer_list": standard_acl_ipv4_subnet_normalizer_list,
+            "protocol_list": protocol_list,
+            "port_or_ports_list": port_or_ports_list,
+            "standard_acl_lines": standard_acl_lines,
+        }
+
+        filter_memo = get_filter_memo()
+        if filter_memo is not None:
+            filters = {
+                filter_name: filter_memo.wrap(filter_name=filter_name, function=filter_function)
+                for filter_name, filter_function in filters.items()
+            }
+
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return filters
+
+        return {
+            filter_name: tracer.traced(f"filter.{filter_name}")(filter_function)
+            for filter_name, filter_function in filters.items()
         }
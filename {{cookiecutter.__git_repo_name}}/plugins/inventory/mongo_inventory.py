@@ -9,12 +9,20 @@ from pymongo import MongoClient
 from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.mongo.mongo_client import (
     MongoAnsibleClient,
 )
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.tracing.tracer import (
+    DISABLED_TRACER,
+    Tracer,
+    get_tracer,
+)
 
 
 class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
     NAME = "{{ cookiecutter.__git_repo_name }}.mongo_inventory"
 
+    # The tracer of the TRACE_PATH setting is set by parse, the other methods can be called before it
+    tracer: Tracer = DISABLED_TRACER
+
     def verify_file(self, path: str) -> bool:
         """Verify config file can be found
 
@@ -95,14 +103,15 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         :rtype: None
         :returns: Nothing verifies reachability
         """
-        response = self.mongo_client.get_database().command("ping")
+        with self.tracer.span("mongo_ping"):
+            response = self.mongo_client.get_database().command("ping")
 
         if response.get("ok"):
             if response.get("ok") == 1.0:
-                self.display.v("connection to mongo verified")
+                self.tracer.v(lambda: "connection to mongo verified")
                 return
 
-        self.display.v("connection to mongo failed")
+        self.tracer.v(lambda: "connection to mongo failed")
         raise AnsiblePluginError("could not connect to MongoDB")
 
     def load_all_devices(self) -> None:
@@ -111,15 +120,21 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         :rtype: None
         :returns: Nothing it loads all the inventory
         """
-        for device in self.mongo_client.find_documents(collection="hosts", projection={"_id": False}):
-            name = device.get("name").lower()
-            self.add_host_to_all_group(name=name)
+        with self.tracer.span("mongo_load_all_devices") as span:
+            devices = 0
+
+            for device in self.mongo_client.find_documents(collection="hosts", projection={"_id": False}):
+                name = device.get("name").lower()
+                devices += 1
+                self.add_host_to_all_group(name=name)
 
-            for variable, value in device.get("variables").items():
-                self.set_entity_variable(entity=name, variable=variable.lower(), value=value)
+                for variable, value in device.get("variables").items():
+                    self.set_entity_variable(entity=name, variable=variable.lower(), value=value)
 
-            for group_name in device.get("groups"):
-                self.add_host_to_group(name=name, group_name=group_name.lower())
+                for group_name in device.get("groups"):
+                    self.add_host_to_group(name=name, group_name=group_name.lower())
+
+            span.set("devices", devices)
 
     def load_all_groups(self) -> None:
         """Load all groups
@@ -127,13 +142,19 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         :rtype: None
         :returns: Nothing it loads all the groups in the inventory
         """
-        for group in self.mongo_client.find_documents(collection="groups", projection={"_id": False}):
-            name = group.get("name").lower()
+        with self.tracer.span("mongo_load_all_groups") as span:
+            groups = 0
+
+            for group in self.mongo_client.find_documents(collection="groups", projection={"_id": False}):
+                name = group.get("name").lower()
+                groups += 1
 
-            self.inventory.add_group(name)
+                self.inventory.add_group(name)
 
-            for variable, value in group.get("variables").items():
-                self.set_entity_variable(entity=name, variable=variable.lower(), value=value)
+                for variable, value in group.get("variables").items():
+                    self.set_entity_variable(entity=name, variable=variable.lower(), value=value)
+
+            span.set("groups", groups)
 
     def load_devices_by_data_filter(self, data_filter: dict) -> None:
         """Load devices using a mongo filter
@@ -144,17 +165,23 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         :rtype: None
         :returns: Nothing it loads devices from a Mongo filter
         """
-        for device in self.mongo_client.find_documents(
-            collection="hosts", projection={"_id": False}, data_filter=data_filter
-        ):
-            name = device.get("name").lower()
-            self.add_host_to_all_group(name=name)
+        with self.tracer.span("mongo_load_devices_by_data_filter") as span:
+            devices = 0
+
+            for device in self.mongo_client.find_documents(
+                collection="hosts", projection={"_id": False}, data_filter=data_filter
+            ):
+                name = device.get("name").lower()
+                devices += 1
+                self.add_host_to_all_group(name=name)
+
+                for variable, value in device.get("variables").items():
+                    self.set_entity_variable(entity=name, variable=variable.lower(), value=value)
 
-            for variable, value in device.get("variables").items():
-                self.set_entity_variable(entity=name, variable=variable.lower(), value=value)
+                for group_name in device.get("groups"):
+                    self.add_host_to_group(name=name, group_name=group_name.lower())
 
-            for group_name in device.get("groups"):
-                self.add_host_to_group(name=name, group_name=group_name.lower())
+            span.set("devices", devices)
 
     def load_groups_by_data_filter(self, data_filter: dict) -> None:
         """Load groups using a mongo filter
@@ -165,49 +192,57 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         :rtype: None
         :returns: Nothing it loads groups from a Mongo filter
         """
-        for group in self.mongo_client.find_documents(
-            collection="groups", projection={"_id": False}, data_filter=data_filter
-        ):
-            name = group.get("name").lower()
+        with self.tracer.span("mongo_load_groups_by_data_filter") as span:
+            groups = 0
+
+            for group in self.mongo_client.find_documents(
+                collection="groups", projection={"_id": False}, data_filter=data_filter
+            ):
+                name = group.get("name").lower()
+                groups += 1
+
+                self.inventory.add_group(name)
 
-            self.inventory.add_group(name)
+                for variable, value in group.get("variables").items():
+                    self.set_entity_variable(entity=name, variable=variable.lower(), value=value)
 
-            for variable, value in group.get("variables").items():
-                self.set_entity_variable(entity=name, variable=variable.lower(), value=value)
+            span.set("groups", groups)
 
     def parse(self, inventory, loader, path, cache=True):
         super().parse(inventory, loader, path, cache)
 
-        self.display.v(f"inventory config path: {path}")
+        self.tracer = get_tracer()
+        self.tracer.v(lambda: f"inventory config path: {path}")
 
-        try:
-            config = loader.load_from_file(path)
+        with self.tracer.span("mongo_inventory", path=path):
+            try:
+                config = loader.load_from_file(path)
 
-        except AnsibleParserError as error:
-            raise AnsibleParserError(f"failed to parse {path}: {error}")
+            except AnsibleParserError as error:
+                raise AnsibleParserError(f"failed to parse {path}: {error}")
 
-        self.set_mongo_client(config=config)
+            self.set_mongo_client(config=config)
 
-        self.verify_mongo_reachability()
+            self.verify_mongo_reachability()
 
-        if not config.get("mongo_all_groups") and not config.get("mongo_filter_groups"):
-            raise AnsiblePluginError("either mongo_all_groups or mongo_filter_groups is required")
+            if not config.get("mongo_all_groups") and not config.get("mongo_filter_groups"):
+                raise AnsiblePluginError("either mongo_all_groups or mongo_filter_groups is required")
 
-        if not config.get("mongo_all_devices") and not config.get("mongo_filter_devices"):
-            raise AnsiblePluginError("either mongo_all_devices or mongo_filter_devices is required")
+            if not config.get("mongo_all_devices") and not config.get("mongo_filter_devices"):
+                raise AnsiblePluginError("either mongo_all_devices or mongo_filter_devices is required")
 
-        if config.get("mongo_all_groups") and isinstance(config.get("mongo_all_groups"), bool):
-            if config.get("mongo_all_groups"):
-                self.load_all_groups()
+            if config.get("mongo_all_groups") and isinstance(config.get("mongo_all_groups"), bool):
+                if config.get("mongo_all_groups"):
+                    self.load_all_groups()
 
-        elif config.get("mongo_filter_groups") and isinstance(config.get("mongo_filter_groups"), dict):
-            self.load_groups_by_data_filter(data_filter=config.get("mongo_filter_groups"))
+            elif config.get("mongo_filter_groups") and isinstance(config.get("mongo_filter_groups"), dict):
+                self.load_groups_by_data_filter(data_filter=config.get("mongo_filter_groups"))
 
-        if config.get("mongo_all_devices") and isinstance(config.get("mongo_all_devices"), bool):
-            if config.get("mongo_all_devices"):
-                self.load_all_devices()
+            if config.get("mongo_all_devices") and isinstance(config.get("mongo_all_devices"), bool):
+                if config.get("mongo_all_devices"):
+                    self.load_all_devices()
 
-        elif config.get("mongo_filter_devices") and isinstance(config.get("mongo_filter_devices"), dict):
-            self.load_devices_by_data_filter(data_filter=config.get("mongo_filter_devices"))
+            elif config.get("mongo_filter_devices") and isinstance(config.get("mongo_filter_devices"), dict):
+                self.load_devices_by_data_filter(data_filter=config.get("mongo_filter_devices"))
 
-        self.mongo_client.close_client()
+            self.mongo_client.close_client()
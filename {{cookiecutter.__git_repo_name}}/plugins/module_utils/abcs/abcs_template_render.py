@@ -5,14 +5,111 @@ NOTES: Had to be a separate file cause modules can not even import from 'ansible
 """
 
 from abc import ABC, abstractmethod
+from collections import ChainMap
+from collections.abc import Mapping
 import os
-from typing import Union, Optional
-from ansible.utils.display import Display
+import time
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Tuple, Union, Optional
+from jinja2.exceptions import TemplateAssertionError, UndefinedError
+from ansible.errors import AnsibleUndefinedVariable
 from ansible.template import Templar
+from ansible.module_utils.common.text.converters import to_text
+
+try:
+    from ansible.template.native_helpers import ansible_concat
+    from ansible.template.vars import AnsibleJ2Vars
+
+except ImportError:  # pragma: no cover
+    ansible_concat = None
+    AnsibleJ2Vars = None
 
 from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.normalizers.ansible_network_os_normalizers import (
     network_os_normalize,
 )
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.bytecode_cache import (
+    get_bytecode_cache,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.native_environment import (
+    NATIVE_COMPILED_TEMPLATE_CACHE,
+    NativeTemplateVariables,
+    get_native_environment,
+    is_trusted_template,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.precompiled_templates import (
+    get_precompiled_templates,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_cache import (
+    RENDER_MODE_NATIVE,
+    RENDER_MODE_TEMPLAR,
+    get_render_cache,
+    render_cache_key,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_pool import (
+    map_shards,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    get_bool_setting,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_stream import (
+    iter_lines,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_timings import (
+    DISABLED_RENDER_TIMINGS,
+    RenderTimings,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.template_cache import (
+    COMPILED_TEMPLATE_CACHE,
+    CompiledTemplate,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.template_locator import (
+    find_templates_directory,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.template_index import (
+    get_template_index,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.tracing.tracer import (
+    get_tracer,
+)
+
+
+# The Templar attributes Templar.do_template renders a compiled template with, they are private to ansible-core
+TEMPLAR_INTERNALS = ("environment", "available_variables", "cur_context")
+
+
+def templar_internals_supported(templar: Templar) -> bool:
+    """Function to check if the ansible-core internals the compiled templates are rendered with are there
+
+    Compiled templates are rendered the way Templar.do_template renders a template, with AnsibleJ2Vars, ansible_concat,
+    and the Templar cur_context. They are private to ansible-core, so if any of them is gone every template is
+    rendered with the public Templar.template instead
+
+    :type templar: ansible.template.Templar
+    :param templar: The templar to render with
+
+    :rtype: Boolean
+    :returns: If the compiled templates can be rendered with the Templar internals
+    """
+    return (
+        ansible_concat is not None
+        and AnsibleJ2Vars is not None
+        and all(hasattr(templar, attribute) for attribute in TEMPLAR_INTERNALS)
+    )
+
+
+class TemplateVariablesError(ValueError):
+    """Class for the errors of template variables that are not valid, each error is kept with its path
+
+    :type errors: List[str]
+    :param errors: The errors Example: ["sequences[0].source: 10.0.0.1/8 is not a valid ipv4 subnet"]
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    def __init__(self, errors: List[str]) -> None:
+        super().__init__(f"{len(errors)} template variables errors: {'; '.join(errors)}")
+        self.errors = errors
 
 
 class RenderConfigFromTemplate(ABC):
@@ -20,10 +117,15 @@ class RenderConfigFromTemplate(ABC):
 
     :type templar: ansible.template.Templar
     :param templar: The passed in templar fro the action
-    :type template_variables: Dict
-    :param template_variables: The variables to fill the template with
+    :type template_variables: Optional[dict]
+    :param template_variables: The variables to fill the template with, can be None when using render_many
     :type ansible_network_os: String
     :param ansible_network_os: The ansible network os
+    :type native_environment: Optional[bool] = None
+    :param native_environment: Render the collection templates with a plain Jinja2 environment instead of the
+                               Templar, defaults to the NATIVE_ENVIRONMENT setting
+    :type timings: Optional[RenderTimings] = None
+    :param timings: The timings to record the time spent in each render stage in, nothing is recorded if None
 
     :rtype: None
     :returns: Nothing
@@ -31,19 +133,103 @@ class RenderConfigFromTemplate(ABC):
     :raises TypeError: If templar, or template_variables is not of the right type
     """
 
-    def __init__(self, templar: Templar, template_variables: dict, ansible_network_os: str) -> None:
+    def __init__(
+        self,
+        templar: Templar,
+        template_variables: Optional[dict],
+        ansible_network_os: str,
+        native_environment: Optional[bool] = None,
+        timings: Optional[RenderTimings] = None,
+    ) -> None:
         if not isinstance(templar, Templar):
             raise TypeError(f"'templar' must be of type Templar but received a {type(templar)}")
 
-        if not isinstance(template_variables, dict):
-            raise TypeError(f"'template_variables' must be of type dict but received a {type(template_variables)}")
-
         self._templar = templar
         self._ansible_network_os = network_os_normalize(ansible_network_os)
-        template_variables["ansible_network_os"] = network_os_normalize(ansible_network_os)
-        self.validate_module_params(template_variables=template_variables)
-        self._template_variables = template_variables
-        self._display = Display()
+        self._tracer = get_tracer()
+        self._timings = DISABLED_RENDER_TIMINGS if timings is None else timings
+
+        if native_environment is None:
+            native_environment = get_bool_setting("NATIVE_ENVIRONMENT")
+
+        self._native_environment = native_environment
+        self._render_cache = get_render_cache()
+        self._render_cache_hits = 0
+        self._render_cache_misses = 0
+
+        if template_variables is None:
+            self._template_variables = None
+
+        else:
+            self._template_variables = self._prepare_template_variables(template_variables=template_variables)
+
+    def _prepare_template_variables(self, template_variables: dict, item: Optional[int] = None) -> Mapping:
+        """Protected Method to layer the renderer variables over the template variables, and validate them
+
+        The template variables are neither copied nor changed, so the same data can be shared by many renders
+
+        :type template_variables: Dict
+        :param template_variables: The variables to fill the template with
+        :type item: Optional[int]
+        :param item: The index of the template variables in a batch render, for the timings
+
+        :rtype: Mapping
+        :returns: A read only view of the renderer variables over the template variables
+
+        :raises TypeError: If template_variables is not a dict
+        """
+        if not isinstance(template_variables, Mapping):
+            raise TypeError(f"'template_variables' must be of type dict but received a {type(template_variables)}")
+
+        template_variables = MappingProxyType(
+            ChainMap({"ansible_network_os": self._ansible_network_os}, template_variables)
+        )
+        with self._timings.stage("validate", item=item):
+            self.validate_module_params(template_variables=template_variables)
+
+        return template_variables
+
+    def _get_compiled_template(self, template_path: str) -> CompiledTemplate:
+        """Get the compiled template of a template path
+
+        The template is compiled once per worker process, and its code is shared with every renderer through the
+        COMPILED_TEMPLATE_CACHE, each Templar environment renders its own template made from the code. Templates
+        compiled ahead of time with 'make compile-templates' are loaded when their source checksum matches. If the
+        BYTECODE_CACHE_PATH setting is set the compiled code is also kept on disk.
+
+        With native_environment templates inside the collection templates directory are compiled for the plain Jinja2
+        environment instead, falling back to the Templar environment if they use a filter or test it does not have.
+
+        :type template_path: String
+        :param template_path: The path to the template
+
+        :rtype: CompiledTemplate
+        :returns: The compiled template
+        """
+        templates_directory = self._find_templates_directory()
+
+        if self._native_environment and is_trusted_template(
+            template_path=template_path, templates_directory=templates_directory
+        ):
+            try:
+                return NATIVE_COMPILED_TEMPLATE_CACHE.get_template(
+                    template_path=template_path,
+                    environment=get_native_environment(),
+                    bytecode_cache=get_bytecode_cache(),
+                    timings=self._timings,
+                )
+
+            except TemplateAssertionError as error:
+                # The template uses a filter or test only the Templar has, like the ansible.builtin ones
+                self._tracer.v(lambda: f"NATIVE ENVIRONMENT FALLBACK: {template_path} {error}")
+
+        return COMPILED_TEMPLATE_CACHE.get_template(
+            template_path=template_path,
+            environment=self._templar.environment,
+            bytecode_cache=get_bytecode_cache(),
+            precompiled_templates=get_precompiled_templates(templates_directory=templates_directory),
+            timings=self._timings,
+        )
 
     def _render_template(self, template_path: str) -> str:
         """Render a Jinja2 Template
@@ -54,64 +240,297 @@ class RenderConfigFromTemplate(ABC):
         :rtype: String
         :returns: The rendered template
 
-        :raises TypeError: If templar is not a Templar
+        :raises TypeError: If the renderer was created without template_variables
+        :raises AnsibleUndefinedVariable: If the template uses an undefined variable
         """
-        with open(template_path, "r") as template_file:
-            template_data = template_file.read()
+        if self._template_variables is None:
+            raise TypeError("'template_variables' is required to render a single template, or use render_many")
 
-            self._templar.available_variables = self._template_variables
+        compiled_template = self._get_compiled_template(template_path=template_path)
 
-            rendered = self._templar.template(
-                variable=template_data,
-                preserve_trailing_newlines=True,
-                escape_backslashes=False,
-                fail_on_undefined=True,
+        with self._timings.stage("render"):
+            return self._render_compiled_template(
+                compiled_template=compiled_template, template_variables=self._template_variables
             )
 
+    def _uses_native_environment(self, compiled_template: CompiledTemplate) -> bool:
+        """Protected Method to check if a compiled template is rendered with the native environment
+
+        :type compiled_template: CompiledTemplate
+        :param compiled_template: The compiled template to render
+
+        :rtype: Boolean
+        :returns: If it is rendered with the native environment, otherwise it is rendered with the Templar
+        """
+        return (
+            self._native_environment
+            and compiled_template.template is not None
+            and compiled_template.template.environment is get_native_environment()
+        )
+
+    def _uses_templar_template(self, compiled_template: CompiledTemplate) -> bool:
+        """Protected Method to check if a compiled template is rendered with the public Templar.template
+
+        :type compiled_template: CompiledTemplate
+        :param compiled_template: The compiled template to render
+
+        :rtype: Boolean
+        :returns: If the template has a #jinja2: override header, or the Templar internals are not supported
+        """
+        return compiled_template.template is None or not templar_internals_supported(self._templar)
+
+    def _templar_template(self, compiled_template: CompiledTemplate, template_variables: Mapping) -> str:
+        """Protected Method to render a template source with the public Templar.template, like before the cache
+
+        :type compiled_template: CompiledTemplate
+        :param compiled_template: The compiled template to render, its source is read again if it was compiled
+        :type template_variables: Mapping
+        :param template_variables: The variables to fill the template with
+
+        :rtype: String
+        :returns: The rendered template
+
+        :raises AnsibleUndefinedVariable: If the template uses an undefined variable
+        """
+        source = compiled_template.override_source
+
+        if source is None:
+            with open(compiled_template.template_path, "r") as template_file:
+                source = template_file.read()
+
+        self._templar.available_variables = template_variables
+
+        return self._templar.template(
+            variable=source,
+            preserve_trailing_newlines=True,
+            escape_backslashes=False,
+            fail_on_undefined=True,
+        )
+
+    def _generate_compiled_template(
+        self, compiled_template: CompiledTemplate, template_variables: Mapping
+    ) -> Iterator[str]:
+        """Generate the chunks of a compiled template with the same variable handling as Templar.template
+
+        :type compiled_template: CompiledTemplate
+        :param compiled_template: The compiled template to render
+        :type template_variables: Mapping
+        :param template_variables: The variables to fill the template with
+
+        :rtype: Iterator[str]
+        :returns: The rendered chunks, as Jinja2 generates them
+
+        :raises AnsibleUndefinedVariable: If the template uses an undefined variable
+        """
+        if self._uses_templar_template(compiled_template):
+            yield self._templar_template(compiled_template=compiled_template, template_variables=template_variables)
+            return
+
+        template = compiled_template.template
+
+        if self._uses_native_environment(compiled_template):
+            # Variables with template syntax in them are templated with the Templar, so it needs the variables
+            self._templar.available_variables = template_variables
+
+            try:
+                yield from template.root_render_func(
+                    template.new_context(
+                        NativeTemplateVariables(
+                            templar=self._templar,
+                            template_variables=template_variables,
+                            template_globals=template.globals,
+                        ),
+                        shared=True,
+                    )
+                )
+
+            except UndefinedError as error:
+                raise AnsibleUndefinedVariable(error) from error
+
+            return
+
+        # The template is bound to the environment of this Templar, so lookup and query use this Templar
+        template = compiled_template.bind(self._templar.environment)
+        self._templar.available_variables = template_variables
+
+        context = template.new_context(AnsibleJ2Vars(self._templar, template.globals), shared=True)
+
+        # Lookups flag unsafe results on the templar context, so it is swapped like Templar.do_template does
+        cached_context = self._templar.cur_context
+        self._templar.cur_context = context
+
+        try:
+            yield from template.root_render_func(context)
+
+        except UndefinedError as error:
+            raise AnsibleUndefinedVariable(error) from error
+
+        finally:
+            self._templar.cur_context = cached_context
+
+    def _get_cached_render(
+        self, compiled_template: CompiledTemplate, template_variables: Mapping
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Protected Method to look up a render in the render cache set by the RENDER_CACHE_PATH setting
+
+        :type compiled_template: CompiledTemplate
+        :param compiled_template: The compiled template to render
+        :type template_variables: Mapping
+        :param template_variables: The variables to fill the template with
+
+        :rtype: Tuple[Optional[str], Optional[str]]
+        :returns: The cache key to store the render with, and the cached render, the key is None if it can not be cached
+        """
+        if self._render_cache is None:
+            return None, None
+
+        cache_key = render_cache_key(
+            source_checksum=compiled_template.source_checksum,
+            template_variables=template_variables,
+            ansible_network_os=self._ansible_network_os,
+            render_mode=RENDER_MODE_NATIVE if self._uses_native_environment(compiled_template) else RENDER_MODE_TEMPLAR,
+        )
+        rendered = None if cache_key is None else self._render_cache.get(key=cache_key)
+
+        if rendered is None:
+            self._render_cache_misses += 1
+
+        else:
+            self._render_cache_hits += 1
+
+        return cache_key, rendered
+
+    @staticmethod
+    def _pad_trailing_newlines(compiled_template: CompiledTemplate, rendered: str) -> str:
+        """Protected Static Method to add the trailing newlines of the template source Jinja2 leaves off
+
+        :type compiled_template: CompiledTemplate
+        :param compiled_template: The compiled template that was rendered
+        :type rendered: String
+        :param rendered: The rendered template
+
+        :rtype: String
+        :returns: The rendered template with the trailing newlines
+        """
+        rendered_newlines = len(rendered) - len(rendered.rstrip("\n"))
+        if compiled_template.trailing_newlines > rendered_newlines:
+            rendered += "\n" * (compiled_template.trailing_newlines - rendered_newlines)
+
         return rendered
 
-    def _find_templates_directory(self) -> Union[str, None]:
-        """Tries to find the path to this collection templates directory
+    def _render_compiled_template(self, compiled_template: CompiledTemplate, template_variables: Mapping) -> str:
+        """Render a compiled template with the same variable handling as Templar.template
 
-        :rtype: Union[str, None]
-        :returns: A found path, or None
+        If the render cache is enabled a cached render is returned without rendering
+
+        :type compiled_template: CompiledTemplate
+        :param compiled_template: The compiled template to render
+        :type template_variables: Mapping
+        :param template_variables: The variables to fill the template with
+
+        :rtype: String
+        :returns: The rendered template
+
+        :raises AnsibleUndefinedVariable: If the template uses an undefined variable
         """
-        namespace = "btr1975"
-        collection = "render"
+        cache_key, rendered = self._get_cached_render(
+            compiled_template=compiled_template, template_variables=template_variables
+        )
+        if rendered is not None:
+            return rendered
 
-        possible_paths = []
+        if self._uses_templar_template(compiled_template):
+            rendered = self._templar_template(compiled_template=compiled_template, template_variables=template_variables)
 
-        #  SEE: https://docs.ansible.com/ansible/latest/reference_appendices/config.html#collections-paths
-        if os.getenv("ANSIBLE_COLLECTIONS_PATH"):
-            ansible_collections_paths = os.getenv("ANSIBLE_COLLECTIONS_PATH").split(":")
+        else:
+            chunks = self._generate_compiled_template(
+                compiled_template=compiled_template, template_variables=template_variables
+            )
 
-            if isinstance(ansible_collections_paths, list):
-                possible_paths.extend(ansible_collections_paths)
+            # The native environment only generates plain text, so there is nothing unsafe for ansible_concat to find
+            if self._uses_native_environment(compiled_template):
+                rendered = "".join(chunks)
 
             else:
-                possible_paths.append(ansible_collections_paths)
+                rendered = ansible_concat(chunks)
 
-        else:
-            possible_paths.append("/usr/share/ansible/collections")
+        rendered = self._pad_trailing_newlines(compiled_template=compiled_template, rendered=rendered)
 
-        additional_paths = [
-            "/usr/local/share/ansible/collections",
-            "/etc/ansible/collections",
-            os.path.join(os.path.expanduser("~"), ".ansible", "collections"),
-            os.path.join(os.path.abspath("."), "collections"),
-        ]
+        if cache_key is not None:
+            self._render_cache.set(key=cache_key, rendered=rendered)
 
-        possible_paths.extend(additional_paths)
+        return rendered
+
+    def _stream_compiled_template(
+        self, compiled_template: CompiledTemplate, template_variables: Mapping, item: Optional[int] = None
+    ) -> Iterator[str]:
+        """Render a compiled template line by line
+
+        If the render cache is enabled a cached render is split into lines without rendering. A miss is not stored,
+        keeping the chunks to store would hold the whole render in memory, which streaming is meant to avoid. Only the
+        time spent generating the chunks is timed as the render stage, not the time the caller spends on each line
+
+        :type compiled_template: CompiledTemplate
+        :param compiled_template: The compiled template to render
+        :type template_variables: Mapping
+        :param template_variables: The variables to fill the template with
+        :type item: Optional[int]
+        :param item: The index of the template variables in a batch render, for the timings
+
+        :rtype: Iterator[str]
+        :returns: The rendered lines without line endings
+
+        :raises AnsibleUndefinedVariable: If the template uses an undefined variable
+        """
+        with self._timings.stage("render", item=item):
+            _, rendered = self._get_cached_render(
+                compiled_template=compiled_template, template_variables=template_variables
+            )
+
+        if rendered is not None:
+            yield from rendered.splitlines()
+            return
+
+        chunks = self._timings.timed_iter(
+            "render",
+            (
+                to_text(chunk)
+                for chunk in self._generate_compiled_template(
+                    compiled_template=compiled_template, template_variables=template_variables
+                )
+            ),
+            item=item,
+        )
+
+        yield from iter_lines(chunks=chunks, trailing_newlines=compiled_template.trailing_newlines)
+
+    def render_cache_stats(self) -> Optional[Dict[str, Union[int, float]]]:
+        """Get the render cache hits, misses, and hit rate of this renderer
+
+        :rtype: Optional[Dict[str, Union[int, float]]]
+        :returns: The hits, misses, and hit rate, or None if the render cache is disabled
+        """
+        if self._render_cache is None:
+            return None
+
+        lookups = self._render_cache_hits + self._render_cache_misses
 
-        for base_path in possible_paths:
-            templates_dir = os.path.join(base_path, "ansible_collections", namespace, collection, "templates")
-            self._display.v(f"CHECK: templates_dir {templates_dir}")
-            if os.path.isdir(templates_dir):
-                self._display.v(f"FOUND: templates_dir {templates_dir}")
-                return templates_dir
+        return {
+            "hits": self._render_cache_hits,
+            "misses": self._render_cache_misses,
+            "hit_rate": round(self._render_cache_hits / lookups, 4) if lookups else 0.0,
+        }
 
-        self._display.v(f"NOT FOUND: templates_dir {None}")
-        return None
+    def _find_templates_directory(self) -> Union[str, None]:
+        """Tries to find the path to this collection templates directory
+
+        The lookup is done once per process, see template_locator.find_templates_directory
+
+        :rtype: Union[str, None]
+        :returns: A found path, or None
+        """
+        with self._timings.stage("find_directory"):
+            return find_templates_directory()
 
     def _find_template(
         self,
@@ -121,7 +540,7 @@ class RenderConfigFromTemplate(ABC):
         family: Optional[str] = None,
         model: Optional[str] = None,
     ) -> Union[str, None]:
-        """Tries to find the path to this collection templates
+        """Tries to find the path to this collection templates, using the shared index of the templates directory
 
         :type src: Optional[str]
         :param src: If src is given no lookups are done, and it is assumed it is an exact path to a template
@@ -138,34 +557,40 @@ class RenderConfigFromTemplate(ABC):
         :returns: A found path, or None
         """
         if src:
-            self._display.v(f"'src' used {src}")
-            template_relative_paths = [src]
+            with self._timings.stage("find_template"):
+                self._tracer.v(lambda: f"'src' used {src}")
+                if os.path.isfile(src):
+                    self._tracer.v(lambda: f"FOUND: templates_path {src}")
+                    return src
+
+                self._tracer.v(lambda: f"NOT FOUND: templates_path {None}")
+                return None
+
+        templates_directory = self._find_templates_directory()
+        if not templates_directory or not template_name:
+            self._tracer.v(lambda: f"NOT FOUND: templates_path {None}")
+            return None
+
+        with self._timings.stage("find_template"):
+            templates_path = get_template_index(templates_directory=templates_directory).resolve(
+                network_os=self._ansible_network_os,
+                template_name=template_name,
+                solution=solution,
+                family=family,
+                model=model,
+            )
 
-        else:
-            templates_directory = self._find_templates_directory()
-
-            template_relative_paths = [
-                f"{templates_directory}/{self._ansible_network_os}/{solution}/{family}/{model}/{template_name}",
-                f"{templates_directory}/{self._ansible_network_os}/{solution}/{family}/main/{template_name}",
-                f"{templates_directory}/{self._ansible_network_os}/{solution}/main/{template_name}",
-                f"{templates_directory}/{self._ansible_network_os}/{family}/{model}/{template_name}",
-                f"{templates_directory}/{self._ansible_network_os}/{family}/main/{template_name}",
-                f"{templates_directory}/{self._ansible_network_os}/main/{template_name}",
-            ]
-
-        for templates_path in template_relative_paths:
-            self._display.v(f"CHECK: templates_path {templates_path}")
-            if os.path.isfile(templates_path):
-                self._display.v(f"FOUND: templates_path {templates_path}")
-                return templates_path
-
-        self._display.v(f"NOT FOUND: templates_path {None}")
-        return None
+        self._tracer.v(lambda: f"{'FOUND' if templates_path else 'NOT FOUND'}: templates_path {templates_path}")
+        return templates_path
 
     @staticmethod
     @abstractmethod
-    def validate_module_params(template_variables: dict) -> None:
-        """Static Method to validate the template variable data as you see fit"""
+    def validate_module_params(template_variables: Mapping) -> None:
+        """Static Method to validate the template variable data as you see fit, the data is read only
+
+        Raise TemplateVariablesError with every error found, in a batch render the errors of all the renders are
+        raised together before anything is rendered
+        """
 
     def render_config(
         self,
@@ -191,6 +616,230 @@ class RenderConfigFromTemplate(ABC):
         :rtype: String
         :returns: The rendered config
         """
+        with self._tracer.span("render_config", network_os=self._ansible_network_os, template_name=template_name):
+            found_template = self._find_template(
+                src=src,
+                template_name=template_name,
+                solution=solution,
+                family=family,
+                model=model,
+            )
+            if not found_template:
+                raise FileNotFoundError(f"could not locate template_name: '{template_name}' or src: '{src}'!")
+
+            rendered_template = self._render_template(template_path=found_template)
+
+        return rendered_template
+
+    def render_many(
+        self,
+        template_variables_list: List[dict],
+        src: Optional[str] = None,
+        template_name: Optional[str] = None,
+        solution: Optional[str] = None,
+        family: Optional[str] = None,
+        model: Optional[str] = None,
+        processes: int = 1,
+    ) -> List[str]:
+        """Render config from a template for many sets of variables, the template is found and compiled once
+
+        With more than one process the renders are sharded across a pool of forked processes, they are forked after
+        the template is compiled so they start with warm template caches, and the output is the same as one process
+
+        :type template_variables_list: List[dict]
+        :param template_variables_list: The variables to fill the template with, one dict per render
+        :type src: Optional[str]
+        :param src: If src is given no lookups are done, and it is assumed it is an exact path to a template
+        :type template_name: Optional[str]
+        :param template_name: The name of the template
+        :type solution: Optional[str]
+        :param solution: A specific solution of config
+        :type family: Optional[str]
+        :param family: A specific family of hardware, like Cat9K, or something
+        :type model: Optional[str]
+        :param model: The hardware model, like WS-C3560G-48TS-E or something
+        :type processes: Integer
+        :param processes: The number of processes to render in
+
+        :rtype: List[str]
+        :returns: The rendered configs in the same order as template_variables_list
+
+        :raises TypeError: If template_variables_list is not a list of dicts
+        :raises FileNotFoundError: If the template can not be found
+        :raises ValueError: If processes is less than 1
+        """
+        with self._tracer.span(
+            "render_many", network_os=self._ansible_network_os, template_name=template_name, processes=processes
+        ) as span:
+            compiled_template, prepared_template_variables_list = self._find_compiled_template(
+                template_variables_list=template_variables_list,
+                src=src,
+                template_name=template_name,
+                solution=solution,
+                family=family,
+                model=model,
+            )
+
+            def render_shard(start: int, stop: int) -> Tuple[List[Tuple[str, float]], int, int]:
+                return self._render_shard(
+                    compiled_template=compiled_template,
+                    template_variables_list=prepared_template_variables_list,
+                    start=start,
+                    stop=stop,
+                )
+
+            rendered = []
+            item = 0
+            for shard_renders, render_cache_hits, render_cache_misses in map_shards(
+                shard_function=render_shard, item_count=len(prepared_template_variables_list), processes=processes
+            ):
+                for rendered_template, seconds in shard_renders:
+                    self._timings.add("render", seconds=seconds, item=item)
+                    rendered.append(rendered_template)
+                    item += 1
+
+                if processes > 1:
+                    # The shard was rendered in a forked process, so its render cache counts were not kept
+                    self._render_cache_hits += render_cache_hits
+                    self._render_cache_misses += render_cache_misses
+
+            span.set("renders", len(rendered))
+
+        return rendered
+
+    def _render_shard(
+        self, compiled_template: CompiledTemplate, template_variables_list: List[Mapping], start: int, stop: int
+    ) -> Tuple[List[Tuple[str, float]], int, int]:
+        """Protected Method to render a shard of a batch render, it may run in a forked process
+
+        :type compiled_template: CompiledTemplate
+        :param compiled_template: The compiled template to render
+        :type template_variables_list: List[Mapping]
+        :param template_variables_list: The prepared variables of the whole batch
+        :type start: Integer
+        :param start: The index of the first render of the shard
+        :type stop: Integer
+        :param stop: The index after the last render of the shard
+
+        :rtype: Tuple[List[Tuple[str, float]], int, int]
+        :returns: The rendered configs with the seconds each took, and the render cache hits and misses of the shard
+        """
+        render_cache_hits = self._render_cache_hits
+        render_cache_misses = self._render_cache_misses
+        shard_renders = []
+
+        for template_variables in template_variables_list[start:stop]:
+            render_start = time.monotonic()
+            rendered_template = self._render_compiled_template(
+                compiled_template=compiled_template, template_variables=template_variables
+            )
+            shard_renders.append((rendered_template, time.monotonic() - render_start))
+
+        return (
+            shard_renders,
+            self._render_cache_hits - render_cache_hits,
+            self._render_cache_misses - render_cache_misses,
+        )
+
+    def stream_lines(
+        self,
+        template_variables_list: List[dict],
+        src: Optional[str] = None,
+        template_name: Optional[str] = None,
+        solution: Optional[str] = None,
+        family: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Render config from a template for many sets of variables, yielding lines as Jinja2 produces them
+
+        The whole rendered config is never held in memory, unless it is kept for the render cache, the lines are the
+        same as render_many followed by splitlines() on each rendered config
+
+        :type template_variables_list: List[dict]
+        :param template_variables_list: The variables to fill the template with, one dict per render
+        :type src: Optional[str]
+        :param src: If src is given no lookups are done, and it is assumed it is an exact path to a template
+        :type template_name: Optional[str]
+        :param template_name: The name of the template
+        :type solution: Optional[str]
+        :param solution: A specific solution of config
+        :type family: Optional[str]
+        :param family: A specific family of hardware, like Cat9K, or something
+        :type model: Optional[str]
+        :param model: The hardware model, like WS-C3560G-48TS-E or something
+
+        :rtype: Iterator[str]
+        :returns: The rendered lines without line endings
+
+        :raises TypeError: If template_variables_list is not a list of dicts
+        :raises FileNotFoundError: If the template can not be found
+        """
+        compiled_template, prepared_template_variables_list = self._find_compiled_template(
+            template_variables_list=template_variables_list,
+            src=src,
+            template_name=template_name,
+            solution=solution,
+            family=family,
+            model=model,
+        )
+
+        for item, template_variables in enumerate(prepared_template_variables_list):
+            yield from self._stream_compiled_template(
+                compiled_template=compiled_template, template_variables=template_variables, item=item
+            )
+
+    def _find_compiled_template(
+        self,
+        template_variables_list: List[dict],
+        src: Optional[str] = None,
+        template_name: Optional[str] = None,
+        solution: Optional[str] = None,
+        family: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Tuple[CompiledTemplate, List[Mapping]]:
+        """Protected Method to prepare the variables of a batch render, and find and compile its template once
+
+        :type template_variables_list: List[dict]
+        :param template_variables_list: The variables to fill the template with, one dict per render
+        :type src: Optional[str]
+        :param src: If src is given no lookups are done, and it is assumed it is an exact path to a template
+        :type template_name: Optional[str]
+        :param template_name: The name of the template
+        :type solution: Optional[str]
+        :param solution: A specific solution of config
+        :type family: Optional[str]
+        :param family: A specific family of hardware, like Cat9K, or something
+        :type model: Optional[str]
+        :param model: The hardware model, like WS-C3560G-48TS-E or something
+
+        :rtype: Tuple[CompiledTemplate, List[Mapping]]
+        :returns: The compiled template, and the prepared template variables
+
+        :raises TypeError: If template_variables_list is not a list of dicts
+        :raises TemplateVariablesError: If validate_module_params finds errors, with the errors of every render
+        :raises FileNotFoundError: If the template can not be found
+        """
+        if not isinstance(template_variables_list, list):
+            raise TypeError(
+                f"'template_variables_list' must be of type list but received a {type(template_variables_list)}"
+            )
+
+        prepared_template_variables_list = []
+        errors = []
+
+        # Every set of variables is validated before rendering, so all the errors of the batch are raised together
+        for item, template_variables in enumerate(template_variables_list):
+            try:
+                prepared_template_variables_list.append(
+                    self._prepare_template_variables(template_variables=template_variables, item=item)
+                )
+
+            except TemplateVariablesError as error:
+                errors.extend(f"[{item}].{item_error}" for item_error in error.errors)
+
+        if errors:
+            raise TemplateVariablesError(errors=errors)
+
         found_template = self._find_template(
             src=src,
             template_name=template_name,
@@ -201,6 +850,4 @@ class RenderConfigFromTemplate(ABC):
         if not found_template:
             raise FileNotFoundError(f"could not locate template_name: '{template_name}' or src: '{src}'!")
 
-        rendered_template = self._render_template(template_path=found_template)
-
-        return rendered_template
+        return self._get_compiled_template(template_path=found_template), prepared_template_variables_list
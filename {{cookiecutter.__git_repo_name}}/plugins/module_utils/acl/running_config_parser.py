@@ -0,0 +1,258 @@
+"""
+Parser of the standard ACLs in a running config, to compare the ACLs on a device with the standard_acls data
+
+The running config is read one line at a time in a single pass, so a large config is never split into a list
+"""
+
+import io
+from collections.abc import Iterable
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.acl.standard_acl_validation import (
+    STANDARD_ACL_OPTIONS,
+    running_config_acls_errors,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.normalizers.ansible_network_os_normalizers import (
+    network_os_normalize,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.normalizers.conversion_normalizers import (
+    INVERSE_MASK_PREFIX_LENGTHS,
+)
+
+# The ACL header, and the protocol between the action and the source, of each network OS. The nxos protocol is
+# optional, as the collection standard_acl.j2 template leaves it out
+RUNNING_CONFIG_ACL_SYNTAX: Dict[str, Dict[str, Union[str, bool, None]]] = {
+    "ios": {"acl": "ip access-list standard ", "protocol": None, "destination": False},
+    "iosxr": {"acl": "ipv4 access-list ", "protocol": "ipv4", "destination": True},
+    "nxos": {"acl": "ip access-list ", "protocol": "ip", "destination": True},
+    "eos": {"acl": "ip access-list standard ", "protocol": None, "destination": False},
+}
+
+# The sequence number the network OS gives an entry without one, after the sequence number of the entry before it
+SEQUENCE_INCREMENT = 10
+
+
+class RunningConfigError(ValueError):
+    """Class for the errors of the ACLs parsed from a running config that are not valid, each error is kept with its
+    path
+
+    :type errors: List[str]
+    :param errors: The errors Example: ["running_config[MGMT].sequences[0].source: 10.0.0.1/8 has host bits set"]
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    def __init__(self, errors: List[str]) -> None:
+        super().__init__(f"{len(errors)} running_config errors: {'; '.join(errors)}")
+        self.errors = errors
+
+
+def _iter_lines(running_config: Union[str, Iterable]) -> Iterator[str]:
+    """Protected function to iterate over the lines of a running config without splitting it into a list
+
+    :type running_config: Union[str, Iterable]
+    :param running_config: The running config text, a file opened in text mode, or the lines
+
+    :rtype: Iterator[str]
+    :returns: The lines
+
+    :raises TypeError: If running_config is not a string or an iterable
+    """
+    if isinstance(running_config, str):
+        return iter(io.StringIO(running_config))
+
+    if not isinstance(running_config, Iterable):
+        raise TypeError(f"'running_config' must be of type str or an iterable but received a {type(running_config)}")
+
+    return iter(running_config)
+
+
+def _parse_source(tokens: List[str], index: int) -> Tuple[Optional[str], int]:
+    """Protected function to parse the source of an entry back to CIDR notation
+
+    :type tokens: List[str]
+    :param tokens: The tokens of the entry
+    :type index: Integer
+    :param index: The index of the first source token
+
+    :rtype: Tuple[Optional[str], int]
+    :returns: The source Example: 192.168.1.0/24, or any, and the index after it, the source is None if it could
+              not be parsed
+    """
+    if index >= len(tokens):
+        return None, index
+
+    token = tokens[index]
+
+    if token == "any":
+        return "any", index + 1
+
+    if token == "host":
+        if index + 1 >= len(tokens):
+            return None, index
+
+        return f"{tokens[index + 1]}/32", index + 2
+
+    if not token[:1].isdigit():
+        return None, index
+
+    if "/" in token:
+        return token, index + 1
+
+    if index + 1 < len(tokens) and tokens[index + 1] in INVERSE_MASK_PREFIX_LENGTHS:
+        return f"{token}/{INVERSE_MASK_PREFIX_LENGTHS[tokens[index + 1]]}", index + 2
+
+    return f"{token}/32", index + 1
+
+
+def _parse_entry(line: str, previous_sequence: int, syntax: Dict) -> Optional[dict]:
+    """Protected function to parse an ACL entry line into the standard_acls sequence model
+
+    An entry that the model can not express, like one with ports, is returned with the line after the sequence
+    number, so it never matches an intended entry
+
+    :type line: String
+    :param line: The entry line Example: 10 permit 192.168.1.0 0.0.0.255 log
+    :type previous_sequence: Integer
+    :param previous_sequence: The sequence number of the entry before it, for entries without one
+    :type syntax: Dict
+    :param syntax: The syntax of the network OS from RUNNING_CONFIG_ACL_SYNTAX
+
+    :rtype: Optional[dict]
+    :returns: The entry Example: {"sequence": 10, "action": "permit", "source": "192.168.1.0/24",
+              "append_option_to_end": " log"}, or None if the line is not an entry, like statistics per-entry
+    """
+    tokens = line.split()
+
+    if tokens[0].isdigit():
+        sequence = int(tokens[0])
+        index = 1
+
+    else:
+        sequence = previous_sequence + SEQUENCE_INCREMENT
+        index = 0
+
+    if index >= len(tokens):
+        return None
+
+    action_index = index
+    action = tokens[index]
+
+    if action == "remark":
+        return {"sequence": sequence, "action": "remark", "remark": line.split("remark", 1)[1].strip()}
+
+    if action not in ("permit", "deny"):
+        return None
+
+    index += 1
+
+    if index < len(tokens) and syntax["protocol"] and tokens[index] == syntax["protocol"]:
+        index += 1
+
+    source, index = _parse_source(tokens=tokens, index=index)
+
+    if syntax["destination"]:
+        if index < len(tokens) and tokens[index] == "any":
+            index += 1
+
+        else:
+            source = None
+
+    options = tokens[index:]
+
+    if source is None or not STANDARD_ACL_OPTIONS.issuperset(options):
+        return {"sequence": sequence, "action": action, "line": " ".join(tokens[action_index:])}
+
+    entry = {"sequence": sequence, "action": action, "source": source}
+
+    if options:
+        entry["append_option_to_end"] = f" {' '.join(options)}"
+
+    return entry
+
+
+def parse_running_config_acls(running_config: Union[str, Iterable], ansible_network_os: str) -> Dict[str, List[dict]]:
+    """Function to parse the standard ACLs in a running config into an index of ACL name to entries
+
+    Inverse masks, host, and bare host addresses are converted back to CIDR notation, so the entries are in the same
+    model as the sequences of the standard_acls data, and the index can be given as current to diff_standard_acls
+
+    :type running_config: Union[str, Iterable]
+    :param running_config: The running config text, a file opened in text mode, or the lines
+    :type ansible_network_os: String
+    :param ansible_network_os: The ansible network os
+
+    :rtype: Dict[str, List[dict]]
+    :returns: The entries of each ACL by ACL name Example: {"MGMT": [{"sequence": 10, "action": "permit",
+              "source": "192.168.1.0/24"}]}
+
+    :raises TypeError: If running_config is not a string or an iterable
+    :raises AnsiblePluginError: If the network os is not supported
+    """
+    syntax = RUNNING_CONFIG_ACL_SYNTAX[network_os_normalize(ansible_network_os)]
+    acl_header = syntax["acl"]
+    acls = {}
+    entries = None
+    previous_sequence = 0
+
+    for line in _iter_lines(running_config=running_config):
+        if entries is not None:
+            if line[:1] in (" ", "\t"):
+                if line.strip():
+                    entry = _parse_entry(line=line, previous_sequence=previous_sequence, syntax=syntax)
+
+                    if entry is not None:
+                        entries.append(entry)
+                        previous_sequence = entry["sequence"]
+
+                continue
+
+            entries = None
+
+        if line.startswith(acl_header):
+            name = line[len(acl_header) :].strip()
+
+            if name and " " not in name:
+                entries = acls.setdefault(name, [])
+                previous_sequence = entries[-1]["sequence"] if entries else 0
+
+    return acls
+
+
+def parse_running_config_acls_file(file_path: str, ansible_network_os: str) -> Dict[str, List[dict]]:
+    """Function to parse the standard ACLs in a running config file, the file is streamed instead of read whole
+
+    :type file_path: String
+    :param file_path: The running config file path
+    :type ansible_network_os: String
+    :param ansible_network_os: The ansible network os
+
+    :rtype: Dict[str, List[dict]]
+    :returns: The entries of each ACL by ACL name
+
+    :raises OSError: If the file can not be read
+    :raises AnsiblePluginError: If the network os is not supported
+    """
+    with open(file_path, "r", encoding="utf-8") as running_config_file:
+        return parse_running_config_acls(running_config=running_config_file, ansible_network_os=ansible_network_os)
+
+
+def validate_running_config_acls(acls: Dict[str, List[dict]]) -> Dict[str, List[dict]]:
+    """Function to validate the standard ACLs parsed from a running config before they are diffed, so a malformed
+    device line, like an address with host bits set or a sequence number given twice, never turns into commands
+
+    :type acls: Dict[str, List[dict]]
+    :param acls: The entries of each ACL by ACL name, from parse_running_config_acls
+
+    :rtype: Dict[str, List[dict]]
+    :returns: The validated ACLs
+
+    :raises RunningConfigError: With every error of the parsed ACLs
+    """
+    errors = running_config_acls_errors(acls=acls)
+
+    if errors:
+        raise RunningConfigError(errors=errors)
+
+    return acls
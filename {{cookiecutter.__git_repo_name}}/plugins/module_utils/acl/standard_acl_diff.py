@@ -0,0 +1,123 @@
+"""
+Diff of standard ACLs, to push only the entries that changed instead of whole ACLs
+
+Entries are aligned by sequence number, so the diff of an ACL is linear in the number of its entries
+"""
+
+from collections.abc import Mapping
+from typing import Dict, List, Union
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.normalizers.ansible_network_os_normalizers import (
+    network_os_normalize,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.standard_acl_lines import (
+    STANDARD_ACL_SYNTAX,
+    entry_command,
+)
+
+
+def _index_sequences(name: str, sequences: List[Mapping], syntax: Mapping) -> Dict[int, str]:
+    """Protected function to index the entry commands of an ACL by sequence number, keeping the ACL order
+
+    :type name: String
+    :param name: The ACL name
+    :type sequences: List[Mapping]
+    :param sequences: The ACL entries
+    :type syntax: Mapping
+    :param syntax: The syntax of the network OS from STANDARD_ACL_SYNTAX
+
+    :rtype: Dict[int, str]
+    :returns: The entry commands by sequence number
+
+    :raises ValueError: If a sequence number is not an integer, or is in the ACL more than once
+    """
+    indexed_sequences = {}
+
+    for sequence in sequences:
+        try:
+            sequence_number = int(sequence.get("sequence"))
+
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"ACL '{name}' sequence '{sequence.get('sequence')}' is not an integer") from error
+
+        if sequence_number in indexed_sequences:
+            raise ValueError(f"ACL '{name}' has sequence {sequence_number} more than once")
+
+        indexed_sequences[sequence_number] = entry_command(sequence=sequence, syntax=syntax)
+
+    return indexed_sequences
+
+
+def _index_acls(acls: Union[List[Mapping], Mapping, None]) -> Dict[str, List[Mapping]]:
+    """Protected function to index ACLs by name
+
+    :type acls: Union[List[Mapping], Mapping, None]
+    :param acls: The ACLs as the standard_acls data, or already indexed by name
+
+    :rtype: Dict[str, List[Mapping]]
+    :returns: The entries of each ACL by ACL name
+
+    :raises TypeError: If acls is not a list or a mapping
+    """
+    if acls is None:
+        return {}
+
+    if isinstance(acls, Mapping):
+        return dict(acls)
+
+    if not isinstance(acls, list):
+        raise TypeError(f"'acls' must be of type list or dict but received a {type(acls)}")
+
+    return {acl.get("name"): acl.get("sequences") or [] for acl in acls}
+
+
+def diff_standard_acls(
+    intended: List[Mapping], current: Union[List[Mapping], Mapping, None], ansible_network_os: str
+) -> List[str]:
+    """Function to get the commands to change the current standard ACLs into the intended ones
+
+    Only the ACLs in intended are changed. Entries are aligned by sequence number, removed entries are removed,
+    changed entries are removed then added again, as the network OS do not allow a sequence number to be reused, and
+    new entries are added. An ACL that does not change has no commands
+
+    :type intended: List[Mapping]
+    :param intended: The intended ACLs, the standard_acls data
+    :type current: Union[List[Mapping], Mapping, None]
+    :param current: The current ACLs in the same model, or indexed by ACL name
+    :type ansible_network_os: String
+    :param ansible_network_os: The ansible network os
+
+    :rtype: List[str]
+    :returns: The commands
+
+    :raises TypeError: If intended or current is not the ACL model
+    :raises ValueError: If an ACL has a bad, or a duplicate sequence number
+    :raises AnsiblePluginError: If the network os is not supported, or a source can not be normalized
+    """
+    if not isinstance(intended, list):
+        raise TypeError(f"'intended' must be of type list but received a {type(intended)}")
+
+    syntax = STANDARD_ACL_SYNTAX[network_os_normalize(ansible_network_os)]
+    current_acls = _index_acls(acls=current)
+    commands = []
+
+    for name, intended_sequences in _index_acls(acls=intended).items():
+        intended_entries = _index_sequences(name=name, sequences=intended_sequences, syntax=syntax)
+        current_entries = _index_sequences(name=name, sequences=current_acls.get(name) or [], syntax=syntax)
+
+        remove_commands = [
+            f"no {sequence_number}"
+            for sequence_number, command in current_entries.items()
+            if intended_entries.get(sequence_number) != command
+        ]
+        add_commands = [
+            command
+            for sequence_number, command in intended_entries.items()
+            if current_entries.get(sequence_number) != command
+        ]
+
+        if remove_commands or add_commands:
+            commands.append(syntax["acl"].format(name=name))
+            commands.extend(f" {command}" for command in remove_commands + add_commands)
+
+    return commands
@@ -0,0 +1,214 @@
+"""
+Validation of the standard_acls data, every error is collected with its path instead of stopping at the first one
+"""
+
+from collections.abc import Mapping
+from typing import Any, List, Set
+
+from ansible.errors import AnsiblePluginError
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.normalizers.conversion_normalizers import (
+    acl_source_to_cidr,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.validators.action_validators import (
+    is_permit_deny_remark,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.validators.general_validators import (
+    is_sequence_number,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.validators.ip_address_validators import (
+    is_ipv4_subnet,
+)
+
+# The options that can be appended to the end of a standard ACL entry
+STANDARD_ACL_OPTIONS = frozenset(("log",))
+
+
+def _options_errors(value: Any, path: str) -> List[str]:
+    """Protected function to validate the options appended to the end of an entry, the templates append them as they
+    are so they must start with a space
+
+    :type value: Any
+    :param value: The options as the string to append Example: " log"
+    :type path: String
+    :param path: The path of the options in the data
+
+    :rtype: List[str]
+    :returns: The errors
+    """
+    if not isinstance(value, str):
+        return [f"{path}: '{value}' must be of type str but received a {type(value)}"]
+
+    if not value.startswith(" "):
+        return [f"{path}: '{value}' must start with a space, it is appended to the end of the entry"]
+
+    return [
+        f"{path}: '{option}' is not a valid option, the valid options are {sorted(STANDARD_ACL_OPTIONS)}"
+        for option in value.split()
+        if option not in STANDARD_ACL_OPTIONS
+    ]
+
+
+def _sequence_errors(sequence: Any, path: str, sequence_numbers: Set[int], parsed: bool = False) -> List[str]:
+    """Protected function to validate an ACL entry
+
+    :type sequence: Any
+    :param sequence: The entry Example: {"sequence": 10, "action": "permit", "source": "192.168.1.0/24"}
+    :type path: String
+    :param path: The path of the entry in the data
+    :type sequence_numbers: Set[int]
+    :param sequence_numbers: The sequence numbers of the entries before it in the ACL, the entry number is added
+    :type parsed: Boolean
+    :param parsed: If the entry was parsed from a running config, it can then have the line the model can not express
+                   instead of a source
+
+    :rtype: List[str]
+    :returns: The errors
+    """
+    if not isinstance(sequence, Mapping):
+        return [f"{path}: must be of type dict but received a {type(sequence)}"]
+
+    errors = []
+
+    try:
+        sequence_number = int(is_sequence_number(sequence.get("sequence")))
+
+        if sequence_number in sequence_numbers:
+            errors.append(f"{path}.sequence: {sequence_number} is in the ACL more than once")
+
+        sequence_numbers.add(sequence_number)
+
+    except AnsiblePluginError as error:
+        errors.append(f"{path}.sequence: {error}")
+
+    action = sequence.get("action")
+
+    try:
+        is_permit_deny_remark(action)
+
+    except AnsiblePluginError as error:
+        errors.append(f"{path}.action: {error}")
+
+    if action == "remark":
+        if not isinstance(sequence.get("remark"), str) or not sequence.get("remark").strip():
+            errors.append(f"{path}.remark: a remark entry must have a remark")
+
+    elif parsed and "line" in sequence:
+        if not isinstance(sequence.get("line"), str) or not sequence.get("line").strip():
+            errors.append(f"{path}.line: a parsed entry must have a line")
+
+    elif action in ("permit", "deny"):
+        source = sequence.get("source")
+
+        if source != "any":
+            try:
+                is_ipv4_subnet(acl_source_to_cidr(source))
+
+            except AnsiblePluginError as error:
+                errors.append(f"{path}.source: {error}")
+
+        if sequence.get("append_option_to_end") is not None:
+            errors.extend(
+                _options_errors(value=sequence.get("append_option_to_end"), path=f"{path}.append_option_to_end")
+            )
+
+    return errors
+
+
+def standard_acl_errors(acl: Any, path: str = "") -> List[str]:
+    """Function to validate a standard ACL, and collect every error with its path
+
+    :type acl: Any
+    :param acl: The ACL Example: {"name": "MGMT", "sequences": [{"sequence": 10, "action": "permit",
+                "source": "192.168.1.0/24"}]}
+    :type path: String
+    :param path: The path of the ACL in the data, prefixed to the path of each error
+
+    :rtype: List[str]
+    :returns: The errors Example: ["sequences[0].source: exception: is_ipv4_subnet error: ..."], empty if it is valid
+    """
+    prefix = f"{path}." if path else ""
+
+    if not isinstance(acl, Mapping):
+        return [f"{path or 'acl'}: must be of type dict but received a {type(acl)}"]
+
+    errors = []
+
+    if not isinstance(acl.get("name"), str) or not acl.get("name").strip():
+        errors.append(f"{prefix}name: an ACL must have a name")
+
+    sequences = acl.get("sequences")
+
+    if not isinstance(sequences, list):
+        errors.append(f"{prefix}sequences: must be of type list but received a {type(sequences)}")
+        return errors
+
+    sequence_numbers = set()
+
+    for index, sequence in enumerate(sequences):
+        errors.extend(
+            _sequence_errors(sequence=sequence, path=f"{prefix}sequences[{index}]", sequence_numbers=sequence_numbers)
+        )
+
+    return errors
+
+
+def standard_acls_errors(acls: Any, path: str = "standard_acls") -> List[str]:
+    """Function to validate the whole standard_acls data in one pass, and collect every error with its path
+
+    :type acls: Any
+    :param acls: The standard_acls data
+    :type path: String
+    :param path: The path of the data, prefixed to the path of each error
+
+    :rtype: List[str]
+    :returns: The errors Example: ["standard_acls[1].sequences[0].sequence: 10 is in the ACL more than once"]
+    """
+    if not isinstance(acls, list):
+        return [f"{path}: must be of type list but received a {type(acls)}"]
+
+    errors = []
+
+    for index, acl in enumerate(acls):
+        errors.extend(standard_acl_errors(acl=acl, path=f"{path}[{index}]"))
+
+    return errors
+
+
+def running_config_acls_errors(acls: Any, path: str = "running_config") -> List[str]:
+    """Function to validate the standard ACLs parsed from a running config, and collect every error with its path,
+    so a device line parsed into a bad entry never gets into the diff
+
+    :type acls: Any
+    :param acls: The entries of each ACL by ACL name, from parse_running_config_acls
+    :type path: String
+    :param path: The path of the data, prefixed to the path of each error
+
+    :rtype: List[str]
+    :returns: The errors Example: ["running_config[MGMT].sequences[0].source: exception: is_ipv4_subnet error: ..."]
+    """
+    if not isinstance(acls, Mapping):
+        return [f"{path}: must be of type dict but received a {type(acls)}"]
+
+    errors = []
+
+    for name, sequences in acls.items():
+        acl_path = f"{path}[{name}]"
+
+        if not isinstance(sequences, list):
+            errors.append(f"{acl_path}.sequences: must be of type list but received a {type(sequences)}")
+            continue
+
+        sequence_numbers = set()
+
+        for index, sequence in enumerate(sequences):
+            errors.extend(
+                _sequence_errors(
+                    sequence=sequence,
+                    path=f"{acl_path}.sequences[{index}]",
+                    sequence_numbers=sequence_numbers,
+                    parsed=True,
+                )
+            )
+
+    return errors
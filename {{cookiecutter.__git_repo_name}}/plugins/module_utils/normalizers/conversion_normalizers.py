@@ -2,23 +2,63 @@
 Some conversion normalizers
 """
 
-import ipaddress
 import inspect
-from typing import Union
+from typing import Tuple, Union
 
 from ansible.errors import AnsiblePluginError
 
 
 from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.validators.ip_address_validators import (
-    is_ipv4_subnet,
+    IPV4_HOSTMASK_VALUES,
+    IPv4Prefix,
+    ipv4_int_to_str,
+    parse_ipv4_subnet,
 )
 
+# The dotted decimal inverse mask of each prefix length, indexed by prefix length, there are only 33 so they are
+# formatted once instead of for every entry Example: IPV4_INVERSE_MASKS[24] is 0.0.0.255
+IPV4_INVERSE_MASKS = tuple(ipv4_int_to_str(hostmask) for hostmask in IPV4_HOSTMASK_VALUES)
 
-def cidr_to_inverse_mask(value: str) -> str:
+# The prefix length of each contiguous inverse mask Example: {"0.0.0.255": 24}
+INVERSE_MASK_PREFIX_LENGTHS = {
+    inverse_mask: prefix_length for prefix_length, inverse_mask in enumerate(IPV4_INVERSE_MASKS)
+}
+
+
+def _inverse_mask_notation(prefix: IPv4Prefix) -> str:
+    """Protected function to format a parsed subnet in inverse mask notation, the mask is looked up by prefix length
+
+    :type prefix: IPv4Prefix
+    :param prefix: The parsed subnet
+
+    :rtype: String
+    :returns: The formatted subnet Example: 192.168.1.0 0.0.0.255
+    """
+    return f"{ipv4_int_to_str(prefix.address)} {IPV4_INVERSE_MASKS[prefix.prefix_length]}"
+
+
+def _split_prefix(value: Union[str, IPv4Prefix]) -> Tuple[str, int]:
+    """Protected function to split a CIDR notation into the address and the prefix length, without validating it
+
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to split Example: 192.168.1.0/24, or the parsed prefix
+
+    :rtype: Tuple[str, int]
+    :returns: The address, and the prefix length Example: ("192.168.1.0", 24)
+    """
+    if isinstance(value, IPv4Prefix):
+        return ipv4_int_to_str(value.address), value.prefix_length
+
+    split_value = value.split("/")
+
+    return split_value[0], int(split_value[1])
+
+
+def cidr_to_inverse_mask(value: Union[str, IPv4Prefix]) -> str:
     """Function to convert a CIDR notation to a inverse mask notation
 
-    :type value: String
-    :param value: Value to convert Example: 192.168.1.0/24
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to convert Example: 192.168.1.0/24, or the parsed prefix
 
     :rtype: String
     :returns: The converted value Example: 192.168.1.0 0.0.0.255
@@ -26,21 +66,68 @@ def cidr_to_inverse_mask(value: str) -> str:
     :raises AnsiblePluginError: If exceptions occur
     """
     try:
-        is_ipv4_subnet(value)
+        prefix = parse_ipv4_subnet(value)
+
+    except Exception as error:
+        raise AnsiblePluginError(f"exception: {inspect.currentframe().f_code.co_name} error: {error}") from error
+
+    return _inverse_mask_notation(prefix)
+
+
+def inverse_mask_to_cidr(value: str) -> str:
+    """Function to convert a inverse mask notation to a CIDR notation
+
+    :type value: String
+    :param value: Value to convert Example: 192.168.1.0 0.0.0.255
+
+    :rtype: String
+    :returns: The converted value Example: 192.168.1.0/24
+
+    :raises AnsiblePluginError: If exceptions occur
+    """
+    try:
+        address, inverse_mask = value.split()
 
-        ipv4_obj = ipaddress.ip_network(value)
+        value = parse_ipv4_subnet(f"{address}/{INVERSE_MASK_PREFIX_LENGTHS[inverse_mask]}").with_prefixlen
 
     except Exception as error:
         raise AnsiblePluginError(f"exception: {inspect.currentframe().f_code.co_name} error: {error}") from error
 
-    return f"{ipv4_obj.network_address} {ipv4_obj.hostmask}"
+    return value
 
 
-def ios_standard_acl_ipv4_subnet_normalizer(value: str) -> str:
-    """Function to convert ACL subnets for Cisco IOS Devices for Standard ACLs
+def acl_source_to_cidr(value: str) -> str:
+    """Function to convert an ACL source as a device takes it to CIDR notation, a host, a bare host address, and a
+    contiguous inverse mask are converted, any other value is returned as it is
 
     :type value: String
-    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32
+    :param value: Value to convert Example: host 192.168.1.1, or 192.168.1.0 0.0.0.255, or 192.168.1.0/24
+
+    :rtype: String
+    :returns: The converted value Example: 192.168.1.1/32, or 192.168.1.0/24
+    """
+    if not isinstance(value, str):
+        return value
+
+    tokens = value.split()
+
+    if len(tokens) == 2 and tokens[0] == "host":
+        return f"{tokens[1]}/32"
+
+    if len(tokens) == 2 and tokens[1] in INVERSE_MASK_PREFIX_LENGTHS:
+        return f"{tokens[0]}/{INVERSE_MASK_PREFIX_LENGTHS[tokens[1]]}"
+
+    if len(tokens) == 1 and tokens[0][:1].isdigit() and "/" not in tokens[0]:
+        return f"{tokens[0]}/32"
+
+    return value
+
+
+def ios_standard_acl_ipv4_subnet_normalizer(value: Union[str, IPv4Prefix]) -> str:
+    """Function to convert ACL subnets for Cisco IOS Devices for Standard ACLs
+
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32, or the parsed prefix
 
     :rtype: String
     :returns: The converted value Example: 192.168.1.0 0.0.0.255, or 192.168.1.1
@@ -48,10 +135,10 @@ def ios_standard_acl_ipv4_subnet_normalizer(value: str) -> str:
     :raises AnsiblePluginError: If exceptions occur
     """
     try:
-        split_value = value.split("/")
+        address, prefix_length = _split_prefix(value)
 
-        if int(split_value[1]) == 32:
-            value = split_value[0]
+        if prefix_length == 32:
+            value = address
 
         else:
             value = cidr_to_inverse_mask(value)
@@ -62,11 +149,11 @@ def ios_standard_acl_ipv4_subnet_normalizer(value: str) -> str:
     return value
 
 
-def ios_extended_acl_ipv4_subnet_normalizer(value: str) -> str:
+def ios_extended_acl_ipv4_subnet_normalizer(value: Union[str, IPv4Prefix]) -> str:
     """Function to convert ACL subnets for Cisco IOS Devices for Extended ACLs
 
-    :type value: String
-    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32, or the parsed prefix
 
     :rtype: String
     :returns: The converted value Example: 192.168.1.0 0.0.0.255, or host 192.168.1.1
@@ -74,10 +161,10 @@ def ios_extended_acl_ipv4_subnet_normalizer(value: str) -> str:
     :raises AnsiblePluginError: If exceptions occur
     """
     try:
-        split_value = value.split("/")
+        address, prefix_length = _split_prefix(value)
 
-        if int(split_value[1]) == 32:
-            value = f"host {split_value[0]}"
+        if prefix_length == 32:
+            value = f"host {address}"
 
         else:
             value = cidr_to_inverse_mask(value)
@@ -88,11 +175,11 @@ def ios_extended_acl_ipv4_subnet_normalizer(value: str) -> str:
     return value
 
 
-def iosxr_standard_acl_ipv4_subnet_normalizer(value: str) -> str:
+def iosxr_standard_acl_ipv4_subnet_normalizer(value: Union[str, IPv4Prefix]) -> str:
     """Function to convert ACL subnets for Cisco IOS-XR Devices for Standard ACLs
 
-    :type value: String
-    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32, or the parsed prefix
 
     :rtype: String
     :returns: The converted value Example: 192.168.1.0 0.0.0.255, or host 192.168.1.1
@@ -100,10 +187,10 @@ def iosxr_standard_acl_ipv4_subnet_normalizer(value: str) -> str:
     :raises AnsiblePluginError: If exceptions occur
     """
     try:
-        split_value = value.split("/")
+        address, prefix_length = _split_prefix(value)
 
-        if int(split_value[1]) == 32:
-            value = f"host {split_value[0]}"
+        if prefix_length == 32:
+            value = f"host {address}"
 
         else:
             value = cidr_to_inverse_mask(value)
@@ -114,11 +201,11 @@ def iosxr_standard_acl_ipv4_subnet_normalizer(value: str) -> str:
     return value
 
 
-def iosxr_extended_acl_ipv4_subnet_normalizer(value: str) -> str:
+def iosxr_extended_acl_ipv4_subnet_normalizer(value: Union[str, IPv4Prefix]) -> str:
     """Function to convert ACL subnets for Cisco IOS-XR Devices for Extended ACLs
 
-    :type value: String
-    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32, or the parsed prefix
 
     :rtype: String
     :returns: The converted value Example: 192.168.1.0 0.0.0.255, or host 192.168.1.1
@@ -126,10 +213,10 @@ def iosxr_extended_acl_ipv4_subnet_normalizer(value: str) -> str:
     :raises AnsiblePluginError: If exceptions occur
     """
     try:
-        split_value = value.split("/")
+        address, prefix_length = _split_prefix(value)
 
-        if int(split_value[1]) == 32:
-            value = f"host {split_value[0]}"
+        if prefix_length == 32:
+            value = f"host {address}"
 
         else:
             value = cidr_to_inverse_mask(value)
@@ -140,22 +227,25 @@ def iosxr_extended_acl_ipv4_subnet_normalizer(value: str) -> str:
     return value
 
 
-def eos_standard_acl_ipv4_subnet_normalizer(value: str) -> str:
+def eos_standard_acl_ipv4_subnet_normalizer(value: Union[str, IPv4Prefix]) -> str:
     """Function to convert ACL subnets for Arista EOS Devices for Standard ACLs
 
-    :type value: String
-    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32, or the parsed prefix
 
     :rtype: String
-    :returns: The converted value Example: 192.168.1.0/24, or host 192.168.1.1
+    :returns: The converted value Example: 192.168.1.0/24, or host 192.168.1.1, other values are returned as they are
 
-    :raises AnsiblePluginError: If exceptions occur
+    :raises AnsiblePluginError: If the value has no prefix length
     """
     try:
-        split_value = value.split("/")
+        address, prefix_length = _split_prefix(value)
+
+        if prefix_length == 32:
+            value = f"host {address}"
 
-        if int(split_value[1]) == 32:
-            value = f"host {split_value[0]}"
+        else:
+            value = str(value)
 
     except Exception as error:
         raise AnsiblePluginError(f"exception: {inspect.currentframe().f_code.co_name} error: {error}") from error
@@ -163,22 +253,25 @@ def eos_standard_acl_ipv4_subnet_normalizer(value: str) -> str:
     return value
 
 
-def eos_extended_acl_ipv4_subnet_normalizer(value: str) -> str:
+def eos_extended_acl_ipv4_subnet_normalizer(value: Union[str, IPv4Prefix]) -> str:
     """Function to convert ACL subnets for Arista EOS Devices for Extended ACLs
 
-    :type value: String
-    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to convert Example: 192.168.1.0/24, or 192.168.1.1/32, or the parsed prefix
 
     :rtype: String
-    :returns: The converted value Example: 192.168.1.0/24, or host 192.168.1.1
+    :returns: The converted value Example: 192.168.1.0/24, or host 192.168.1.1, other values are returned as they are
 
-    :raises AnsiblePluginError: If exceptions occur
+    :raises AnsiblePluginError: If the value has no prefix length
     """
     try:
-        split_value = value.split("/")
+        address, prefix_length = _split_prefix(value)
 
-        if int(split_value[1]) == 32:
-            value = f"host {split_value[0]}"
+        if prefix_length == 32:
+            value = f"host {address}"
+
+        else:
+            value = str(value)
 
     except Exception as error:
         raise AnsiblePluginError(f"exception: {inspect.currentframe().f_code.co_name} error: {error}") from error
@@ -215,3 +308,17 @@ def eos_port_normalizer(value: Union[str, int]) -> Union[str, int]:
         raise AnsiblePluginError(f"exception: {inspect.currentframe().f_code.co_name} error: {error}") from error
 
     return new_value
+
+
+# The subnet normalizer of each normalized network OS that does not take subnets in CIDR notation as they are
+STANDARD_ACL_IPV4_SUBNET_NORMALIZERS = {
+    "ios": ios_standard_acl_ipv4_subnet_normalizer,
+    "iosxr": iosxr_standard_acl_ipv4_subnet_normalizer,
+    "eos": eos_standard_acl_ipv4_subnet_normalizer,
+}
+
+EXTENDED_ACL_IPV4_SUBNET_NORMALIZERS = {
+    "ios": ios_extended_acl_ipv4_subnet_normalizer,
+    "iosxr": iosxr_extended_acl_ipv4_subnet_normalizer,
+    "eos": eos_extended_acl_ipv4_subnet_normalizer,
+}
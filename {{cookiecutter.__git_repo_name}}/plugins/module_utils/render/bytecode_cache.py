@@ -0,0 +1,124 @@
+"""
+Persistent Jinja2 bytecode cache for templates, shared by forks and later playbook runs
+"""
+
+import hashlib
+import os
+import sys
+import threading
+from typing import Dict, Optional
+
+import jinja2
+from jinja2 import Environment
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
+from ansible.release import __version__ as ansible_version
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    get_setting,
+)
+
+
+def runtime_versions() -> str:
+    """Function to describe the Python, Jinja2, and Ansible versions compiled template code depends on
+
+    :rtype: String
+    :returns: The runtime versions
+    """
+    return f"python-{sys.version_info[0]}.{sys.version_info[1]}|jinja2-{jinja2.__version__}|ansible-{ansible_version}"
+
+
+def environment_fingerprint(environment: Environment) -> str:
+    """Function to describe the environment options that change the compiled code of a template
+
+    :type environment: jinja2.Environment
+    :param environment: The environment
+
+    :rtype: String
+    :returns: The fingerprint of the environment
+    """
+    options = [
+        f"{type(environment).__module__}.{type(environment).__qualname__}",
+        environment.block_start_string,
+        environment.block_end_string,
+        environment.variable_start_string,
+        environment.variable_end_string,
+        environment.comment_start_string,
+        environment.comment_end_string,
+        str(environment.line_statement_prefix),
+        str(environment.line_comment_prefix),
+        str(environment.trim_blocks),
+        str(environment.lstrip_blocks),
+        environment.newline_sequence,
+        str(environment.keep_trailing_newline),
+        str(environment.finalize is not None),
+        str(environment.is_async),
+        str(environment.optimized),
+    ]
+
+    return "|".join(options)
+
+
+class VersionedBytecodeCache(FileSystemBytecodeCache):
+    """Class for a file system bytecode cache that is invalidated by the template checksum, and the Python,
+    Jinja2, and Ansible versions
+
+    :type directory: String
+    :param directory: The directory to store the bytecode in, it is created if needed
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    def __init__(self, directory: str) -> None:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        super().__init__(directory=directory, pattern="__jinja2_%s.cache")
+        self.versions = runtime_versions()
+
+    def get_bucket(self, environment: Environment, name: str, filename: Optional[str], source: str) -> Bucket:
+        """Get the cache bucket of a template, the bucket code is None if there is no usable bytecode
+
+        :type environment: jinja2.Environment
+        :param environment: The environment compiling the template
+        :type name: String
+        :param name: The template name
+        :type filename: Optional[str]
+        :param filename: The template path
+        :type source: String
+        :param source: The template source
+
+        :rtype: jinja2.bccache.Bucket
+        :returns: The cache bucket
+        """
+        key_data = f"{self.versions}|{environment_fingerprint(environment)}|{name}|{filename}"
+        key = hashlib.sha1(key_data.encode("utf-8")).hexdigest()
+        bucket = Bucket(environment, key, self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+
+        return bucket
+
+
+_BYTECODE_CACHES: Dict[str, VersionedBytecodeCache] = {}
+_BYTECODE_CACHES_LOCK = threading.Lock()
+
+
+def get_bytecode_cache() -> Optional[VersionedBytecodeCache]:
+    """Function to get the bytecode cache set by the BYTECODE_CACHE_PATH setting
+
+    :rtype: Optional[VersionedBytecodeCache]
+    :returns: The bytecode cache, or None if the setting is not set
+    """
+    bytecode_cache_path = get_setting("BYTECODE_CACHE_PATH")
+
+    if not bytecode_cache_path:
+        return None
+
+    bytecode_cache_path = os.path.abspath(os.path.expanduser(bytecode_cache_path))
+
+    with _BYTECODE_CACHES_LOCK:
+        bytecode_cache = _BYTECODE_CACHES.get(bytecode_cache_path)
+
+        if bytecode_cache is None:
+            bytecode_cache = VersionedBytecodeCache(directory=bytecode_cache_path)
+            _BYTECODE_CACHES[bytecode_cache_path] = bytecode_cache
+
+    return bytecode_cache
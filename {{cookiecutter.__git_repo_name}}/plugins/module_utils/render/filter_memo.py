@@ -0,0 +1,232 @@
+"""
+Bounded memoization of the pure render filters, enabled by the FILTER_MEMO setting
+
+ACLs repeat the same prefixes, ports, and options across entries and hosts, so each distinct call is done once per
+worker process. Filter errors are cached too, so repeated bad input fails fast
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ansible.errors import AnsibleFilterError
+from jinja2 import Undefined
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    get_bool_setting,
+    get_int_setting,
+)
+
+FILTER_MEMO_DEFAULT_MAX_SIZE = 4096
+
+
+def _freeze(value: Any) -> Hashable:
+    """Protected function to get a hashable form of a filter argument that keeps its type
+
+    The type is kept so values that are equal but of a different type, like 1 and True, or a list and a tuple, do not
+    share a cached result
+
+    :type value: Any
+    :param value: The argument
+
+    :rtype: Hashable
+    :returns: The hashable form
+
+    :raises TypeError: If the value can not be made hashable, or is undefined
+    """
+    if isinstance(value, Undefined):
+        raise TypeError("undefined values are not cached")
+
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+
+    if isinstance(value, dict):
+        return type(value), tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    hash(value)
+    return type(value), value
+
+
+class MemoizedFilter:
+    """Class for a filter with a least recently used cache of its results and errors
+
+    :type function: Callable
+    :param function: The pure filter function
+    :type max_size: Integer
+    :param max_size: The maximum number of cached calls
+
+    :rtype: None
+    :returns: Nothing
+
+    :raises ValueError: If max_size is less than 1
+    """
+
+    def __init__(self, function: Callable, max_size: int = FILTER_MEMO_DEFAULT_MAX_SIZE) -> None:
+        if max_size < 1:
+            raise ValueError(f"'max_size' must be at least 1 but received {max_size}")
+
+        self.function = function
+        self._max_size = max_size
+        self._cache: "OrderedDict[Hashable, Tuple[bool, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__name__ = getattr(function, "__name__", "filter")
+        self.__doc__ = getattr(function, "__doc__", None)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            key = (_freeze(args), _freeze(kwargs))
+
+        except TypeError:
+            return self.function(*args, **kwargs)
+
+        with self._lock:
+            cached = self._cache.get(key)
+
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+
+            else:
+                self.misses += 1
+
+        if cached is not None:
+            failed, value = cached
+            if failed:
+                raise value.with_traceback(None)
+
+            return value
+
+        try:
+            value = self.function(*args, **kwargs)
+
+        except AnsibleFilterError as error:
+            self._store(key=key, cached=(True, error))
+            raise
+
+        self._store(key=key, cached=(False, value))
+        return value
+
+    def _store(self, key: Hashable, cached: Tuple[bool, Any]) -> None:
+        """Protected Method to cache a call, evicting the least recently used call if the cache is full
+
+        :type key: Hashable
+        :param key: The key of the call arguments
+        :type cached: Tuple[bool, Any]
+        :param cached: If the call failed, and the result or the error
+
+        :rtype: None
+        :returns: Nothing
+        """
+        with self._lock:
+            self._cache[key] = cached
+            self._cache.move_to_end(key)
+
+            if len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hits, misses, evictions, and size of the cache
+
+        :rtype: Dict[str, int]
+        :returns: The counters
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._cache)}
+
+    def clear(self) -> None:
+        """Remove every cached call, and reset the counters
+
+        :rtype: None
+        :returns: Nothing
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+class FilterMemo:
+    """Class for the memoized filters of a process, by filter name
+
+    :type max_size: Integer
+    :param max_size: The maximum number of cached calls of each filter
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    def __init__(self, max_size: int = FILTER_MEMO_DEFAULT_MAX_SIZE) -> None:
+        self._max_size = max_size
+        self._filters: Dict[str, MemoizedFilter] = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, filter_name: str, function: Callable) -> MemoizedFilter:
+        """Get the memoized filter of a filter, it is kept so its cache lasts across filter loads
+
+        :type filter_name: String
+        :param filter_name: The filter name
+        :type function: Callable
+        :param function: The pure filter function
+
+        :rtype: MemoizedFilter
+        :returns: The memoized filter
+        """
+        with self._lock:
+            memoized_filter = self._filters.get(filter_name)
+
+            if memoized_filter is None or memoized_filter.function is not function:
+                memoized_filter = MemoizedFilter(function=function, max_size=self._max_size)
+                self._filters[filter_name] = memoized_filter
+
+        return memoized_filter
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the hits, misses, evictions, and size of each memoized filter
+
+        :rtype: Dict[str, Dict[str, int]]
+        :returns: The counters by filter name
+        """
+        with self._lock:
+            memoized_filters = dict(self._filters)
+
+        return {filter_name: memoized_filter.stats() for filter_name, memoized_filter in memoized_filters.items()}
+
+    def clear(self) -> None:
+        """Remove every cached call of every filter, and reset the counters
+
+        :rtype: None
+        :returns: Nothing
+        """
+        with self._lock:
+            memoized_filters = list(self._filters.values())
+
+        for memoized_filter in memoized_filters:
+            memoized_filter.clear()
+
+
+_FILTER_MEMOS: Dict[int, FilterMemo] = {}
+_FILTER_MEMOS_LOCK = threading.Lock()
+
+
+def get_filter_memo() -> Optional[FilterMemo]:
+    """Function to get the filter memo set by the FILTER_MEMO and FILTER_MEMO_MAX_SIZE settings
+
+    :rtype: Optional[FilterMemo]
+    :returns: The filter memo, or None if the FILTER_MEMO setting is not true
+    """
+    if not get_bool_setting("FILTER_MEMO"):
+        return None
+
+    max_size = get_int_setting("FILTER_MEMO_MAX_SIZE", FILTER_MEMO_DEFAULT_MAX_SIZE)
+
+    with _FILTER_MEMOS_LOCK:
+        filter_memo = _FILTER_MEMOS.get(max_size)
+
+        if filter_memo is None:
+            filter_memo = FilterMemo(max_size=max_size)
+            _FILTER_MEMOS[max_size] = filter_memo
+
+    return filter_memo
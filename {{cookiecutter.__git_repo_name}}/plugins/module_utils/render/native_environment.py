@@ -0,0 +1,196 @@
+"""
+Plain Jinja2 environment for rendering the trusted collection templates without going through the Templar
+
+The environment is set up to give the same output as the Templar for the collection templates, they only use plain
+Jinja2 and the collection filters, so the unsafe variable wrapping and lookup plumbing of the Templar is not needed.
+Like the Templar, template syntax inside a variable is expanded, those variables are templated with the Templar
+"""
+
+import os
+import threading
+from collections import ChainMap
+from collections.abc import Iterator, Mapping, MappingView
+from typing import Any, Optional
+
+from jinja2 import Environment, StrictUndefined
+from jinja2.defaults import BLOCK_START_STRING, COMMENT_START_STRING, VARIABLE_START_STRING
+from ansible.errors import AnsibleUndefinedVariable
+from ansible.module_utils.common.collections import is_sequence
+from ansible.template import AnsibleUndefined, Templar
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.filter.render_filters import (
+    FilterModule,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    COLLECTION_NAME,
+    COLLECTION_NAMESPACE,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.template_cache import (
+    CompiledTemplateCache,
+)
+
+
+def _fail_on_undefined(value: Any) -> None:
+    """Protected function to raise the undefined error of an undefined value nested anywhere in a value
+
+    :type value: Any
+    :param value: The value
+
+    :rtype: None
+    :returns: Nothing
+
+    :raises jinja2.exceptions.UndefinedError: If the value has an undefined value in it
+    """
+    if isinstance(value, Mapping):
+        for item in value.values():
+            _fail_on_undefined(item)
+
+    elif is_sequence(value):
+        for item in value:
+            _fail_on_undefined(item)
+
+    elif isinstance(value, StrictUndefined):
+        str(value)
+
+
+def native_finalize(value: Any) -> Any:
+    """Function to finalize the output of an expression the same way the Templar does
+
+    None is rendered as an empty string, generators and views are unrolled to a list, and undefined values raise
+
+    :type value: Any
+    :param value: The value of the expression
+
+    :rtype: Any
+    :returns: The value to render
+
+    :raises jinja2.exceptions.UndefinedError: If the value has an undefined value in it
+    """
+    if isinstance(value, str):
+        return value
+
+    _fail_on_undefined(value)
+
+    if value is None:
+        return ""
+
+    if isinstance(value, (Iterator, MappingView, range)):
+        return list(value)
+
+    return value
+
+
+# The start strings of Jinja2 template syntax, a string with none of them is never templated by the Templar
+TEMPLATE_SYNTAX_STARTS = (VARIABLE_START_STRING, BLOCK_START_STRING, COMMENT_START_STRING)
+
+
+def has_template_syntax(value: Any) -> bool:
+    """Function to check if a variable has template syntax anywhere in it, that the Templar would expand
+
+    :type value: Any
+    :param value: The variable
+
+    :rtype: Boolean
+    :returns: True if a string in it, or a key of a dict in it, has template syntax and is not marked unsafe
+    """
+    if hasattr(value, "__UNSAFE__"):
+        return False
+
+    if isinstance(value, str):
+        return any(start in value for start in TEMPLATE_SYNTAX_STARTS)
+
+    if isinstance(value, Mapping):
+        return any(has_template_syntax(key) or has_template_syntax(item) for key, item in value.items())
+
+    if is_sequence(value):
+        return any(has_template_syntax(item) for item in value)
+
+    return False
+
+
+class NativeTemplateVariables(ChainMap):
+    """Class for the variables of a native environment render, with the same nested templating as the Templar
+
+    A variable with template syntax in it, like a remark of an expression, is templated with the Templar, as
+    AnsibleJ2Vars does, every other variable is returned as it is
+
+    :type templar: ansible.template.Templar
+    :param templar: The Templar, its available variables must be the template variables
+    :type template_variables: Mapping
+    :param template_variables: The variables to fill the template with
+    :type template_globals: Mapping
+    :param template_globals: The globals of the template
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    def __init__(self, templar: Templar, template_variables: Mapping, template_globals: Mapping) -> None:
+        super().__init__(template_variables, template_globals)
+        self._templar = templar
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+
+        if not has_template_syntax(value):
+            return value
+
+        try:
+            return self._templar.template(value)
+
+        except AnsibleUndefinedVariable as error:
+            return AnsibleUndefined(hint=f"{value}: {error.message}", name=key, exc=AnsibleUndefinedVariable)
+
+
+def create_native_environment() -> Environment:
+    """Function to create a plain Jinja2 environment with the collection filters registered by their FQCN
+
+    :rtype: jinja2.Environment
+    :returns: The environment
+    """
+    environment = Environment(trim_blocks=True, undefined=AnsibleUndefined, finalize=native_finalize)
+
+    for filter_name, filter_function in FilterModule().filters().items():
+        environment.filters[f"{COLLECTION_NAMESPACE}.{COLLECTION_NAME}.{filter_name}"] = filter_function
+
+    return environment
+
+
+NATIVE_COMPILED_TEMPLATE_CACHE = CompiledTemplateCache()
+
+_NATIVE_ENVIRONMENT: Optional[Environment] = None
+_NATIVE_ENVIRONMENT_LOCK = threading.Lock()
+
+
+def get_native_environment() -> Environment:
+    """Function to get the process wide native environment, it is created on first use
+
+    :rtype: jinja2.Environment
+    :returns: The environment
+    """
+    global _NATIVE_ENVIRONMENT  # pylint: disable=global-statement
+
+    with _NATIVE_ENVIRONMENT_LOCK:
+        if _NATIVE_ENVIRONMENT is None:
+            _NATIVE_ENVIRONMENT = create_native_environment()
+
+    return _NATIVE_ENVIRONMENT
+
+
+def is_trusted_template(template_path: str, templates_directory: Optional[str]) -> bool:
+    """Function to check if a template is inside the collection templates directory
+
+    :type template_path: String
+    :param template_path: The path to the template
+    :type templates_directory: Optional[str]
+    :param templates_directory: The collection templates directory
+
+    :rtype: Boolean
+    :returns: True if the template is inside the templates directory
+    """
+    if not templates_directory:
+        return False
+
+    templates_directory = os.path.realpath(templates_directory)
+
+    return os.path.commonpath([os.path.realpath(template_path), templates_directory]) == templates_directory
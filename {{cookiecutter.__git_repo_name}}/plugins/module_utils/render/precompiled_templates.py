@@ -0,0 +1,235 @@
+"""
+Ahead of time compilation of the collection templates into importable Python modules
+
+Run from the root of the collection to compile everything under templates into compiled_templates
+
+    make compile-templates
+"""
+
+import argparse
+import hashlib
+import os
+import threading
+from types import CodeType
+from typing import Dict, List, Optional
+
+from jinja2 import Environment, Template
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.bytecode_cache import (
+    environment_fingerprint,
+    runtime_versions,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    get_bool_setting,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.template_cache import (
+    has_override_header,
+)
+
+COMPILED_TEMPLATES_DIRECTORY_NAME = "compiled_templates"
+
+
+def source_checksum(source: str) -> str:
+    """Function to get the checksum of a template source
+
+    :type source: String
+    :param source: The template source
+
+    :rtype: String
+    :returns: The SHA-256 hex digest of the source
+    """
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def compiled_module_name(relative_path: str) -> str:
+    """Function to get the module name of a compiled template
+
+    :type relative_path: String
+    :param relative_path: The template path relative to the templates directory Example: ios/main/standard_acl.j2
+
+    :rtype: String
+    :returns: The module name
+    """
+    return f"tmpl_{hashlib.sha1(relative_path.encode('utf-8')).hexdigest()}"
+
+
+def compile_templates_directory(
+    templates_directory: str, compiled_directory: str, environment: Environment, extension: str = ".j2"
+) -> List[str]:
+    """Function to compile every template in a templates directory into Python modules
+
+    :type templates_directory: String
+    :param templates_directory: The templates directory
+    :type compiled_directory: String
+    :param compiled_directory: The directory to write the modules to
+    :type environment: jinja2.Environment
+    :param environment: The environment the templates are rendered with at runtime
+    :type extension: String
+    :param extension: The extension of the template files
+
+    :rtype: List[str]
+    :returns: The relative paths of the compiled templates
+    """
+    os.makedirs(compiled_directory, exist_ok=True)
+    compiled_templates = []
+
+    for directory, _, file_names in os.walk(templates_directory):
+        for file_name in sorted(file_names):
+            if not file_name.endswith(extension):
+                continue
+
+            template_path = os.path.join(directory, file_name)
+            relative_path = os.path.relpath(template_path, templates_directory).replace(os.sep, "/")
+
+            with open(template_path, "r") as template_file:
+                source = template_file.read()
+
+            # A #jinja2: override header is only applied by Templar.template, the template is rendered with it instead
+            if has_override_header(source):
+                continue
+
+            code = environment.compile(source, name=relative_path, filename=relative_path, raw=True, defer_init=True)
+            header = [
+                f"# Compiled from templates/{relative_path} do not edit",
+                f"SOURCE_CHECKSUM = {source_checksum(source)!r}",
+                f"RUNTIME_VERSIONS = {runtime_versions()!r}",
+                f"ENVIRONMENT_FINGERPRINT = {environment_fingerprint(environment)!r}",
+            ]
+
+            module_path = os.path.join(compiled_directory, f"{compiled_module_name(relative_path)}.py")
+            with open(module_path, "w") as module_file:
+                module_file.write("\n".join(header) + "\n" + code)
+
+            compiled_templates.append(relative_path)
+
+    return compiled_templates
+
+
+class PrecompiledTemplates:
+    """Class to load precompiled templates of a templates directory
+
+    :type templates_directory: String
+    :param templates_directory: The templates directory
+    :type compiled_directory: Optional[str] = None
+    :param compiled_directory: The directory of the compiled modules, defaults to compiled_templates next to templates
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    def __init__(self, templates_directory: str, compiled_directory: Optional[str] = None) -> None:
+        self._templates_directory = os.path.abspath(templates_directory)
+
+        if compiled_directory is None:
+            compiled_directory = os.path.join(
+                os.path.dirname(self._templates_directory), COMPILED_TEMPLATES_DIRECTORY_NAME
+            )
+
+        self._compiled_directory = os.path.abspath(compiled_directory)
+
+    def load_code(self, environment: Environment, template_path: str, source: str) -> Optional[CodeType]:
+        """Load the code of a precompiled template if it was compiled from the same source, for the same runtime
+
+        :type environment: jinja2.Environment
+        :param environment: The environment the template is rendered with
+        :type template_path: String
+        :param template_path: The absolute path of the template source
+        :type source: String
+        :param source: The template source
+
+        :rtype: Optional[CodeType]
+        :returns: The code of the compiled module, or None if there is no usable precompiled template
+        """
+        relative_path = os.path.relpath(template_path, self._templates_directory).replace(os.sep, "/")
+        if relative_path.startswith("../"):
+            return None
+
+        module_path = os.path.join(self._compiled_directory, f"{compiled_module_name(relative_path)}.py")
+        if not os.path.isfile(module_path):
+            return None
+
+        with open(module_path, "r") as module_file:
+            code = compile(module_file.read(), module_path, "exec")
+
+        namespace = {"environment": environment}
+        exec(code, namespace)  # pylint: disable=exec-used
+
+        if (
+            namespace["SOURCE_CHECKSUM"] != source_checksum(source)
+            or namespace["RUNTIME_VERSIONS"] != runtime_versions()
+            or namespace["ENVIRONMENT_FINGERPRINT"] != environment_fingerprint(environment)
+        ):
+            return None
+
+        return code
+
+    def load(self, environment: Environment, template_path: str, source: str) -> Optional[Template]:
+        """Load a precompiled template if it was compiled from the same source, for the same runtime
+
+        :type environment: jinja2.Environment
+        :param environment: The environment to bind the template to
+        :type template_path: String
+        :param template_path: The absolute path of the template source
+        :type source: String
+        :param source: The template source
+
+        :rtype: Optional[jinja2.Template]
+        :returns: The template, or None if there is no usable precompiled template
+        """
+        code = self.load_code(environment=environment, template_path=template_path, source=source)
+        if code is None:
+            return None
+
+        return environment.template_class.from_code(environment, code, environment.make_globals(None))
+
+
+_PRECOMPILED_TEMPLATES: Dict[str, PrecompiledTemplates] = {}
+_PRECOMPILED_TEMPLATES_LOCK = threading.Lock()
+
+
+def get_precompiled_templates(templates_directory: Optional[str]) -> Optional[PrecompiledTemplates]:
+    """Function to get the precompiled templates of a templates directory
+
+    Set the PRECOMPILED_TEMPLATES setting to false to always compile the templates at runtime
+
+    :type templates_directory: Optional[str]
+    :param templates_directory: The templates directory
+
+    :rtype: Optional[PrecompiledTemplates]
+    :returns: The precompiled templates, or None if they are disabled
+    """
+    if not templates_directory or not get_bool_setting("PRECOMPILED_TEMPLATES", True):
+        return None
+
+    with _PRECOMPILED_TEMPLATES_LOCK:
+        precompiled_templates = _PRECOMPILED_TEMPLATES.get(templates_directory)
+
+        if precompiled_templates is None:
+            precompiled_templates = PrecompiledTemplates(templates_directory=templates_directory)
+            _PRECOMPILED_TEMPLATES[templates_directory] = precompiled_templates
+
+    return precompiled_templates
+
+
+def main() -> None:  # pragma: no cover
+    """Compile the collection templates with the same environment Ansible renders them with"""
+    from ansible.parsing.dataloader import DataLoader
+    from ansible.template import Templar
+
+    parser = argparse.ArgumentParser(description="Compile the collection templates into Python modules")
+    parser.add_argument("--templates", default="templates", help="The templates directory")
+    parser.add_argument("--output", default=COMPILED_TEMPLATES_DIRECTORY_NAME, help="The output directory")
+    args = parser.parse_args()
+
+    compiled_templates = compile_templates_directory(
+        templates_directory=args.templates,
+        compiled_directory=args.output,
+        environment=Templar(loader=DataLoader()).environment,
+    )
+
+    for relative_path in compiled_templates:
+        print(f"COMPILED: {relative_path}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,318 @@
+"""
+Persistent cache of rendered templates, keyed by the template source, the template variables, and the network OS
+
+The cache is a SQLite database shared by forks and later playbook runs, so unchanged configs are not rendered again.
+With the RENDER_DEDUP setting the same cache is kept in the temporary directory of the playbook run instead, so hosts
+that share ACLs, like ones from group_vars, reuse the render of the first host instead of rendering the same text again
+
+Both are opt-in, a cached render is only correct for templates whose output depends on nothing but the template
+variables, not on lookups, the time, or other state outside them
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
+
+from ansible import constants as C
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.bytecode_cache import (
+    runtime_versions,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    get_bool_setting,
+    get_int_setting,
+    get_setting,
+)
+
+RENDER_CACHE_FILE_NAME = "render_cache.sqlite3"
+RENDER_CACHE_DEFAULT_MAX_SIZE = 100 * 1024 * 1024
+RUN_RENDER_CACHE_DIRECTORY_NAME = "render_cache"
+RENDER_MODE_NATIVE = "native"
+RENDER_MODE_TEMPLAR = "templar"
+PLUGINS_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_PLUGINS_CHECKSUMS: Dict[str, str] = {}
+_PLUGINS_CHECKSUMS_LOCK = threading.Lock()
+
+
+def _json_default(value: Any) -> Any:
+    """Protected function to serialize the read only mappings the renderer layers over the template variables
+
+    :type value: Any
+    :param value: A value json does not know how to serialize
+
+    :rtype: Any
+    :returns: A dict of the mapping
+
+    :raises TypeError: If the value is not a mapping
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+
+    raise TypeError(f"'{type(value)}' can not be serialized")
+
+
+def plugins_checksum(plugins_directory: str = PLUGINS_DIRECTORY) -> str:
+    """Function to get a checksum of the Python code of the collection plugins, like the filters the templates call
+
+    It is computed once per process, the plugins do not change during a playbook run
+
+    :type plugins_directory: String
+    :param plugins_directory: The plugins directory of the collection
+
+    :rtype: String
+    :returns: The SHA-256 hex digest of the relative path and content of every Python file in the directory
+    """
+    with _PLUGINS_CHECKSUMS_LOCK:
+        checksum = _PLUGINS_CHECKSUMS.get(plugins_directory)
+
+        if checksum is None:
+            plugins_hash = hashlib.sha256()
+
+            for root, directories, files in os.walk(plugins_directory):
+                directories.sort()
+
+                for file_name in sorted(files):
+                    if not file_name.endswith(".py"):
+                        continue
+
+                    file_path = os.path.join(root, file_name)
+                    plugins_hash.update(os.path.relpath(file_path, plugins_directory).encode("utf-8") + b"\0")
+
+                    with open(file_path, "rb") as file:
+                        plugins_hash.update(file.read() + b"\0")
+
+            checksum = plugins_hash.hexdigest()
+            _PLUGINS_CHECKSUMS[plugins_directory] = checksum
+
+    return checksum
+
+
+def render_cache_key(
+    source_checksum: str, template_variables: Mapping, ansible_network_os: str, render_mode: str
+) -> Optional[str]:
+    """Function to get the cache key of a render
+
+    The template variables are canonicalized as JSON with sorted keys, so the key does not depend on the dict order.
+    The key also has the render mode and the checksum of the collection plugins, so a render is not reused by the
+    other environment, or after the filters the template calls have changed
+
+    :type source_checksum: String
+    :param source_checksum: The SHA-256 hex digest of the template source
+    :type template_variables: Mapping
+    :param template_variables: The variables to fill the template with
+    :type ansible_network_os: String
+    :param ansible_network_os: The ansible network os
+    :type render_mode: String
+    :param render_mode: The environment that renders the template Example: native or templar
+
+    :rtype: Optional[str]
+    :returns: The SHA-256 hex digest of the render, or None if the variables can not be canonicalized
+    """
+    try:
+        canonical_variables = json.dumps(
+            template_variables, sort_keys=True, separators=(",", ":"), default=_json_default
+        )
+
+    except (TypeError, ValueError):
+        return None
+
+    key_data = "\n".join(
+        [runtime_versions(), plugins_checksum(), render_mode, source_checksum, ansible_network_os, canonical_variables]
+    )
+
+    return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """Class for a SQLite cache of rendered templates, the least recently used renders are evicted by size
+
+    :type directory: String
+    :param directory: The directory to store the database in, it is created if needed
+    :type max_size: Integer
+    :param max_size: The maximum total size in bytes of the cached renders
+
+    :rtype: None
+    :returns: Nothing
+
+    :raises ValueError: If max_size is less than 1
+    """
+
+    def __init__(self, directory: str, max_size: int = RENDER_CACHE_DEFAULT_MAX_SIZE) -> None:
+        if max_size < 1:
+            raise ValueError(f"'max_size' must be at least 1 but received {max_size}")
+
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._database_path = os.path.join(directory, RENDER_CACHE_FILE_NAME)
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Protected Method to get the database connection, a forked process opens its own
+
+        :rtype: sqlite3.Connection
+        :returns: The database connection
+        """
+        if self._connection is None or self._connection_pid != os.getpid():
+            connection = sqlite3.connect(self._database_path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS renders "
+                "(key TEXT PRIMARY KEY, rendered TEXT NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS renders_accessed ON renders (accessed)")
+            # The total size of the renders is kept in a single row, so set does not sum the table on every insert
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS renders_size "
+                "(id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "INSERT OR IGNORE INTO renders_size (id, total) SELECT 0, COALESCE(SUM(size), 0) FROM renders"
+            )
+
+            self._connection = connection
+            self._connection_pid = os.getpid()
+
+        return self._connection
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached render
+
+        :type key: String
+        :param key: The cache key of the render
+
+        :rtype: Optional[str]
+        :returns: The rendered template, or None on a miss
+        """
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT rendered FROM renders WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            connection.execute("UPDATE renders SET accessed = ? WHERE key = ?", (time.time(), key))
+
+        return row[0]
+
+    def set(self, key: str, rendered: str) -> None:
+        """Cache a render, evicting the least recently used renders while the cache is over max_size
+
+        :type key: String
+        :param key: The cache key of the render
+        :type rendered: String
+        :param rendered: The rendered template
+
+        :rtype: None
+        :returns: Nothing
+        """
+        size = len(rendered.encode("utf-8"))
+        if size > self._max_size:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                replaced = connection.execute("SELECT size FROM renders WHERE key = ?", (key,)).fetchone()
+                connection.execute(
+                    "INSERT OR REPLACE INTO renders (key, rendered, size, accessed) VALUES (?, ?, ?, ?)",
+                    (key, rendered, size, time.time()),
+                )
+                total_size = connection.execute("SELECT total FROM renders_size WHERE id = 0").fetchone()[0]
+                total_size += size - (replaced[0] if replaced else 0)
+
+                if total_size > self._max_size:
+                    rows = connection.execute("SELECT key, size FROM renders ORDER BY accessed")
+                    evicted_keys = []
+
+                    for evicted_key, evicted_size in rows:
+                        if total_size <= self._max_size:
+                            break
+
+                        if evicted_key != key:
+                            evicted_keys.append((evicted_key,))
+                            total_size -= evicted_size
+
+                    rows.close()
+                    connection.executemany("DELETE FROM renders WHERE key = ?", evicted_keys)
+
+                connection.execute("UPDATE renders_size SET total = ? WHERE id = 0", (total_size,))
+                connection.execute("COMMIT")
+
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def size(self) -> int:
+        """Get the total size in bytes of the cached renders
+
+        :rtype: Integer
+        :returns: The total size
+        """
+        with self._lock:
+            return self._connect().execute("SELECT total FROM renders_size WHERE id = 0").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every cached render
+
+        :rtype: None
+        :returns: Nothing
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                connection.execute("DELETE FROM renders")
+                connection.execute("UPDATE renders_size SET total = 0 WHERE id = 0")
+                connection.execute("COMMIT")
+
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+
+_RENDER_CACHES: Dict[str, RenderCache] = {}
+_RENDER_CACHES_LOCK = threading.Lock()
+
+
+def get_render_cache() -> Optional[RenderCache]:
+    """Function to get the render cache set by the RENDER_CACHE_PATH and RENDER_CACHE_MAX_SIZE settings
+
+    If RENDER_CACHE_PATH is not set and the RENDER_DEDUP setting is true, the cache is in the temporary directory of
+    the playbook run, which the forks of the run share and ansible removes when the run ends
+
+    :rtype: Optional[RenderCache]
+    :returns: The render cache, or None if the RENDER_CACHE_PATH setting is not set, and RENDER_DEDUP is not true
+    """
+    render_cache_path = get_setting("RENDER_CACHE_PATH")
+
+    if render_cache_path:
+        render_cache_path = os.path.abspath(os.path.expanduser(render_cache_path))
+
+    elif get_bool_setting("RENDER_DEDUP"):
+        render_cache_path = os.path.join(C.DEFAULT_LOCAL_TMP, RUN_RENDER_CACHE_DIRECTORY_NAME)
+
+    else:
+        return None
+
+    with _RENDER_CACHES_LOCK:
+        render_cache = _RENDER_CACHES.get(render_cache_path)
+
+        if render_cache is None:
+            render_cache = RenderCache(
+                directory=render_cache_path,
+                max_size=get_int_setting("RENDER_CACHE_MAX_SIZE", RENDER_CACHE_DEFAULT_MAX_SIZE),
+            )
+            _RENDER_CACHES[render_cache_path] = render_cache
+
+    return render_cache
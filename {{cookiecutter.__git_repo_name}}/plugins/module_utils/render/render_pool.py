@@ -0,0 +1,112 @@
+"""
+Render in a pool of forked processes, for hosts with too many ACLs to render in one Ansible worker
+
+The processes are forked after the template is found and compiled, so they start with the warm template caches of the
+parent, and only the shard bounds and the rendered text are sent between processes
+"""
+
+import multiprocessing
+import os
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+SHARDS_PER_PROCESS = 4
+
+# The smallest batch, in ACL entries, rendered in a pool. Forking and sending the rendered text back costs more than a
+# smaller batch takes to render in one process
+PARALLEL_MIN_BATCH = 20000
+
+_SHARD_FUNCTION: Optional[Callable[[int, int], Any]] = None
+_SHARD_FUNCTION_LOCK = threading.Lock()
+
+
+def available_processes() -> int:
+    """Function to get the number of cores this process can run on
+
+    :rtype: Integer
+    :returns: The number of cores
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def shard_bounds(item_count: int, shard_count: int) -> List[Tuple[int, int]]:
+    """Function to split a number of items into contiguous shards of near equal size
+
+    :type item_count: Integer
+    :param item_count: The number of items
+    :type shard_count: Integer
+    :param shard_count: The number of shards wanted, there are never more shards than items
+
+    :rtype: List[Tuple[int, int]]
+    :returns: The start and stop index of each shard, in order
+
+    :raises ValueError: If shard_count is less than 1
+    """
+    if shard_count < 1:
+        raise ValueError(f"'shard_count' must be at least 1 but received {shard_count}")
+
+    shard_count = min(shard_count, item_count)
+    bounds = []
+    start = 0
+
+    for shard in range(shard_count):
+        stop = start + item_count // shard_count + (1 if shard < item_count % shard_count else 0)
+        bounds.append((start, stop))
+        start = stop
+
+    return bounds
+
+
+def _run_shard(bounds: Tuple[int, int]) -> Any:
+    """Protected function run in a forked process to call the shard function inherited from the parent
+
+    :type bounds: Tuple[int, int]
+    :param bounds: The start and stop index of the shard
+
+    :rtype: Any
+    :returns: The result of the shard function
+    """
+    return _SHARD_FUNCTION(*bounds)
+
+
+def map_shards(shard_function: Callable[[int, int], Any], item_count: int, processes: int) -> List[Any]:
+    """Function to call a function for each shard of a number of items in a pool of forked processes
+
+    The function is inherited by the forked processes, so it does not need to be picklable, but its results do.
+    If there is one process, one item, or the platform can not fork, the shards are run in this process
+
+    :type shard_function: Callable[[int, int], Any]
+    :param shard_function: The function to call with the start and stop index of each shard
+    :type item_count: Integer
+    :param item_count: The number of items
+    :type processes: Integer
+    :param processes: The number of processes
+
+    :rtype: List[Any]
+    :returns: The results of the shards, in shard order
+
+    :raises ValueError: If processes is less than 1
+    """
+    global _SHARD_FUNCTION  # pylint: disable=global-statement
+
+    if processes < 1:
+        raise ValueError(f"'processes' must be at least 1 but received {processes}")
+
+    processes = min(processes, item_count)
+    if processes < 2 or "fork" not in multiprocessing.get_all_start_methods():
+        return [shard_function(start, stop) for start, stop in shard_bounds(item_count=item_count, shard_count=1)]
+
+    bounds = shard_bounds(item_count=item_count, shard_count=processes * SHARDS_PER_PROCESS)
+
+    with _SHARD_FUNCTION_LOCK:
+        _SHARD_FUNCTION = shard_function
+
+        try:
+            with multiprocessing.get_context("fork").Pool(processes=processes) as pool:
+                return pool.map(_run_shard, bounds, chunksize=1)
+
+        finally:
+            _SHARD_FUNCTION = None
@@ -0,0 +1,87 @@
+"""
+Settings for rendering, read from environment variables prefixed with the collection name
+
+Example: for the setting TEMPLATES_PATH the environment variable is NAMESPACE_NAME_TEMPLATES_PATH
+"""
+
+import os
+from typing import Optional
+
+COLLECTION_NAMESPACE, COLLECTION_NAME = "{{ cookiecutter.__git_repo_name }}".split(".")
+
+SETTINGS_PREFIX = f"{COLLECTION_NAMESPACE}_{COLLECTION_NAME}".upper()
+
+
+def setting_name(name: str) -> str:
+    """Function to get the environment variable name of a setting
+
+    :type name: String
+    :param name: The setting name Example: TEMPLATES_PATH
+
+    :rtype: String
+    :returns: The environment variable name
+    """
+    return f"{SETTINGS_PREFIX}_{name.upper()}"
+
+
+def get_setting(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Function to get a setting
+
+    :type name: String
+    :param name: The setting name Example: TEMPLATES_PATH
+    :type default: Optional[str] = None
+    :param default: The value if the setting is not set
+
+    :rtype: Optional[str]
+    :returns: The setting value
+    """
+    value = os.getenv(setting_name(name))
+
+    if value is None or value == "":
+        return default
+
+    return value
+
+
+def get_bool_setting(name: str, default: bool = False) -> bool:
+    """Function to get a boolean setting, true values are 1, true, yes, and on
+
+    :type name: String
+    :param name: The setting name Example: NATIVE_RENDER
+    :type default: Boolean
+    :param default: The value if the setting is not set
+
+    :rtype: Boolean
+    :returns: The setting value
+    """
+    value = get_setting(name)
+
+    if value is None:
+        return default
+
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_int_setting(name: str, default: int) -> int:
+    """Function to get an integer setting
+
+    :type name: String
+    :param name: The setting name Example: TEMPLATE_CACHE_SIZE
+    :type default: Integer
+    :param default: The value if the setting is not set
+
+    :rtype: Integer
+    :returns: The setting value
+
+    :raises ValueError: If the setting is not an integer
+    """
+    value = get_setting(name)
+
+    if value is None:
+        return default
+
+    try:
+        return int(value)
+
+    except ValueError as error:
+        raise ValueError(f"setting: {setting_name(name)} must be an integer but was '{value}'") from error
@@ -0,0 +1,227 @@
+"""
+Helpers to stream rendered templates line by line without building the whole string
+"""
+
+import hashlib
+import os
+import stat
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple
+
+FILE_BLOCK_SIZE = 1024 * 1024
+
+
+def iter_lines(chunks: Iterable[str], trailing_newlines: int = 0) -> Iterator[str]:
+    """Function to turn the chunks a template generates into lines
+
+    The lines are the same as calling splitlines() on the joined chunks, after padding the end with newlines so there
+    are at least trailing_newlines of them, like Templar.template does with preserve_trailing_newlines
+
+    :type chunks: Iterable[str]
+    :param chunks: The chunks a template generates
+    :type trailing_newlines: Integer
+    :param trailing_newlines: The number of newlines at the end of the template source
+
+    :rtype: Iterator[str]
+    :returns: The lines without line endings
+    """
+    pending = ""
+    rendered_newlines = 0
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+
+        stripped_chunk = chunk.rstrip("\n")
+        if stripped_chunk:
+            rendered_newlines = len(chunk) - len(stripped_chunk)
+
+        else:
+            rendered_newlines += len(chunk)
+
+        lines = (pending + chunk).splitlines(keepends=True)
+        pending = lines[-1]
+
+        # The last line is kept back if it is not finished, or if it ends with a "\r" that may be part of a "\r\n"
+        if pending.endswith("\r") or pending.splitlines()[0] == pending:
+            lines.pop()
+
+        else:
+            pending = ""
+
+        for line in lines:
+            yield line.splitlines()[0]
+
+    padding = max(trailing_newlines - rendered_newlines, 0)
+
+    if pending:
+        yield pending.splitlines()[0]
+        padding = max(padding - 1, 0)
+
+    for _ in range(padding):
+        yield ""
+
+
+def _write_encoded_lines(lines: Iterable[str], output_file: Optional[BinaryIO]) -> Tuple[int, int, str]:
+    """Protected function to write lines to a binary file as UTF-8, and checksum what is written
+
+    :type lines: Iterable[str]
+    :param lines: The lines without line endings
+    :type output_file: Optional[BinaryIO]
+    :param output_file: The file to write to, or None to only count and checksum the lines
+
+    :rtype: Tuple[int, int, str]
+    :returns: The number of lines, and bytes written, and the SHA-256 hex digest of what was written
+    """
+    line_count = 0
+    size = 0
+    checksum = hashlib.sha256()
+
+    for line in lines:
+        encoded_line = f"{line}\n".encode("utf-8")
+        if output_file is not None:
+            output_file.write(encoded_line)
+        checksum.update(encoded_line)
+        line_count += 1
+        size += len(encoded_line)
+
+    return line_count, size, checksum.hexdigest()
+
+
+def file_checksum(file_path: str) -> str:
+    """Function to get the SHA-256 hex digest of a file, it is read in blocks
+
+    :type file_path: String
+    :param file_path: The file
+
+    :rtype: String
+    :returns: The SHA-256 hex digest
+    """
+    checksum = hashlib.sha256()
+
+    with open(file_path, "rb") as input_file:
+        for block in iter(lambda: input_file.read(FILE_BLOCK_SIZE), b""):
+            checksum.update(block)
+
+    return checksum.hexdigest()
+
+
+def _has_content(file_stat: Optional[os.stat_result], file_path: str, size: int, checksum: str) -> bool:
+    """Protected function to check if a file already has some content
+
+    The file is only read when its size matches, a different size is always a change
+
+    :type file_stat: Optional[os.stat_result]
+    :param file_stat: The stat of the file, or None if it does not exist
+    :type file_path: String
+    :param file_path: The file
+    :type size: Integer
+    :param size: The size in bytes of the content
+    :type checksum: String
+    :param checksum: The SHA-256 hex digest of the content
+
+    :rtype: Boolean
+    :returns: If the file has the content
+    """
+    return file_stat is not None and file_stat.st_size == size and file_checksum(file_path=file_path) == checksum
+
+
+def _stat_file(file_path: str) -> Optional[os.stat_result]:
+    """Protected function to stat a file that may not exist
+
+    :type file_path: String
+    :param file_path: The file
+
+    :rtype: Optional[os.stat_result]
+    :returns: The stat of the file, or None if it does not exist
+    """
+    try:
+        return os.stat(file_path)
+
+    except FileNotFoundError:
+        return None
+
+
+def _create_temporary_file(file_path: str) -> Tuple[int, str]:
+    """Protected function to create a temporary file next to a file, with the mode a new file gets
+
+    The file is created with mode 0o666 so the kernel applies the umask, like it does for the file when it is opened
+    for writing, without changing the umask of the process
+
+    :type file_path: String
+    :param file_path: The absolute path of the file the temporary file is for
+
+    :rtype: Tuple[int, str]
+    :returns: The file descriptor opened for writing, and the path of the temporary file
+
+    :raises OSError: If the temporary file can not be created
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+    while True:
+        temporary_path = os.path.join(
+            os.path.dirname(file_path), f".{os.path.basename(file_path)}.{os.urandom(8).hex()}.tmp"
+        )
+
+        try:
+            return os.open(temporary_path, flags, 0o666), temporary_path
+
+        except FileExistsError:
+            continue
+
+
+def replace_lines(lines: Iterable[str], file_path: str, check_mode: bool = False) -> Tuple[int, str, bool]:
+    """Function to write lines to a file only if they are not what it already has
+
+    The lines are streamed to a temporary file next to the file and checksummed as they are written. If the file
+    already has the same content the temporary file is removed, otherwise it atomically replaces the file, keeping
+    the mode of the file it replaces. In check mode the lines are only checksummed, and nothing is written
+
+    :type lines: Iterable[str]
+    :param lines: The lines without line endings
+    :type file_path: String
+    :param file_path: The file to write to
+    :type check_mode: Boolean
+    :param check_mode: If the file is only compared to the lines, not written
+
+    :rtype: Tuple[int, str, bool]
+    :returns: The number of lines, the SHA-256 hex digest of the content, and if the file was, or would be, changed
+    """
+    file_path = os.path.abspath(file_path)
+
+    if check_mode:
+        line_count, size, checksum = _write_encoded_lines(lines=lines, output_file=None)
+        file_stat = _stat_file(file_path=file_path)
+
+        return (
+            line_count,
+            checksum,
+            not _has_content(file_stat=file_stat, file_path=file_path, size=size, checksum=checksum),
+        )
+
+    file_descriptor, temporary_path = _create_temporary_file(file_path=file_path)
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as output_file:
+            line_count, size, checksum = _write_encoded_lines(lines=lines, output_file=output_file)
+            output_file.flush()
+            os.fsync(output_file.fileno())
+
+        file_stat = _stat_file(file_path=file_path)
+
+        if _has_content(file_stat=file_stat, file_path=file_path, size=size, checksum=checksum):
+            os.unlink(temporary_path)
+            return line_count, checksum, False
+
+        # A new file keeps the mode the umask gave the temporary file
+        if file_stat is not None:
+            os.chmod(temporary_path, stat.S_IMODE(file_stat.st_mode))
+
+        os.replace(temporary_path, file_path)
+
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.unlink(temporary_path)
+
+        raise
+
+    return line_count, checksum, True
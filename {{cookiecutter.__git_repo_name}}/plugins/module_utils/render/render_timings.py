@@ -0,0 +1,174 @@
+"""
+Per stage timings of rendering, like finding the template, compiling it, and rendering it
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional
+
+RENDER_STAGES = ("find_directory", "find_template", "read", "compile", "validate", "render", "split")
+
+
+class RenderTimings:
+    """Class to record the monotonic time spent in each render stage, in total and for each rendered item
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._totals: Dict[str, float] = dict.fromkeys(RENDER_STAGES, 0.0)
+        self._items: List[Dict[str, float]] = []
+
+    def add(self, stage_name: str, seconds: float, item: Optional[int] = None) -> None:
+        """Add time spent elsewhere, like in another process, to a stage
+
+        :type stage_name: String
+        :param stage_name: The stage name
+        :type seconds: Float
+        :param seconds: The time spent
+        :type item: Optional[int]
+        :param item: The index of the rendered item the time was spent on
+
+        :rtype: None
+        :returns: Nothing
+        """
+        self._totals[stage_name] = self._totals.get(stage_name, 0.0) + seconds
+
+        if item is not None:
+            while len(self._items) <= item:
+                self._items.append({})
+
+            self._items[item][stage_name] = self._items[item].get(stage_name, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, stage_name: str, item: Optional[int] = None) -> Iterator[None]:
+        """Time the body of a with statement as a stage
+
+        :type stage_name: String
+        :param stage_name: The stage name
+        :type item: Optional[int]
+        :param item: The index of the rendered item the time is spent on
+
+        :rtype: Iterator[None]
+        :returns: A context manager
+        """
+        start = time.monotonic()
+
+        try:
+            yield
+
+        finally:
+            self.add(stage_name=stage_name, seconds=time.monotonic() - start, item=item)
+
+    def timed_iter(self, stage_name: str, iterable: Iterable, item: Optional[int] = None) -> Iterator:
+        """Time only the time spent producing the values of an iterable as a stage, not the time spent consuming them
+
+        :type stage_name: String
+        :param stage_name: The stage name
+        :type iterable: Iterable
+        :param iterable: The iterable to time
+        :type item: Optional[int]
+        :param item: The index of the rendered item the time is spent on
+
+        :rtype: Iterator
+        :returns: The values of the iterable
+        """
+        iterator = iter(iterable)
+        seconds = 0.0
+
+        try:
+            while True:
+                start = time.monotonic()
+
+                try:
+                    value = next(iterator)
+
+                except StopIteration:
+                    return
+
+                finally:
+                    seconds += time.monotonic() - start
+
+                yield value
+
+        finally:
+            self.add(stage_name=stage_name, seconds=seconds, item=item)
+
+    def totals(self) -> Dict[str, float]:
+        """Get the total time spent in each stage
+
+        :rtype: Dict[str, float]
+        :returns: The seconds spent in each stage
+        """
+        return {stage_name: round(seconds, 6) for stage_name, seconds in self._totals.items()}
+
+    def items(self) -> List[Dict[str, float]]:
+        """Get the time spent in each stage for each rendered item
+
+        :rtype: List[Dict[str, float]]
+        :returns: The seconds spent in each stage, in the order of the rendered items
+        """
+        return [
+            {stage_name: round(seconds, 6) for stage_name, seconds in item_timings.items()}
+            for item_timings in self._items
+        ]
+
+
+class DisabledRenderTimings(RenderTimings):
+    """Class for render timings that record nothing, so timing costs close to nothing when it is not wanted
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    enabled = False
+
+    _NULL_CONTEXT = nullcontext()
+
+    def stage(self, stage_name: str, item: Optional[int] = None) -> ContextManager[None]:
+        """Do not time the body of a with statement
+
+        :type stage_name: String
+        :param stage_name: The stage name
+        :type item: Optional[int]
+        :param item: The index of the rendered item the time is spent on
+
+        :rtype: ContextManager[None]
+        :returns: A context manager that does nothing
+        """
+        return self._NULL_CONTEXT
+
+    def add(self, stage_name: str, seconds: float, item: Optional[int] = None) -> None:
+        """Do not add time to a stage
+
+        :type stage_name: String
+        :param stage_name: The stage name
+        :type seconds: Float
+        :param seconds: The time spent
+        :type item: Optional[int]
+        :param item: The index of the rendered item the time was spent on
+
+        :rtype: None
+        :returns: Nothing
+        """
+
+    def timed_iter(self, stage_name: str, iterable: Iterable, item: Optional[int] = None) -> Iterable:
+        """Do not time an iterable
+
+        :type stage_name: String
+        :param stage_name: The stage name
+        :type iterable: Iterable
+        :param iterable: The iterable
+        :type item: Optional[int]
+        :param item: The index of the rendered item the time is spent on
+
+        :rtype: Iterable
+        :returns: The iterable as it is
+        """
+        return iterable
+
+
+DISABLED_RENDER_TIMINGS = DisabledRenderTimings()
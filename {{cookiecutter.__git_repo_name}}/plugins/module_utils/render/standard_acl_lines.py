@@ -0,0 +1,135 @@
+"""
+Config lines of standard ACLs, the same lines as the collection standard_acl.j2 templates with every source normalized
+for the network OS, so a whole ACL is rendered in one Python call instead of a loop run by Jinja
+"""
+
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Optional, Union
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.normalizers.ansible_network_os_normalizers import (
+    network_os_normalize,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.normalizers.conversion_normalizers import (
+    acl_source_to_cidr,
+    eos_standard_acl_ipv4_subnet_normalizer,
+    ios_standard_acl_ipv4_subnet_normalizer,
+    iosxr_standard_acl_ipv4_subnet_normalizer,
+)
+
+
+def _nxos_standard_acl_ipv4_subnet_normalizer(value: str) -> str:
+    """Protected function for NX-OS, it takes subnets in CIDR notation as they are
+
+    :type value: String
+    :param value: Value to convert Example: 192.168.1.0/24
+
+    :rtype: String
+    :returns: The value as it is
+    """
+    return value
+
+
+# The ACL and entry syntax of each network OS, the entries are the same as the collection standard_acl.j2 templates
+STANDARD_ACL_SYNTAX: Dict[str, Dict[str, Union[str, Callable[[str], str]]]] = {
+    "ios": {
+        "acl": "ip access-list standard {name}",
+        "entry": "{sequence} {action} {source}{options}",
+        "normalizer": ios_standard_acl_ipv4_subnet_normalizer,
+    },
+    "iosxr": {
+        "acl": "ipv4 access-list {name}",
+        "entry": "{sequence} {action} ipv4 {source} any{options}",
+        "normalizer": iosxr_standard_acl_ipv4_subnet_normalizer,
+    },
+    "nxos": {
+        "acl": "ip access-list {name}",
+        "entry": "{sequence} {action} {source} any{options}",
+        "normalizer": _nxos_standard_acl_ipv4_subnet_normalizer,
+    },
+    "eos": {
+        "acl": "ip access-list standard {name}",
+        "entry": "{sequence} {action} {source}{options}",
+        "normalizer": eos_standard_acl_ipv4_subnet_normalizer,
+    },
+}
+
+
+def _entry_options(value: Optional[str]) -> str:
+    """Protected function to get the options appended to the end of an entry, as the templates append them
+
+    :type value: Optional[str]
+    :param value: The string to append Example: " log"
+
+    :rtype: String
+    :returns: The string to append to the entry
+    """
+    return value or ""
+
+
+def standard_acl_entry_command(sequence: Mapping, ansible_network_os: str) -> str:
+    """Function to get the command of a standard ACL entry, with the subnet normalized for the network OS
+
+    :type sequence: Mapping
+    :param sequence: The entry Example: {"sequence": 10, "action": "permit", "source": "192.168.1.0/24"}
+    :type ansible_network_os: String
+    :param ansible_network_os: The ansible network os
+
+    :rtype: String
+    :returns: The command Example: 10 permit 192.168.1.0 0.0.0.255
+
+    :raises AnsiblePluginError: If the network os is not supported, or the source can not be normalized
+    """
+    return entry_command(sequence=sequence, syntax=STANDARD_ACL_SYNTAX[network_os_normalize(ansible_network_os)])
+
+
+def standard_acl_config_lines(acl: Mapping, ansible_network_os: str) -> List[str]:
+    """Function to get the config lines of a standard ACL, the same lines as the collection standard_acl.j2 templates
+    with every source normalized for the network OS
+
+    :type acl: Mapping
+    :param acl: The ACL Example: {"name": "MGMT", "sequences": [{"sequence": 10, "action": "permit",
+                "source": "192.168.1.0/24"}]}
+    :type ansible_network_os: String
+    :param ansible_network_os: The ansible network os
+
+    :rtype: List[str]
+    :returns: The lines Example: ["ip access-list standard MGMT", " 10 permit 192.168.1.0 0.0.0.255"]
+
+    :raises AnsiblePluginError: If the network os is not supported, or a source can not be normalized
+    """
+    syntax = STANDARD_ACL_SYNTAX[network_os_normalize(ansible_network_os)]
+    lines = [syntax["acl"].format(name=acl.get("name"))]
+    lines.extend(f" {entry_command(sequence=sequence, syntax=syntax)}" for sequence in acl.get("sequences") or [])
+
+    return lines
+
+
+def entry_command(sequence: Mapping, syntax: Mapping) -> str:
+    """Function to get the command of a standard ACL entry with the syntax of a network OS
+
+    :type sequence: Mapping
+    :param sequence: The entry, or an entry parsed from a running config with the line the model can not express
+    :type syntax: Mapping
+    :param syntax: The syntax of the network OS from STANDARD_ACL_SYNTAX
+
+    :rtype: String
+    :returns: The command
+
+    :raises AnsiblePluginError: If the source can not be normalized
+    """
+    if sequence.get("action") == "remark":
+        return f"{sequence.get('sequence')} remark {sequence.get('remark')}"
+
+    if "line" in sequence:
+        return f"{sequence.get('sequence')} {sequence.get('line')}"
+
+    source = sequence.get("source")
+    if source != "any":
+        source = syntax["normalizer"](acl_source_to_cidr(source))
+
+    return syntax["entry"].format(
+        sequence=sequence.get("sequence"),
+        action=sequence.get("action"),
+        source=source,
+        options=_entry_options(sequence.get("append_option_to_end")),
+    )
@@ -0,0 +1,332 @@
+"""
+Process wide cache of compiled Jinja2 templates
+"""
+
+import hashlib
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from types import CodeType
+from typing import Dict, Optional, Tuple, Protocol
+
+from jinja2 import Environment, Template
+from jinja2.bccache import BytecodeCache
+from ansible.template import JINJA2_OVERRIDE
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_timings import (
+    DISABLED_RENDER_TIMINGS,
+    RenderTimings,
+)
+
+
+def has_override_header(source: str) -> bool:
+    """Function to check if a template source starts with a #jinja2: header that overrides environment settings
+
+    Only Templar.template applies the header, with an overlay of its environment, so such a template is not compiled
+
+    :type source: String
+    :param source: The template source
+
+    :rtype: Boolean
+    :returns: If the source has the header
+    """
+    return source.startswith(JINJA2_OVERRIDE)
+
+
+class TemplateLoader(Protocol):
+    """Protocol for a loader of already compiled templates, like PrecompiledTemplates"""
+
+    def load_code(self, environment: Environment, template_path: str, source: str) -> Optional[CodeType]:
+        """Load the code of a compiled template, or return None if there is none"""
+
+
+class CompiledTemplate:
+    """Class for a compiled template held in the cache
+
+    Only the compiled code is shared. The globals of a Templar environment, like lookup and query, are bound to that
+    Templar, so each environment that renders the template gets its own template made from the code
+
+    :type template: Optional[jinja2.Template]
+    :param template: The compiled Jinja2 template, bound to the environment it was compiled with, None if the source
+                     has a #jinja2: override header
+    :type template_path: String
+    :param template_path: The absolute path of the template source
+    :type trailing_newlines: Integer
+    :param trailing_newlines: The number of newlines at the end of the template source
+    :type source_checksum: String
+    :param source_checksum: The SHA-256 hex digest of the template source
+    :type code: Optional[CodeType] = None
+    :param code: The compiled code of the template, to bind it to other environments
+    :type override_source: Optional[str] = None
+    :param override_source: The source of a template with a #jinja2: override header, rendered with Templar.template
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    __slots__ = (
+        "template",
+        "template_path",
+        "trailing_newlines",
+        "source_checksum",
+        "code",
+        "override_source",
+        "_bound",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        template: Optional[Template],
+        template_path: str,
+        trailing_newlines: int,
+        source_checksum: str,
+        code: Optional[CodeType] = None,
+        override_source: Optional[str] = None,
+    ) -> None:
+        self.template = template
+        self.template_path = template_path
+        self.trailing_newlines = trailing_newlines
+        self.source_checksum = source_checksum
+        self.code = code
+        self.override_source = override_source
+        self._bound: "weakref.WeakKeyDictionary[Environment, Template]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def bind(self, environment: Environment) -> Template:
+        """Get the template bound to an environment, so it renders with the globals of that environment
+
+        :type environment: jinja2.Environment
+        :param environment: The environment to render with
+
+        :rtype: jinja2.Template
+        :returns: The template, made from the shared code once per environment
+        """
+        if environment is self.template.environment or self.code is None:
+            return self.template
+
+        with self._lock:
+            template = self._bound.get(environment)
+
+            if template is None:
+                template = environment.template_class.from_code(environment, self.code, environment.make_globals(None))
+                self._bound[environment] = template
+
+        return template
+
+
+class CompiledTemplateCache:
+    """Class for a bounded LRU cache of compiled templates
+
+    Entries are keyed by the absolute path of the template plus its mtime and size, so an edited template is
+    compiled again on the next lookup.
+
+    :type max_size: Integer
+    :param max_size: The maximum number of compiled templates to hold
+
+    :rtype: None
+    :returns: Nothing
+
+    :raises ValueError: If max_size is less than 1
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        if max_size < 1:
+            raise ValueError(f"'max_size' must be at least 1 but received {max_size}")
+
+        self._max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, int, int], CompiledTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytecode_loads = 0
+        self._precompiled_loads = 0
+
+    @staticmethod
+    def _read_source(template_path: str) -> str:
+        """Protected Static Method to read a template source
+
+        :type template_path: String
+        :param template_path: The path to the template
+
+        :rtype: String
+        :returns: The template source
+        """
+        with open(template_path, "r") as template_file:
+            return template_file.read()
+
+    @staticmethod
+    def _count_trailing_newlines(source: str) -> int:
+        """Protected Static Method to count the newlines at the end of a template source
+
+        :type source: String
+        :param source: The template source
+
+        :rtype: Integer
+        :returns: The number of trailing newlines
+        """
+        return len(source) - len(source.rstrip("\n"))
+
+    def _compile(
+        self,
+        environment: Environment,
+        source: str,
+        template_path: str,
+        bytecode_cache: Optional[BytecodeCache] = None,
+        precompiled_templates: Optional[TemplateLoader] = None,
+    ) -> CodeType:
+        """Protected Method to compile a template source, precompiled templates are used first, then the bytecode cache
+
+        :type environment: jinja2.Environment
+        :param environment: The environment to compile with
+        :type source: String
+        :param source: The template source
+        :type template_path: String
+        :param template_path: The absolute path of the template source
+        :type bytecode_cache: Optional[jinja2.bccache.BytecodeCache]
+        :param bytecode_cache: A bytecode cache to load the compiled code from, and store it in
+        :type precompiled_templates: Optional[TemplateLoader]
+        :param precompiled_templates: A loader of templates compiled ahead of time
+
+        :rtype: CodeType
+        :returns: The compiled code of the template
+        """
+        name = os.path.basename(template_path)
+
+        if precompiled_templates is not None:
+            code = precompiled_templates.load_code(environment=environment, template_path=template_path, source=source)
+
+            if code is not None:
+                self._precompiled_loads += 1
+                return code
+
+        if bytecode_cache is None:
+            code = environment.compile(source, name=name, filename=template_path)
+
+        else:
+            bucket = bytecode_cache.get_bucket(environment, name, template_path, source)
+            code = bucket.code
+
+            if code is None:
+                code = environment.compile(source, name=name, filename=template_path)
+                bucket.code = code
+                bytecode_cache.set_bucket(bucket)
+
+            else:
+                self._bytecode_loads += 1
+
+        return code
+
+    def get_template(
+        self,
+        template_path: str,
+        environment: Environment,
+        bytecode_cache: Optional[BytecodeCache] = None,
+        precompiled_templates: Optional[TemplateLoader] = None,
+        timings: RenderTimings = DISABLED_RENDER_TIMINGS,
+    ) -> CompiledTemplate:
+        """Get a compiled template, compiling it on a miss
+
+        :type template_path: String
+        :param template_path: The path to the template
+        :type environment: jinja2.Environment
+        :param environment: The environment to compile with on a miss
+        :type bytecode_cache: Optional[jinja2.bccache.BytecodeCache]
+        :param bytecode_cache: A bytecode cache to use on a miss before compiling
+        :type precompiled_templates: Optional[TemplateLoader]
+        :param precompiled_templates: A loader of templates compiled ahead of time to use on a miss before compiling
+        :type timings: RenderTimings
+        :param timings: The timings to record the read and compile stages of a miss in
+
+        :rtype: CompiledTemplate
+        :returns: The compiled template
+
+        :raises FileNotFoundError: If the template does not exist
+        """
+        absolute_path = os.path.abspath(template_path)
+        stat_result = os.stat(absolute_path)
+        key = (absolute_path, stat_result.st_mtime_ns, stat_result.st_size)
+
+        with self._lock:
+            compiled_template = self._entries.get(key)
+
+            if compiled_template is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return compiled_template
+
+            self._misses += 1
+
+        with timings.stage("read"):
+            source = self._read_source(absolute_path)
+
+        if has_override_header(source):
+            code = None
+            template = None
+
+        else:
+            with timings.stage("compile"):
+                code = self._compile(
+                    environment=environment,
+                    source=source,
+                    template_path=absolute_path,
+                    bytecode_cache=bytecode_cache,
+                    precompiled_templates=precompiled_templates,
+                )
+                template = environment.template_class.from_code(environment, code, environment.make_globals(None))
+
+        compiled_template = CompiledTemplate(
+            template=template,
+            template_path=absolute_path,
+            trailing_newlines=self._count_trailing_newlines(source),
+            source_checksum=hashlib.sha256(source.encode("utf-8")).hexdigest(),
+            code=code,
+            override_source=source if template is None else None,
+        )
+
+        with self._lock:
+            # Another thread may have compiled the same template, keep the first one so everyone shares it
+            compiled_template = self._entries.setdefault(key, compiled_template)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return compiled_template
+
+    def clear(self) -> None:
+        """Clear the cache, and reset the counters
+
+        :rtype: None
+        :returns: Nothing it clears the cache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._bytecode_loads = 0
+            self._precompiled_loads = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get the cache counters
+
+        :rtype: Dict[str, int]
+        :returns: The hits, misses, evictions, bytecode_loads, precompiled_loads, size, and max_size of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "bytecode_loads": self._bytecode_loads,
+                "precompiled_loads": self._precompiled_loads,
+                "size": len(self._entries),
+                "max_size": self._max_size,
+            }
+
+
+COMPILED_TEMPLATE_CACHE = CompiledTemplateCache()
@@ -0,0 +1,233 @@
+"""
+In memory index of a templates directory, so finding a template does not probe the filesystem
+"""
+
+import os
+import threading
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    get_int_setting,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.tracing.tracer import (
+    get_tracer,
+)
+
+ResolveKey = Tuple[str, Optional[str], Optional[str], Optional[str], str]
+
+
+def template_relative_paths(
+    network_os: str,
+    template_name: str,
+    solution: Optional[str] = None,
+    family: Optional[str] = None,
+    model: Optional[str] = None,
+) -> List[str]:
+    """Function to build the relative template paths from most specific to least specific
+
+    :type network_os: String
+    :param network_os: The normalized network os
+    :type template_name: String
+    :param template_name: The name of the template
+    :type solution: Optional[str]
+    :param solution: A specific solution of config
+    :type family: Optional[str]
+    :param family: A specific family of hardware, like Cat9K, or something
+    :type model: Optional[str]
+    :param model: The hardware model, like WS-C3560G-48TS-E or something
+
+    :rtype: List[str]
+    :returns: The relative paths, paths that need a value that was not given are left out
+    """
+    possible_parts = [
+        (network_os, solution, family, model, template_name),
+        (network_os, solution, family, "main", template_name),
+        (network_os, solution, "main", template_name),
+        (network_os, family, model, template_name),
+        (network_os, family, "main", template_name),
+        (network_os, "main", template_name),
+    ]
+
+    return ["/".join(parts) for parts in possible_parts if None not in parts]
+
+
+class TemplateIndex:
+    """Class for an index of every template file in a templates directory
+
+    The directory tree is scanned once, and scanned again only when the mtime of one of its directories changes.
+    The mtimes are checked at most once every check_interval seconds.
+
+    :type templates_directory: String
+    :param templates_directory: The templates directory to index
+    :type check_interval: Integer
+    :param check_interval: The seconds between checks of the directory mtimes
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    def __init__(self, templates_directory: str, check_interval: int = 5) -> None:
+        self._templates_directory = os.path.abspath(templates_directory)
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._tracer = get_tracer()
+        self._files: FrozenSet[str] = frozenset()
+        self._directory_mtimes: Dict[str, int] = {}
+        self._resolved: Dict[ResolveKey, Optional[str]] = {}
+        self._last_checked = 0.0
+        self._builds = 0
+
+        self._build()
+
+    @property
+    def templates_directory(self) -> str:
+        """The indexed templates directory"""
+        return self._templates_directory
+
+    @property
+    def builds(self) -> int:
+        """The number of times the directory tree was scanned"""
+        return self._builds
+
+    def _build(self) -> None:
+        """Protected Method to scan the directory tree into the index
+
+        :rtype: None
+        :returns: Nothing it builds the index
+        """
+        files = set()
+        directory_mtimes = {}
+
+        for directory, _, file_names in os.walk(self._templates_directory):
+            directory_mtimes[directory] = os.stat(directory).st_mtime_ns
+            relative_directory = os.path.relpath(directory, self._templates_directory).replace(os.sep, "/")
+
+            for file_name in file_names:
+                if relative_directory == ".":
+                    files.add(file_name)
+
+                else:
+                    files.add(f"{relative_directory}/{file_name}")
+
+        self._files = frozenset(files)
+        self._directory_mtimes = directory_mtimes
+        self._resolved = {}
+        self._last_checked = time.monotonic()
+        self._builds += 1
+        self._tracer.v(lambda: f"INDEXED: templates_dir {self._templates_directory} templates {len(self._files)}")
+
+    def _is_stale(self) -> bool:
+        """Protected Method to check if the directory tree changed since the last scan
+
+        :rtype: Boolean
+        :returns: True if a directory was added, removed, or changed
+        """
+        for directory, mtime in self._directory_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return True
+
+            except OSError:
+                return True
+
+        return False
+
+    def _refresh(self) -> None:
+        """Protected Method to scan the directory tree again if it changed
+
+        :rtype: None
+        :returns: Nothing it refreshes the index if needed
+        """
+        now = time.monotonic()
+        if now - self._last_checked < self._check_interval:
+            return
+
+        self._last_checked = now
+
+        if self._is_stale():
+            self._build()
+
+    def resolve(
+        self,
+        network_os: str,
+        template_name: str,
+        solution: Optional[str] = None,
+        family: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Optional[str]:
+        """Resolve a template from most specific to least specific, misses are remembered too
+
+        :type network_os: String
+        :param network_os: The normalized network os
+        :type template_name: String
+        :param template_name: The name of the template
+        :type solution: Optional[str]
+        :param solution: A specific solution of config
+        :type family: Optional[str]
+        :param family: A specific family of hardware, like Cat9K, or something
+        :type model: Optional[str]
+        :param model: The hardware model, like WS-C3560G-48TS-E or something
+
+        :rtype: Optional[str]
+        :returns: The absolute path of the template, or None
+        """
+        key = (network_os, solution, family, model, template_name)
+
+        with self._lock:
+            self._refresh()
+
+            if key in self._resolved:
+                return self._resolved[key]
+
+            found_template = None
+            for relative_path in template_relative_paths(
+                network_os=network_os, template_name=template_name, solution=solution, family=family, model=model
+            ):
+                if relative_path in self._files:
+                    found_template = os.path.join(self._templates_directory, *relative_path.split("/"))
+                    break
+
+            self._resolved[key] = found_template
+
+        return found_template
+
+
+_TEMPLATE_INDEXES: Dict[str, TemplateIndex] = {}
+_TEMPLATE_INDEXES_LOCK = threading.Lock()
+
+
+def get_template_index(templates_directory: str) -> TemplateIndex:
+    """Function to get the shared index of a templates directory
+
+    The TEMPLATE_INDEX_CHECK_INTERVAL setting controls the seconds between checks for changes
+
+    :type templates_directory: String
+    :param templates_directory: The templates directory
+
+    :rtype: TemplateIndex
+    :returns: The index of the templates directory
+    """
+    templates_directory = os.path.abspath(templates_directory)
+
+    with _TEMPLATE_INDEXES_LOCK:
+        template_index = _TEMPLATE_INDEXES.get(templates_directory)
+
+        if template_index is None:
+            template_index = TemplateIndex(
+                templates_directory=templates_directory,
+                check_interval=get_int_setting("TEMPLATE_INDEX_CHECK_INTERVAL", 5),
+            )
+            _TEMPLATE_INDEXES[templates_directory] = template_index
+
+    return template_index
+
+
+def clear_template_indexes() -> None:
+    """Function to forget every templates directory index
+
+    :rtype: None
+    :returns: Nothing it clears the indexes
+    """
+    with _TEMPLATE_INDEXES_LOCK:
+        _TEMPLATE_INDEXES.clear()
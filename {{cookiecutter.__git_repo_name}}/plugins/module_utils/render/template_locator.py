@@ -0,0 +1,119 @@
+"""
+Locate the templates directory of this collection
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    COLLECTION_NAMESPACE,
+    COLLECTION_NAME,
+    get_setting,
+    setting_name,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.tracing.tracer import (
+    get_tracer,
+)
+
+_TEMPLATES_DIRECTORY_CACHE: Dict[Tuple[Optional[str], Optional[str]], Optional[str]] = {}
+_TEMPLATES_DIRECTORY_LOCK = threading.Lock()
+
+
+def templates_directory_candidates(
+    namespace: str = COLLECTION_NAMESPACE, collection: str = COLLECTION_NAME
+) -> List[str]:
+    """Function to build the list of possible templates directories in search order
+
+    :type namespace: String
+    :param namespace: The collection namespace
+    :type collection: String
+    :param collection: The collection name
+
+    :rtype: List[str]
+    :returns: The possible templates directories
+    """
+    # The collection this code was loaded from is the most likely match
+    possible_directories = [
+        os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir, "templates"))
+    ]
+
+    possible_paths = []
+
+    #  SEE: https://docs.ansible.com/ansible/latest/reference_appendices/config.html#collections-paths
+    if os.getenv("ANSIBLE_COLLECTIONS_PATH"):
+        possible_paths.extend(os.getenv("ANSIBLE_COLLECTIONS_PATH").split(os.pathsep))
+
+    else:
+        possible_paths.append("/usr/share/ansible/collections")
+
+    possible_paths.extend(
+        [
+            "/usr/local/share/ansible/collections",
+            "/etc/ansible/collections",
+            os.path.join(os.path.expanduser("~"), ".ansible", "collections"),
+            os.path.join(os.path.abspath("."), "collections"),
+        ]
+    )
+
+    for base_path in possible_paths:
+        possible_directories.append(os.path.join(base_path, "ansible_collections", namespace, collection, "templates"))
+
+    return possible_directories
+
+
+def find_templates_directory() -> Optional[str]:
+    """Function to find the templates directory of this collection
+
+    The answer is resolved once per process, and reused until the TEMPLATES_PATH setting, or
+    ANSIBLE_COLLECTIONS_PATH changes
+
+    :rtype: Optional[str]
+    :returns: A found path, or None
+
+    :raises FileNotFoundError: If the TEMPLATES_PATH setting is not a directory
+    """
+    templates_path_setting = get_setting("TEMPLATES_PATH")
+    key = (templates_path_setting, os.getenv("ANSIBLE_COLLECTIONS_PATH"))
+
+    with _TEMPLATES_DIRECTORY_LOCK:
+        if key in _TEMPLATES_DIRECTORY_CACHE:
+            return _TEMPLATES_DIRECTORY_CACHE[key]
+
+        tracer = get_tracer()
+
+        if templates_path_setting:
+            if not os.path.isdir(templates_path_setting):
+                raise FileNotFoundError(
+                    f"{setting_name('TEMPLATES_PATH')}: '{templates_path_setting}' is not a directory!"
+                )
+
+            templates_directory = os.path.abspath(templates_path_setting)
+            tracer.v(lambda: f"SETTING: templates_dir {templates_directory}")
+
+        else:
+            templates_directory = None
+
+            for possible_directory in templates_directory_candidates():
+                tracer.v(lambda: f"CHECK: templates_dir {possible_directory}")
+                if os.path.isdir(possible_directory):
+                    templates_directory = possible_directory
+                    tracer.v(lambda: f"FOUND: templates_dir {templates_directory}")
+                    break
+
+            else:
+                tracer.v(lambda: f"NOT FOUND: templates_dir {None}")
+
+        _TEMPLATES_DIRECTORY_CACHE[key] = templates_directory
+
+    return templates_directory
+
+
+def clear_templates_directory_cache() -> None:
+    """Function to forget the resolved templates directory
+
+    :rtype: None
+    :returns: Nothing it clears the cache
+    """
+    with _TEMPLATES_DIRECTORY_LOCK:
+        _TEMPLATES_DIRECTORY_CACHE.clear()
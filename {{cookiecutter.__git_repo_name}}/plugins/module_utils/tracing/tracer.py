@@ -0,0 +1,321 @@
+"""
+Structured tracing of where controller time goes, written as JSON lines to the file set by the TRACE_PATH setting
+
+When tracing is disabled, spans are a shared object that does nothing, and verbose messages are only built if the
+Ansible verbosity is high enough to show them
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from ansible.utils.display import Display
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    get_setting,
+)
+
+
+class NullSpan:
+    """Class for a span of a disabled tracer, it does nothing
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+    def set(self, name: str, value: Any) -> None:
+        """Do not set an attribute on the span
+
+        :type name: String
+        :param name: The attribute name
+        :type value: Any
+        :param value: The attribute value
+
+        :rtype: None
+        :returns: Nothing
+        """
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span:
+    """Class for a timed span, the trace event is written when the span ends
+
+    :type tracer: Tracer
+    :param tracer: The tracer to write the trace event with
+    :type name: String
+    :param name: The span name
+    :type host: Optional[str]
+    :param host: The host the span is for, defaults to the host of the enclosing span
+    :type attributes: Dict
+    :param attributes: The span attributes
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    __slots__ = ("_tracer", "_name", "_host", "_parent", "_attributes", "_start_time", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, host: Optional[str], attributes: Dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._host = host
+        self._parent: Optional[Span] = None
+        self._attributes = attributes
+        self._start_time = 0.0
+        self._start = 0.0
+
+    @property
+    def name(self) -> str:
+        """The span name"""
+        return self._name
+
+    @property
+    def host(self) -> Optional[str]:
+        """The host the span is for"""
+        return self._host
+
+    def set(self, name: str, value: Any) -> None:
+        """Set an attribute on the span
+
+        :type name: String
+        :param name: The attribute name
+        :type value: Any
+        :param value: The attribute value
+
+        :rtype: None
+        :returns: Nothing
+        """
+        self._attributes[name] = value
+
+    def __enter__(self) -> "Span":
+        self._parent = self._tracer.current_span()
+
+        if self._host is None and self._parent is not None:
+            self._host = self._parent.host
+
+        self._tracer.push_span(span=self)
+        self._start_time = time.time()
+        self._start = time.monotonic()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        duration = time.monotonic() - self._start
+        self._tracer.pop_span()
+
+        if exc_type is not None:
+            self._attributes["error"] = exc_type.__name__
+
+        self._tracer.write_event(
+            {
+                "time": self._start_time,
+                "span": self._name,
+                "parent": None if self._parent is None else self._parent.name,
+                "host": self._host,
+                "duration": duration,
+                "attributes": self._attributes,
+            }
+        )
+
+
+class Tracer:
+    """Class for a tracer writing JSON lines trace events to a file
+
+    :type trace_path: Optional[str]
+    :param trace_path: The file to append the trace events to, tracing is disabled if None
+
+    :rtype: None
+    :returns: Nothing
+    """
+
+    def __init__(self, trace_path: Optional[str] = None) -> None:
+        self._trace_path = trace_path
+        self._display = Display()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._trace_file = None
+        self._trace_file_pid: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        """If the tracer writes trace events"""
+        return self._trace_path is not None
+
+    def _stack(self) -> List[Span]:
+        """Protected Method to get the span stack of the current thread
+
+        :rtype: List[Span]
+        :returns: The open spans, innermost last
+        """
+        stack = getattr(self._local, "stack", None)
+
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+
+        return stack
+
+    def current_span(self) -> Optional[Span]:
+        """Get the innermost open span of the current thread
+
+        :rtype: Optional[Span]
+        :returns: The span, or None if there is no open span
+        """
+        stack = self._stack()
+
+        return stack[-1] if stack else None
+
+    def push_span(self, span: Span) -> None:
+        """Open a span in the current thread
+
+        :type span: Span
+        :param span: The span
+
+        :rtype: None
+        :returns: Nothing
+        """
+        self._stack().append(span)
+
+    def pop_span(self) -> None:
+        """Close the innermost span of the current thread
+
+        :rtype: None
+        :returns: Nothing
+        """
+        self._stack().pop()
+
+    def write_event(self, event: Dict[str, Any]) -> None:
+        """Write a trace event as a JSON line, a forked process opens the file again
+
+        :type event: Dict
+        :param event: The trace event
+
+        :rtype: None
+        :returns: Nothing
+        """
+        if not self.enabled:
+            return
+
+        event["pid"] = os.getpid()
+        line = json.dumps(event, default=str) + "\n"
+
+        with self._lock:
+            if self._trace_file is None or self._trace_file_pid != event["pid"]:
+                self._trace_file = open(self._trace_path, "a", buffering=1)
+                self._trace_file_pid = event["pid"]
+
+            self._trace_file.write(line)
+
+    def span(self, name: str, host: Optional[str] = None, **attributes: Any) -> Any:
+        """Get a span to time a with statement
+
+        :type name: String
+        :param name: The span name
+        :type host: Optional[str]
+        :param host: The host the span is for, defaults to the host of the enclosing span
+        :type attributes: Any
+        :param attributes: The span attributes
+
+        :rtype: Union[Span, NullSpan]
+        :returns: The span, or the shared NULL_SPAN if tracing is disabled
+        """
+        if self._trace_path is None:
+            return NULL_SPAN
+
+        return Span(tracer=self, name=name, host=host, attributes=attributes)
+
+    def traced(self, name: str) -> Callable[[Callable], Callable]:
+        """Decorator factory to trace every call of a function as a span, functions are returned as is if disabled
+
+        :type name: String
+        :param name: The span name
+
+        :rtype: Callable[[Callable], Callable]
+        :returns: The decorator
+        """
+
+        def decorator(function: Callable) -> Callable:
+            if self._trace_path is None:
+                return function
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def v(self, message: Callable[[], str]) -> None:
+        """Show a verbose message with -v, and write it as a trace event if tracing is enabled
+
+        The message is only built if it is going to be used
+
+        :type message: Callable[[], str]
+        :param message: A function building the message
+
+        :rtype: None
+        :returns: Nothing
+        """
+        if self._trace_path is None and self._display.verbosity < 1:
+            return
+
+        text = message()
+        self._display.v(text)
+
+        if self._trace_path is not None:
+            current_span = self.current_span()
+            self.write_event(
+                {
+                    "time": time.time(),
+                    "event": "log",
+                    "parent": None if current_span is None else current_span.name,
+                    "host": None if current_span is None else current_span.host,
+                    "attributes": {"message": text},
+                }
+            )
+
+
+# A tracer that writes nothing, for code that can run before it gets the tracer of the TRACE_PATH setting
+DISABLED_TRACER = Tracer()
+
+_TRACERS: Dict[Optional[str], Tracer] = {}
+_TRACERS_LOCK = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Function to get the process wide tracer of the TRACE_PATH setting
+
+    :rtype: Tracer
+    :returns: The tracer, it is disabled if the TRACE_PATH setting is not set
+    """
+    trace_path = get_setting("TRACE_PATH")
+
+    if trace_path:
+        trace_path = os.path.abspath(os.path.expanduser(trace_path))
+
+    else:
+        trace_path = None
+
+    with _TRACERS_LOCK:
+        tracer = _TRACERS.get(trace_path)
+
+        if tracer is None:
+            tracer = Tracer(trace_path=trace_path)
+            _TRACERS[trace_path] = tracer
+
+    return tracer
@@ -3,10 +3,166 @@ Validators for IPv4 and IPv6 Addresses
 """
 
 import inspect
-from typing import Union
+from typing import NamedTuple, Optional, Union
 import ipaddress
 from ansible.errors import AnsiblePluginError
 
+IPV4_ALL_ONES = 0xFFFFFFFF
+
+# The netmask, and the inverse mask, of each prefix length as an integer, indexed by prefix length
+IPV4_NETMASK_VALUES = tuple((IPV4_ALL_ONES << (32 - prefix_length)) & IPV4_ALL_ONES for prefix_length in range(33))
+IPV4_HOSTMASK_VALUES = tuple(IPV4_ALL_ONES >> prefix_length for prefix_length in range(33))
+
+
+class IPv4Prefix(NamedTuple):
+    """Class for an IPv4 prefix parsed once, validators and normalizers take it in place of the string, so a value is
+    not parsed again by each of them
+
+    :type address: Integer
+    :param address: The address as an integer Example: 3232235777 for 192.168.1.1
+    :type prefix_length: Integer
+    :param prefix_length: The prefix length Example: 24
+    :type version: Integer
+    :param version: The IP version
+    """
+
+    address: int
+    prefix_length: int
+    version: int = 4
+
+    @property
+    def netmask(self) -> int:
+        """The netmask as an integer"""
+        return IPV4_NETMASK_VALUES[self.prefix_length]
+
+    @property
+    def hostmask(self) -> int:
+        """The inverse mask as an integer"""
+        return IPV4_HOSTMASK_VALUES[self.prefix_length]
+
+    @property
+    def network(self) -> int:
+        """The network address as an integer"""
+        return self.address & IPV4_NETMASK_VALUES[self.prefix_length]
+
+    @property
+    def is_subnet(self) -> bool:
+        """If the address is the network address, with no host bits set"""
+        return not self.address & IPV4_HOSTMASK_VALUES[self.prefix_length]
+
+    @property
+    def with_prefixlen(self) -> str:
+        """The prefix in CIDR notation Example: 192.168.1.0/24"""
+        return f"{ipv4_int_to_str(self.address)}/{self.prefix_length}"
+
+    def __str__(self) -> str:
+        return self.with_prefixlen
+
+
+def ipv4_int_to_str(value: int) -> str:
+    """Function to convert an IPv4 address integer to dotted decimal notation
+
+    :type value: Integer
+    :param value: Value to convert Example: 3232235777
+
+    :rtype: String
+    :returns: The converted value Example: 192.168.1.1
+    """
+    return f"{value >> 24}.{(value >> 16) & 255}.{(value >> 8) & 255}.{value & 255}"
+
+
+def _parse_decimal(value: str, maximum: int) -> int:
+    """Protected function to parse a decimal in the canonical form ipaddress gives, no signs, spaces, or leading zeros
+
+    :type value: String
+    :param value: Value to parse Example: 192
+    :type maximum: Integer
+    :param maximum: The largest value allowed
+
+    :rtype: Integer
+    :returns: The parsed value
+
+    :raises ValueError: If the value is not a canonical decimal from 0 to maximum
+    """
+    if not value.isascii() or not value.isdigit() or (len(value) > 1 and value[0] == "0") or int(value) > maximum:
+        raise ValueError(f"'{value}' is not a decimal from 0 to {maximum}")
+
+    return int(value)
+
+
+def _parse_ipv4_prefix(value: str) -> Optional[IPv4Prefix]:
+    """Protected function to parse an IPv4 Prefix in the canonical form ipaddress gives, the validators only check an
+    invalid value again with ipaddress, for its error message
+
+    :type value: String
+    :param value: Value to parse Example: 192.168.1.1/24
+
+    :rtype: Optional[IPv4Prefix]
+    :returns: The parsed prefix, or None if the value is not a valid IPv4 prefix
+    """
+    if not isinstance(value, str):
+        return None
+
+    address_value, separator, prefix_length_value = value.partition("/")
+    octets = address_value.split(".")
+
+    if not separator or len(octets) != 4:
+        return None
+
+    try:
+        address = 0
+        for octet in octets:
+            address = (address << 8) | _parse_decimal(value=octet, maximum=255)
+
+        return IPv4Prefix(address=address, prefix_length=_parse_decimal(value=prefix_length_value, maximum=32))
+
+    except ValueError:
+        return None
+
+
+def parse_ipv4_prefix(value: Union[str, IPv4Prefix]) -> IPv4Prefix:
+    """Function to parse an IPv4 Prefix once, a parsed prefix is returned as it is
+
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to parse Example: 192.168.1.1/24
+
+    :rtype: IPv4Prefix
+    :returns: The parsed prefix
+
+    :raises AnsiblePluginError: If the value is not a valid IPv4 prefix, with the error of is_ipv4_prefix
+    """
+    if isinstance(value, IPv4Prefix):
+        return value
+
+    prefix = _parse_ipv4_prefix(value)
+
+    if prefix is None:
+        is_ipv4_prefix(value)
+        interface = ipaddress.IPv4Interface(value)
+        prefix = IPv4Prefix(address=int(interface.ip), prefix_length=interface.network.prefixlen)
+
+    return prefix
+
+
+def parse_ipv4_subnet(value: Union[str, IPv4Prefix]) -> IPv4Prefix:
+    """Function to parse an IPv4 Subnet once, a prefix with no host bits set, a parsed prefix is only checked
+
+    :type value: Union[str, IPv4Prefix]
+    :param value: Value to parse Example: 192.168.1.0/24
+
+    :rtype: IPv4Prefix
+    :returns: The parsed subnet
+
+    :raises AnsiblePluginError: If the value is not a valid IPv4 subnet, with the error of is_ipv4_subnet
+    """
+    prefix = value if isinstance(value, IPv4Prefix) else _parse_ipv4_prefix(value)
+
+    if prefix is None or not prefix.is_subnet:
+        is_ipv4_subnet(value)
+        prefix = parse_ipv4_prefix(value)
+
+    return prefix
+
 
 def is_ipv4_host(value: str) -> str:
     """Function to check if a value is an IPv4 host
@@ -31,17 +187,21 @@ def is_ipv4_host(value: str) -> str:
     return value
 
 
-def is_ipv4_prefix(value: str) -> str:
+def is_ipv4_prefix(value: Union[str, IPv4Prefix]) -> Union[str, IPv4Prefix]:
     """Function to check if a value is an IPv4 Prefix
 
-    :type value: String
+    :type value: Union[str, IPv4Prefix]
     :param value: Value to check Example: 192.168.1.1/24
 
-    :rtype: String
+    :rtype: Union[str, IPv4Prefix]
     :returns: The validated value
 
     :raises AnsiblePluginError: If the value is not a valid IPv4 prefix
     """
+    if isinstance(value, IPv4Prefix) or _parse_ipv4_prefix(value) is not None:
+        return value
+
+    # Only an invalid value is checked again with ipaddress, for its error message
     try:
         if "/" not in value:
             raise ValueError(f"{value} is not a valid ipv4 prefix address in CIDR format")
@@ -60,24 +220,33 @@ def is_ipv4_prefix(value: str) -> str:
     return value
 
 
-def is_ipv4_subnet(value: str):
+def is_ipv4_subnet(value: Union[str, IPv4Prefix]) -> Union[str, IPv4Prefix]:
     """Function to check if a value is a IPv4 Subnet
 
-    :type value: String
+    :type value: Union[str, IPv4Prefix]
     :param value: Value to check Example: 192.168.1.0/24
 
-    :rtype: String
+    :rtype: Union[str, IPv4Prefix]
     :returns: The validated value
 
     :raises AnsiblePluginError: If the value is not a valid IPv4 subnet
     """
+    prefix = value if isinstance(value, IPv4Prefix) else _parse_ipv4_prefix(value)
+
+    if prefix is not None and prefix.is_subnet:
+        return value
+
+    # Only an invalid value is checked again with ipaddress, for its error message
     try:
-        ipv4_obj = ipaddress.ip_network(value, strict=True)
+        if not isinstance(value, (str, IPv4Prefix)):
+            raise ValueError(f"{value} is not a valid ipv4 subnet address")
+
+        ipv4_obj = ipaddress.ip_network(str(value), strict=True)
 
         if ipv4_obj.version != 4:
             raise ValueError(f"{value} is not a valid ipv4 subnet address")
 
-        if ipv4_obj.with_prefixlen != value:
+        if ipv4_obj.with_prefixlen != str(value):
             raise ValueError(f"{value} is not a valid ipv4 subnet address")
 
     except Exception as error:
@@ -0,0 +1,131 @@
+"""
+Benchmark of the ACL subnet normalizers with the prefix length mask tables against the ipaddress module
+
+Run from the root of the collection
+
+    make benchmark
+"""
+
+import argparse
+import ipaddress
+import timeit
+from typing import Callable, Dict, List
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.normalizers.conversion_normalizers import (
+    EXTENDED_ACL_IPV4_SUBNET_NORMALIZERS,
+    STANDARD_ACL_IPV4_SUBNET_NORMALIZERS,
+)
+
+
+def ipaddress_inverse_mask(value: str) -> str:
+    """Function to convert a subnet to inverse mask notation with an ipaddress.IPv4Network for every value
+
+    :type value: String
+    :param value: Value to convert Example: 192.168.1.0/24
+
+    :rtype: String
+    :returns: The converted value Example: 192.168.1.0 0.0.0.255
+    """
+    ipv4_obj = ipaddress.IPv4Network(value)
+
+    return f"{ipv4_obj.network_address} {ipv4_obj.hostmask}"
+
+
+def ipaddress_normalizer(host_format: str, inverse_mask: bool) -> Callable[[str], str]:
+    """Function to build a subnet normalizer with the ipaddress module, the way the normalizers worked before the
+    mask tables
+
+    :type host_format: String
+    :param host_format: The format of a /32 Example: host {address}
+    :type inverse_mask: Boolean
+    :param inverse_mask: If other subnets are converted to inverse mask notation, otherwise they are kept in CIDR
+
+    :rtype: Callable[[str], str]
+    :returns: The normalizer
+    """
+
+    def normalizer(value: str) -> str:
+        ipv4_obj = ipaddress.IPv4Network(value)
+
+        if ipv4_obj.prefixlen == 32:
+            return host_format.format(address=ipv4_obj.network_address)
+
+        if inverse_mask:
+            return ipaddress_inverse_mask(value)
+
+        return str(ipv4_obj)
+
+    return normalizer
+
+
+IPADDRESS_NORMALIZERS: Dict[str, Dict[str, Callable[[str], str]]] = {
+    "standard": {
+        "ios": ipaddress_normalizer(host_format="{address}", inverse_mask=True),
+        "iosxr": ipaddress_normalizer(host_format="host {address}", inverse_mask=True),
+        "eos": ipaddress_normalizer(host_format="host {address}", inverse_mask=False),
+    },
+    "extended": {
+        "ios": ipaddress_normalizer(host_format="host {address}", inverse_mask=True),
+        "iosxr": ipaddress_normalizer(host_format="host {address}", inverse_mask=True),
+        "eos": ipaddress_normalizer(host_format="host {address}", inverse_mask=False),
+    },
+}
+
+NORMALIZERS: Dict[str, Dict[str, Callable[[str], str]]] = {
+    "standard": STANDARD_ACL_IPV4_SUBNET_NORMALIZERS,
+    "extended": EXTENDED_ACL_IPV4_SUBNET_NORMALIZERS,
+}
+
+
+def subnets(count: int) -> List[str]:
+    """Function to build subnets of every prefix length to normalize
+
+    :type count: Integer
+    :param count: The number of subnets
+
+    :rtype: List[str]
+    :returns: The subnets Example: ["10.0.0.0/8", "10.1.0.0/16"]
+    """
+    values = []
+
+    for number in range(count):
+        prefix_length = number % 33
+        address = (0x0A000000 + number * 0x1000) & ((0xFFFFFFFF << (32 - prefix_length)) & 0xFFFFFFFF)
+        values.append(f"{ipaddress.IPv4Address(address)}/{prefix_length}")
+
+    return values
+
+
+def main() -> None:
+    """Normalize the same subnets both ways, check the output is identical, and print the timings"""
+    parser = argparse.ArgumentParser(description="Benchmark the mask tables against the ipaddress module")
+    parser.add_argument("--subnets", type=int, default=10000, help="The number of subnets to normalize")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of times to normalize the subnets")
+    args = parser.parse_args()
+
+    values = subnets(count=args.subnets)
+
+    for acl_type, normalizers in NORMALIZERS.items():
+        for ansible_network_os, normalizer in normalizers.items():
+            ipaddress_normalizer_function = IPADDRESS_NORMALIZERS[acl_type][ansible_network_os]
+
+            if [normalizer(value) for value in values] != [ipaddress_normalizer_function(value) for value in values]:
+                raise AssertionError(f"{acl_type} {ansible_network_os}: the mask tables output differs from ipaddress")
+
+            ipaddress_seconds = min(
+                timeit.repeat(
+                    lambda: [ipaddress_normalizer_function(value) for value in values], number=1, repeat=args.repeat
+                )
+            )
+            tables_seconds = min(
+                timeit.repeat(lambda: [normalizer(value) for value in values], number=1, repeat=args.repeat)
+            )
+            print(
+                f"{acl_type:8} {ansible_network_os:6} ipaddress: {ipaddress_seconds * 1000:8.2f} ms  "
+                f"tables: {tables_seconds * 1000:8.2f} ms  speedup: {ipaddress_seconds / tables_seconds:5.2f}x  "
+                "(identical output)"
+            )
+
+
+if __name__ == "__main__":
+    main()
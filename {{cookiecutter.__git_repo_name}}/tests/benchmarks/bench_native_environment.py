@@ -0,0 +1,127 @@
+"""
+Benchmark of rendering the collection standard_acl.j2 templates with the Templar against the native environment
+
+Run from the root of the collection
+
+    make benchmark
+"""
+
+import argparse
+import os
+import timeit
+from typing import List
+
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.action.standard_acls import (
+    StandardAclRenderConfigFromTemplate,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_settings import (
+    setting_name,
+)
+
+
+def standard_acls(acl_count: int, sequence_count: int) -> List[dict]:
+    """Function to build standard ACL data to render
+
+    :type acl_count: Integer
+    :param acl_count: The number of ACLs
+    :type sequence_count: Integer
+    :param sequence_count: The number of sequences in each ACL
+
+    :rtype: List[dict]
+    :returns: The ACLs
+    """
+    acls = []
+
+    for acl_number in range(acl_count):
+        sequences = [{"sequence": 10, "action": "remark", "remark": f"ACL {acl_number}"}]
+
+        for sequence_number in range(1, sequence_count):
+            sequences.append(
+                {
+                    "sequence": (sequence_number + 1) * 10,
+                    "action": "permit" if sequence_number % 2 else "deny",
+                    "source": f"10.{acl_number % 256}.{sequence_number % 256}.0/24",
+                    "append_option_to_end": " log",
+                }
+            )
+
+        acls.append({"name": f"ACL_{acl_number}", "sequences": sequences})
+
+    return acls
+
+
+def disable_render_cache() -> None:
+    """Function to turn off the render cache for this process, so the benchmarks time rendering and not cache hits
+
+    :rtype: None
+    :returns: Nothing
+    """
+    os.environ.pop(setting_name("RENDER_CACHE_PATH"), None)
+    os.environ[setting_name("RENDER_DEDUP")] = "false"
+
+
+def compare(baseline_seconds: float, seconds: float) -> str:
+    """Function to describe a timing against the baseline, a slower result is reported as slower, not as a speedup
+
+    :type baseline_seconds: Float
+    :param baseline_seconds: The time of the baseline
+    :type seconds: Float
+    :param seconds: The time to compare
+
+    :rtype: String
+    :returns: The comparison Example: 1.52x faster, or 1.08x slower
+    """
+    if seconds <= baseline_seconds:
+        return f"{baseline_seconds / seconds:5.2f}x faster"
+
+    return f"{seconds / baseline_seconds:5.2f}x slower"
+
+
+def main() -> None:
+    """Render the same ACLs both ways, check the output is identical, and print the timings"""
+    parser = argparse.ArgumentParser(description="Benchmark the Templar against the native environment")
+    parser.add_argument("--acls", type=int, default=200, help="The number of ACLs to render")
+    parser.add_argument("--sequences", type=int, default=50, help="The number of sequences in each ACL")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of times to render the ACLs")
+    args = parser.parse_args()
+
+    # Every render must really render, not come from the render cache
+    disable_render_cache()
+
+    acls = standard_acls(acl_count=args.acls, sequence_count=args.sequences)
+
+    for ansible_network_os in ("ios", "iosxr", "nxos"):
+        results = {}
+
+        for native_environment in (False, True):
+            renderer = StandardAclRenderConfigFromTemplate(
+                templar=Templar(loader=DataLoader()),
+                template_variables=None,
+                ansible_network_os=ansible_network_os,
+                native_environment=native_environment,
+            )
+
+            def render() -> List[str]:
+                return renderer.render_many(template_variables_list=acls, template_name="standard_acl.j2")
+
+            rendered = render()
+            seconds = min(timeit.repeat(render, number=1, repeat=args.repeat))
+            results[native_environment] = (rendered, seconds)
+
+        if results[True][0] != results[False][0]:
+            raise AssertionError(f"{ansible_network_os}: the native environment output differs from the Templar")
+
+        templar_seconds = results[False][1]
+        native_seconds = results[True][1]
+        print(
+            f"{ansible_network_os:6} templar: {templar_seconds * 1000:8.2f} ms  "
+            f"native: {native_seconds * 1000:8.2f} ms  "
+            f"native is {compare(baseline_seconds=templar_seconds, seconds=native_seconds)}  (identical output)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark of rendering a large set of standard ACLs in one process against a pool of forked processes
+
+Run from the root of the collection
+
+    make benchmark
+"""
+
+import argparse
+import timeit
+from typing import List
+
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.action.standard_acls import (
+    StandardAclRenderConfigFromTemplate,
+)
+from ansible_collections.{{ cookiecutter.__git_repo_name }}.plugins.module_utils.render.render_pool import (
+    available_processes,
+)
+
+from bench_native_environment import compare, disable_render_cache, standard_acls
+
+
+def main() -> None:
+    """Render the ACLs in one process and in a process pool, check the output is identical, and print the timings"""
+    parser = argparse.ArgumentParser(description="Benchmark rendering in one process against a process pool")
+    parser.add_argument("--acls", type=int, default=400, help="The number of ACLs to render")
+    parser.add_argument("--sequences", type=int, default=100, help="The number of sequences in each ACL")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of times to render the ACLs")
+    parser.add_argument(
+        "--processes", type=int, default=max(2, available_processes()), help="The number of processes in the pool"
+    )
+    args = parser.parse_args()
+
+    # Every render must really render, not come from the render cache
+    disable_render_cache()
+
+    acls = standard_acls(acl_count=args.acls, sequence_count=args.sequences)
+
+    for ansible_network_os in ("ios", "iosxr", "nxos"):
+        results = {}
+
+        for pool, processes in ((False, 1), (True, args.processes)):
+            renderer = StandardAclRenderConfigFromTemplate(
+                templar=Templar(loader=DataLoader()),
+                template_variables=None,
+                ansible_network_os=ansible_network_os,
+            )
+
+            def render() -> List[str]:
+                return renderer.render_many(
+                    template_variables_list=acls, template_name="standard_acl.j2", processes=processes
+                )
+
+            rendered = render()
+            seconds = min(timeit.repeat(render, number=1, repeat=args.repeat))
+            results[pool] = (rendered, seconds)
+
+        if results[True][0] != results[False][0]:
+            raise AssertionError(f"{ansible_network_os}: the process pool output differs from one process")
+
+        serial_seconds = results[False][1]
+        parallel_seconds = results[True][1]
+        print(
+            f"{ansible_network_os:6} 1 process: {serial_seconds * 1000:9.2f} ms  "
+            f"{args.processes} processes: {parallel_seconds * 1000:9.2f} ms  "
+            f"pool is {compare(baseline_seconds=serial_seconds, seconds=parallel_seconds)}  (identical output)"
+        )
+
+
+if __name__ == "__main__":
+    main()
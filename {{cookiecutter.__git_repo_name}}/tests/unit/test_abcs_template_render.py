@@ -0,0 +1,568 @@
+import json
+import os
+
+import pytest
+from ansible import constants as C
+from ansible.errors import AnsibleUndefinedVariable
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+
+from plugins.module_utils.abcs.abcs_template_render import (
+    NATIVE_COMPILED_TEMPLATE_CACHE,
+    TEMPLAR_INTERNALS,
+    RenderConfigFromTemplate,
+    TemplateVariablesError,
+    templar_internals_supported,
+)
+from plugins.module_utils.render.render_settings import setting_name
+from plugins.module_utils.render.render_timings import RenderTimings
+
+
+class HostnameRenderConfigFromTemplate(RenderConfigFromTemplate):
+    @staticmethod
+    def validate_module_params(template_variables: dict) -> None:
+        if not template_variables.get("hostname"):
+            raise ValueError("hostname is required")
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    template_path = tmp_path / "hostname.j2"
+    template_path.write_text(
+        "hostname {{ hostname }}\n{% if domain is defined %}ip domain-name {{ domain }}\n{% endif %}"
+    )
+
+    return str(template_path)
+
+
+def test_render_config(template_path):
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()),
+        template_variables={"hostname": "router1", "domain": "example.com"},
+        ansible_network_os="cisco.ios.ios",
+    )
+
+    assert renderer.render_config(src=template_path) == "hostname router1\nip domain-name example.com\n"
+
+
+def test_render_many(template_path):
+    template_variables_list = [{"hostname": "router1"}, {"hostname": "router2", "domain": "example.com"}]
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+
+    rendered = renderer.render_many(template_variables_list=template_variables_list, src=template_path)
+
+    assert rendered == ["hostname router1\n", "hostname router2\nip domain-name example.com\n"]
+
+    for template_variables, rendered_template in zip(template_variables_list, rendered):
+        single_renderer = HostnameRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()), template_variables=template_variables, ansible_network_os="ios"
+        )
+        assert single_renderer.render_config(src=template_path) == rendered_template
+
+
+def test_render_config_lookup_uses_each_templar(tmp_path):
+    template_path = tmp_path / "lookup.j2"
+    template_path.write_text("{{ lookup('vars', 'inventory_hostname') }} {{ hostname }}")
+
+    for inventory_hostname in ("host_a", "host_b"):
+        renderer = HostnameRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()),
+            template_variables={"hostname": "router1", "inventory_hostname": inventory_hostname},
+            ansible_network_os="ios",
+        )
+
+        assert renderer.render_config(src=str(template_path)) == f"{inventory_hostname} router1"
+
+
+def test_templar_internals_supported():
+    templar = Templar(loader=DataLoader())
+
+    # Fails when an ansible-core release drops the internals the compiled templates are rendered with
+    assert templar_internals_supported(templar)
+    assert all(hasattr(templar, attribute) for attribute in TEMPLAR_INTERNALS)
+
+
+def test_render_override_header(tmp_path):
+    template_path = tmp_path / "override.j2"
+    template_source = "#jinja2: trim_blocks: False\n{% if hostname %}\nhostname {{ hostname }}\n{% endif %}\n"
+    template_path.write_text(template_source)
+    templar = Templar(loader=DataLoader(), variables={"hostname": "router1", "ansible_network_os": "ios"})
+    expected = templar.template(template_source, preserve_trailing_newlines=True, escape_backslashes=False)
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables={"hostname": "router1"}, ansible_network_os="ios"
+    )
+
+    assert expected == "\nhostname router1\n"
+    assert renderer.render_config(src=str(template_path)) == expected
+    assert renderer.render_many(template_variables_list=[{"hostname": "router1"}], src=str(template_path)) == [
+        expected
+    ]
+    assert list(
+        renderer.stream_lines(template_variables_list=[{"hostname": "router1"}], src=str(template_path))
+    ) == expected.splitlines()
+
+
+def test_render_without_templar_internals(monkeypatch, template_path):
+    monkeypatch.setattr(
+        "plugins.module_utils.abcs.abcs_template_render.templar_internals_supported", lambda templar: False
+    )
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()),
+        template_variables={"hostname": "router1", "domain": "example.com"},
+        ansible_network_os="ios",
+    )
+
+    assert renderer.render_config(src=template_path) == "hostname router1\nip domain-name example.com\n"
+
+
+def test_render_many_validation_errors(template_path):
+    class CheckedHostnameRenderConfigFromTemplate(RenderConfigFromTemplate):
+        @staticmethod
+        def validate_module_params(template_variables: dict) -> None:
+            errors = [f"{key}: is required" for key in ("hostname", "domain") if not template_variables.get(key)]
+            if errors:
+                raise TemplateVariablesError(errors=errors)
+
+    renderer = CheckedHostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+    renderer._generate_compiled_template = None
+
+    with pytest.raises(TemplateVariablesError) as error:
+        renderer.render_many(
+            template_variables_list=[{"hostname": "router1"}, {"hostname": "router2", "domain": "example.com"}, {}],
+            src=template_path,
+        )
+
+    assert error.value.errors == ["[0].domain: is required", "[2].hostname: is required", "[2].domain: is required"]
+
+
+def test_render_many_processes(monkeypatch, tmp_path, template_path):
+    monkeypatch.setenv(setting_name("RENDER_CACHE_PATH"), str(tmp_path / "render_cache"))
+    template_variables_list = [
+        {"hostname": f"router{number}", "domain": "example.com"} if number % 2 else {"hostname": f"router{number}"}
+        for number in range(20)
+    ]
+
+    def renderer(timings=None):
+        return HostnameRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios", timings=timings
+        )
+
+    serial_rendered = renderer().render_many(template_variables_list=template_variables_list, src=template_path)
+
+    timings = RenderTimings()
+    parallel_renderer = renderer(timings=timings)
+    parallel_rendered = parallel_renderer.render_many(
+        template_variables_list=template_variables_list, src=template_path, processes=3
+    )
+
+    assert parallel_rendered == serial_rendered
+    assert parallel_renderer.render_cache_stats() == {"hits": 20, "misses": 0, "hit_rate": 1.0}
+    assert len(timings.items()) == 20
+    assert all(list(item_timings) == ["validate", "render"] for item_timings in timings.items())
+
+
+def test_render_many_processes_undefined_variable(tmp_path):
+    template_path = tmp_path / "undefined.j2"
+    template_path.write_text("hostname {{ hostname }} {{ undefined_variable }}")
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+
+    with pytest.raises(AnsibleUndefinedVariable):
+        renderer.render_many(
+            template_variables_list=[{"hostname": "router1"}, {"hostname": "router2"}],
+            src=str(template_path),
+            processes=2,
+        )
+
+
+@pytest.mark.parametrize("native_environment", [False, True])
+def test_render_many_does_not_change_template_variables(collection_templates, native_environment):
+    shared_template_variables = {"hostname": "router1", "domain": "example.com"}
+    renderers = [
+        HostnameRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()),
+            template_variables=None,
+            ansible_network_os=ansible_network_os,
+            native_environment=native_environment,
+        )
+        for ansible_network_os in ("ios", "cisco.ios.ios")
+    ]
+
+    for renderer in renderers:
+        renderer.render_many(template_variables_list=[shared_template_variables], template_name="native.j2")
+
+    assert shared_template_variables == {"hostname": "router1", "domain": "example.com"}
+
+
+def test_render_config_template_variables_are_read_only(template_path):
+    class ChangingRenderConfigFromTemplate(RenderConfigFromTemplate):
+        @staticmethod
+        def validate_module_params(template_variables: dict) -> None:
+            template_variables["hostname"] = "changed"
+
+    with pytest.raises(TypeError):
+        ChangingRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()), template_variables={"hostname": "router1"}, ansible_network_os="ios"
+        )
+
+
+def test_render_config_network_os_overlay(tmp_path):
+    template_path = tmp_path / "network_os.j2"
+    template_path.write_text("{{ hostname }} {{ ansible_network_os }}")
+    template_variables = {"hostname": "router1", "ansible_network_os": "cisco.ios.ios"}
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="cisco.nxos.nxos"
+    )
+
+    assert renderer.render_many(template_variables_list=[template_variables], src=str(template_path)) == [
+        "router1 nxos"
+    ]
+    assert template_variables == {"hostname": "router1", "ansible_network_os": "cisco.ios.ios"}
+
+
+def test_render_many_timings(collection_templates):
+    (collection_templates / "ios" / "main" / "timings.j2").write_text("hostname {{ hostname }}\n")
+    timings = RenderTimings()
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios", timings=timings
+    )
+
+    renderer.render_many(
+        template_variables_list=[{"hostname": "router1"}, {"hostname": "router2"}], template_name="timings.j2"
+    )
+    list(renderer.stream_lines(template_variables_list=[{"hostname": "router3"}], template_name="timings.j2"))
+
+    totals = timings.totals()
+    items = timings.items()
+
+    for stage_name in ("find_directory", "find_template", "read", "compile", "validate", "render"):
+        assert totals[stage_name] > 0
+    assert totals["split"] == 0
+    assert [sorted(item_timings) for item_timings in items] == [["render", "validate"], ["render", "validate"]]
+
+
+def test_render_many_bad(template_path):
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+
+    with pytest.raises(TypeError):
+        renderer.render_many(template_variables_list={"hostname": "router1"}, src=template_path)
+
+    with pytest.raises(TypeError):
+        renderer.render_many(template_variables_list=["router1"], src=template_path)
+
+    with pytest.raises(ValueError):
+        renderer.render_many(template_variables_list=[{"hostname": "router1"}, {}], src=template_path)
+
+    with pytest.raises(FileNotFoundError):
+        renderer.render_many(template_variables_list=[{"hostname": "router1"}], src="/does/not/exist.j2")
+
+    with pytest.raises(TypeError):
+        renderer.render_config(src=template_path)
+
+
+def test_stream_lines(template_path):
+    template_variables_list = [{"hostname": "router1"}, {"hostname": "router2", "domain": "example.com"}]
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+
+    rendered_lines = renderer.stream_lines(template_variables_list=template_variables_list, src=template_path)
+
+    assert not isinstance(rendered_lines, list)
+    assert list(rendered_lines) == [
+        line
+        for rendered_template in renderer.render_many(
+            template_variables_list=template_variables_list, src=template_path
+        )
+        for line in rendered_template.splitlines()
+    ]
+
+
+def test_stream_lines_undefined_variable(tmp_path):
+    template_path = tmp_path / "undefined.j2"
+    template_path.write_text("hostname {{ hostname }}\n{{ undefined_variable }}")
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+
+    with pytest.raises(AnsibleUndefinedVariable):
+        list(renderer.stream_lines(template_variables_list=[{"hostname": "router1"}], src=str(template_path)))
+
+
+@pytest.fixture
+def collection_templates(monkeypatch, tmp_path):
+    templates_directory = tmp_path / "templates"
+    template_path = templates_directory / "ios" / "main" / "native.j2"
+    template_path.parent.mkdir(parents=True)
+    template_path.write_text(
+        "hostname {{ hostname }}\n"
+        "{% set domain_name = domain | default(None) %}\n"
+        "ip domain-name {{ domain_name }}\n"
+        "{% for number in range(2) %}\n"
+        " {{ number }} {{ interfaces[number] if interfaces is defined else none }}\n"
+        "{% endfor %}\n"
+        "{{ {'a': 1}.items() }} {{ range(3) }} {{ [1, 2] | map('string') }}\n\n"
+    )
+    (templates_directory / "ios" / "main" / "fallback.j2").write_text("{{ hostname | to_json }}\n")
+
+    monkeypatch.setenv(setting_name("TEMPLATES_PATH"), str(templates_directory))
+    # Renders are compared, so none come from the render cache
+    monkeypatch.setenv(setting_name("RENDER_DEDUP"), "false")
+    NATIVE_COMPILED_TEMPLATE_CACHE.clear()
+    yield templates_directory
+    NATIVE_COMPILED_TEMPLATE_CACHE.clear()
+
+
+@pytest.mark.parametrize("template_name", ["native.j2", "fallback.j2"])
+def test_native_environment_matches_templar(collection_templates, template_name):
+    template_variables_list = [
+        {"hostname": "router1"},
+        {"hostname": "router2", "domain": "example.com", "interfaces": ["Gi0/1", "Gi0/2"]},
+    ]
+    renderers = [
+        HostnameRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()),
+            template_variables=None,
+            ansible_network_os="ios",
+            native_environment=native_environment,
+        )
+        for native_environment in (False, True)
+    ]
+
+    templar_rendered, native_rendered = [
+        renderer.render_many(template_variables_list=template_variables_list, template_name=template_name)
+        for renderer in renderers
+    ]
+    templar_lines, native_lines = [
+        list(renderer.stream_lines(template_variables_list=template_variables_list, template_name=template_name))
+        for renderer in renderers
+    ]
+
+    assert native_rendered == templar_rendered
+    assert native_lines == templar_lines
+    assert NATIVE_COMPILED_TEMPLATE_CACHE.stats()["size"] == (1 if template_name == "native.j2" else 0)
+
+
+def test_native_environment_nested_template_syntax(collection_templates):
+    (collection_templates / "ios" / "main" / "nested.j2").write_text(
+        "hostname {{ hostname }}\n{% for sequence in sequences %}\n {{ sequence.remark }}\n{% endfor %}\n"
+    )
+    template_variables_list = [
+        {"hostname": "{{ name }}-1", "name": "A", "sequences": [{"remark": "owner {{ name }}"}, {"remark": "{# #}"}]},
+        {"hostname": "router2", "sequences": [{"remark": "no template {"}]},
+    ]
+    templar_rendered, native_rendered = [
+        HostnameRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()),
+            template_variables=None,
+            ansible_network_os="ios",
+            native_environment=native_environment,
+        ).render_many(template_variables_list=template_variables_list, template_name="nested.j2")
+        for native_environment in (False, True)
+    ]
+
+    assert native_rendered == templar_rendered
+    assert native_rendered[0] == "hostname A-1\n owner A\n \n"
+    assert NATIVE_COMPILED_TEMPLATE_CACHE.stats()["size"] == 1
+
+
+def test_native_environment_nested_undefined_variable(collection_templates):
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()),
+        template_variables={"hostname": "{{ undefined_variable }}"},
+        ansible_network_os="ios",
+        native_environment=True,
+    )
+
+    with pytest.raises(AnsibleUndefinedVariable):
+        renderer.render_config(template_name="native.j2")
+
+
+def test_native_environment_render_cache(collection_templates, monkeypatch, tmp_path):
+    monkeypatch.setenv(setting_name("RENDER_CACHE_PATH"), str(tmp_path / "render_cache"))
+    renderers = [
+        HostnameRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()),
+            template_variables={"hostname": "router1"},
+            ansible_network_os="ios",
+            native_environment=native_environment,
+        )
+        for native_environment in (False, True, True)
+    ]
+
+    rendered = [renderer.render_config(template_name="native.j2") for renderer in renderers]
+
+    assert rendered[0].startswith("hostname router1\n")
+    assert rendered == [rendered[0]] * 3
+    # The native render does not reuse the Templar render, only the earlier native one
+    assert [renderer.render_cache_stats()["hits"] for renderer in renderers] == [0, 0, 1]
+
+
+def test_native_environment_setting(collection_templates, monkeypatch):
+    monkeypatch.setenv(setting_name("NATIVE_ENVIRONMENT"), "true")
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables={"hostname": "router1"}, ansible_network_os="ios"
+    )
+
+    assert renderer.render_config(template_name="native.j2").startswith("hostname router1\nip domain-name \n")
+    assert NATIVE_COMPILED_TEMPLATE_CACHE.stats()["misses"] == 1
+
+
+def test_native_environment_only_for_collection_templates(collection_templates, template_path):
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()),
+        template_variables={"hostname": "router1"},
+        ansible_network_os="ios",
+        native_environment=True,
+    )
+
+    assert renderer.render_config(src=template_path) == "hostname router1\n"
+    assert NATIVE_COMPILED_TEMPLATE_CACHE.stats()["misses"] == 0
+
+
+def test_native_environment_undefined_variable(collection_templates):
+    (collection_templates / "ios" / "main" / "undefined.j2").write_text("hostname {{ undefined_variable }}")
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()),
+        template_variables={"hostname": "router1"},
+        ansible_network_os="ios",
+        native_environment=True,
+    )
+
+    with pytest.raises(AnsibleUndefinedVariable):
+        renderer.render_config(template_name="undefined.j2")
+
+
+def test_render_cache(monkeypatch, tmp_path, template_path):
+    monkeypatch.setenv(setting_name("RENDER_CACHE_PATH"), str(tmp_path / "render_cache"))
+    template_variables_list = [{"hostname": "router1"}, {"hostname": "router2", "domain": "example.com"}]
+
+    def renderer():
+        return HostnameRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+        )
+
+    first_renderer = renderer()
+    first_rendered = first_renderer.render_many(template_variables_list=template_variables_list, src=template_path)
+    assert first_renderer.render_cache_stats() == {"hits": 0, "misses": 2, "hit_rate": 0.0}
+
+    second_renderer = renderer()
+    second_renderer._generate_compiled_template = None
+    assert (
+        second_renderer.render_many(template_variables_list=template_variables_list, src=template_path)
+        == first_rendered
+    )
+    assert list(second_renderer.stream_lines(template_variables_list=template_variables_list, src=template_path)) == [
+        line for rendered_template in first_rendered for line in rendered_template.splitlines()
+    ]
+    assert second_renderer.render_cache_stats() == {"hits": 4, "misses": 0, "hit_rate": 1.0}
+
+
+def test_render_cache_stream_lines(monkeypatch, tmp_path, template_path):
+    monkeypatch.setenv(setting_name("RENDER_CACHE_PATH"), str(tmp_path / "render_cache"))
+    template_variables_list = [{"hostname": "router1", "domain": "example.com"}]
+
+    first_renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+    lines = list(first_renderer.stream_lines(template_variables_list=template_variables_list, src=template_path))
+    assert lines == ["hostname router1", "ip domain-name example.com"]
+    assert first_renderer.render_cache_stats() == {"hits": 0, "misses": 1, "hit_rate": 0.0}
+    # Streaming does not keep the render to store it
+    assert first_renderer._render_cache.size() == 0
+
+    second_renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+    assert second_renderer.render_many(template_variables_list=template_variables_list, src=template_path) == [
+        "hostname router1\nip domain-name example.com\n"
+    ]
+    assert (
+        list(second_renderer.stream_lines(template_variables_list=template_variables_list, src=template_path)) == lines
+    )
+    assert second_renderer.render_cache_stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_render_cache_run_dedup(monkeypatch, tmp_path, template_path):
+    monkeypatch.delenv(setting_name("RENDER_CACHE_PATH"), raising=False)
+    monkeypatch.setenv(setting_name("RENDER_DEDUP"), "true")
+    monkeypatch.setattr(C, "DEFAULT_LOCAL_TMP", str(tmp_path))
+    template_variables_list = [{"hostname": "router1"}, {"hostname": "router2"}, {"hostname": "router1"}]
+
+    first_renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+    first_rendered = first_renderer.render_many(template_variables_list=template_variables_list, src=template_path)
+    assert first_renderer.render_cache_stats() == {"hits": 1, "misses": 2, "hit_rate": 0.3333}
+
+    second_renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+    second_renderer._generate_compiled_template = None
+    assert (
+        second_renderer.render_many(template_variables_list=template_variables_list, src=template_path)
+        == first_rendered
+    )
+    assert second_renderer.render_cache_stats() == {"hits": 3, "misses": 0, "hit_rate": 1.0}
+    assert os.path.isdir(tmp_path / "render_cache")
+
+
+def test_render_cache_disabled(monkeypatch, template_path):
+    monkeypatch.delenv(setting_name("RENDER_CACHE_PATH"), raising=False)
+    monkeypatch.delenv(setting_name("RENDER_DEDUP"), raising=False)
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables={"hostname": "router1"}, ansible_network_os="ios"
+    )
+
+    assert renderer.render_config(src=template_path) == "hostname router1\n"
+    assert renderer.render_cache_stats() is None
+
+
+def test_render_many_trace(monkeypatch, tmp_path, template_path):
+    trace_path = tmp_path / "trace.jsonl"
+    monkeypatch.setenv(setting_name("TRACE_PATH"), str(trace_path))
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables=None, ansible_network_os="ios"
+    )
+
+    renderer.render_many(template_variables_list=[{"hostname": "router1"}], src=template_path)
+
+    events = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    span_event = events[-1]
+
+    messages = [event["attributes"]["message"] for event in events if event.get("event") == "log"]
+
+    assert f"'src' used {template_path}" in messages
+    assert f"FOUND: templates_path {template_path}" in messages
+    assert span_event["span"] == "render_many"
+    assert span_event["attributes"] == {"network_os": "ios", "template_name": None, "processes": 1, "renders": 1}
+
+
+def test_render_config_undefined_variable(tmp_path):
+    template_path = tmp_path / "undefined.j2"
+    template_path.write_text("hostname {{ hostname }} {{ undefined_variable }}")
+    renderer = HostnameRenderConfigFromTemplate(
+        templar=Templar(loader=DataLoader()), template_variables={"hostname": "router1"}, ansible_network_os="ios"
+    )
+
+    with pytest.raises(AnsibleUndefinedVariable):
+        renderer.render_config(src=str(template_path))
+
+
+def test_render_config_bad():
+    with pytest.raises(TypeError):
+        HostnameRenderConfigFromTemplate(
+            templar=None, template_variables={"hostname": "router1"}, ansible_network_os="ios"
+        )
+
+    with pytest.raises(TypeError):
+        HostnameRenderConfigFromTemplate(
+            templar=Templar(loader=DataLoader()), template_variables=["router1"], ansible_network_os="ios"
+        )
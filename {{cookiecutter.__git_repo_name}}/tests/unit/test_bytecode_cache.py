@@ -0,0 +1,79 @@
+from plugins.module_utils.render.bytecode_cache import (
+    environment_fingerprint,
+    VersionedBytecodeCache,
+    get_bytecode_cache,
+)
+from plugins.module_utils.render.render_settings import setting_name
+from plugins.module_utils.render.template_cache import CompiledTemplateCache
+from jinja2 import Environment
+
+
+class CountingEnvironment(Environment):
+    compiles = 0
+
+    def compile(self, *args, **kwargs):
+        CountingEnvironment.compiles += 1
+        return super().compile(*args, **kwargs)
+
+
+def test_environment_fingerprint():
+    assert environment_fingerprint(Environment()) == environment_fingerprint(Environment())
+    assert environment_fingerprint(Environment()) != environment_fingerprint(Environment(trim_blocks=True))
+    assert environment_fingerprint(Environment()) != environment_fingerprint(CountingEnvironment())
+
+
+def test_versioned_bytecode_cache_shared_between_processes(tmp_path):
+    template_path = tmp_path / "test.j2"
+    template_path.write_text("hostname router1")
+    bytecode_cache = VersionedBytecodeCache(directory=str(tmp_path / "cache"))
+    CountingEnvironment.compiles = 0
+
+    first_process_cache = CompiledTemplateCache()
+    first_process_cache.get_template(str(template_path), CountingEnvironment(), bytecode_cache=bytecode_cache)
+
+    second_process_cache = CompiledTemplateCache()
+    compiled_template = second_process_cache.get_template(
+        str(template_path), CountingEnvironment(), bytecode_cache=bytecode_cache
+    )
+
+    assert compiled_template.template.render() == "hostname router1"
+    assert CountingEnvironment.compiles == 1
+    assert second_process_cache.stats()["bytecode_loads"] == 1
+
+
+def test_versioned_bytecode_cache_invalidated_by_checksum(tmp_path):
+    template_path = tmp_path / "test.j2"
+    template_path.write_text("hostname router1")
+    bytecode_cache = VersionedBytecodeCache(directory=str(tmp_path / "cache"))
+    CountingEnvironment.compiles = 0
+
+    CompiledTemplateCache().get_template(str(template_path), CountingEnvironment(), bytecode_cache=bytecode_cache)
+    template_path.write_text("hostname router2")
+    compiled_template = CompiledTemplateCache().get_template(
+        str(template_path), CountingEnvironment(), bytecode_cache=bytecode_cache
+    )
+
+    assert compiled_template.template.render() == "hostname router2"
+    assert CountingEnvironment.compiles == 2
+
+
+def test_versioned_bytecode_cache_invalidated_by_versions(tmp_path):
+    template_path = tmp_path / "test.j2"
+    template_path.write_text("hostname router1")
+    bytecode_cache = VersionedBytecodeCache(directory=str(tmp_path / "cache"))
+    CountingEnvironment.compiles = 0
+
+    CompiledTemplateCache().get_template(str(template_path), CountingEnvironment(), bytecode_cache=bytecode_cache)
+    bytecode_cache.versions = "python-0.0|jinja2-0.0.0|ansible-0.0.0"
+    CompiledTemplateCache().get_template(str(template_path), CountingEnvironment(), bytecode_cache=bytecode_cache)
+
+    assert CountingEnvironment.compiles == 2
+
+
+def test_get_bytecode_cache(monkeypatch, tmp_path):
+    monkeypatch.delenv(setting_name("BYTECODE_CACHE_PATH"), raising=False)
+    assert get_bytecode_cache() is None
+
+    monkeypatch.setenv(setting_name("BYTECODE_CACHE_PATH"), str(tmp_path / "cache"))
+    assert get_bytecode_cache() is get_bytecode_cache()
+    assert (tmp_path / "cache").is_dir()
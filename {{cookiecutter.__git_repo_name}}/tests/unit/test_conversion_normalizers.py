@@ -1,5 +1,9 @@
 from plugins.module_utils.normalizers.conversion_normalizers import (
+    IPV4_INVERSE_MASKS,
+    INVERSE_MASK_PREFIX_LENGTHS,
+    acl_source_to_cidr,
     cidr_to_inverse_mask,
+    inverse_mask_to_cidr,
     ios_standard_acl_ipv4_subnet_normalizer,
     ios_extended_acl_ipv4_subnet_normalizer,
     iosxr_standard_acl_ipv4_subnet_normalizer,
@@ -7,11 +11,13 @@ from plugins.module_utils.normalizers.conversion_normalizers import (
     eos_standard_acl_ipv4_subnet_normalizer,
     eos_extended_acl_ipv4_subnet_normalizer,
     eos_port_normalizer,
+    IPv4Prefix,
+    parse_ipv4_subnet,
 )
+import ipaddress
 import pytest
 from ansible.errors import AnsiblePluginError
 
-
 cidr_to_inverse_mask_table = [
     ("192.168.1.1/32", "192.168.1.1 0.0.0.0", None),
     ("192.168.1.0/24", "192.168.1.0 0.0.0.255", None),
@@ -109,6 +115,7 @@ def test_iosxr_extended_acl_ipv4_subnet_normalizer(value, response, exception_ra
 
 eos_standard_acl_ipv4_subnet_normalizer_table = [
     ("192.168.1.1/32", "host 192.168.1.1", None),
+    ("192.168.1.1/24", "192.168.1.1/24", None),
     ("192.168.1.0/24", "192.168.1.0/24", None),
     ("192.168.0.0/16", "192.168.0.0/16", None),
     ("192.0.0.0/8", "192.0.0.0/8", None),
@@ -128,6 +135,7 @@ def test_eos_standard_acl_ipv4_subnet_normalizer(value, response, exception_rais
 
 eos_extended_acl_ipv4_subnet_normalizer_table = [
     ("192.168.1.1/32", "host 192.168.1.1", None),
+    ("192.168.1.1/24", "192.168.1.1/24", None),
     ("192.168.1.0/24", "192.168.1.0/24", None),
     ("192.168.0.0/16", "192.168.0.0/16", None),
     ("192.0.0.0/8", "192.0.0.0/8", None),
@@ -165,3 +173,117 @@ def test_eos_port_normalizer(value, response, exception_raise):
 
     else:
         assert eos_port_normalizer(value) == response
+
+
+inverse_mask_to_cidr_table = [
+    ("192.168.1.1 0.0.0.0", "192.168.1.1/32", None),
+    ("192.168.1.0 0.0.0.255", "192.168.1.0/24", None),
+    ("192.0.0.0 0.255.255.255", "192.0.0.0/8", None),
+    ("192.168.1.0 0.0.255.0", None, AnsiblePluginError),
+    ("192.168.1.1 0.0.0.255", None, AnsiblePluginError),
+    ("other", None, AnsiblePluginError),
+]
+
+
+@pytest.mark.parametrize("value,response,exception_raise", inverse_mask_to_cidr_table)
+def test_inverse_mask_to_cidr(value, response, exception_raise):
+    if exception_raise:
+        with pytest.raises(exception_raise):
+            inverse_mask_to_cidr(value)
+
+    else:
+        assert inverse_mask_to_cidr(value) == response
+
+
+acl_source_to_cidr_table = [
+    ("host 192.168.1.1", "192.168.1.1/32"),
+    ("192.168.1.1", "192.168.1.1/32"),
+    ("192.168.1.0 0.0.0.255", "192.168.1.0/24"),
+    ("192.168.1.0/24", "192.168.1.0/24"),
+    ("192.168.1.0 0.0.255.0", "192.168.1.0 0.0.255.0"),
+    ("any", "any"),
+    ("other", "other"),
+    (24, 24),
+]
+
+
+@pytest.mark.parametrize("value,response", acl_source_to_cidr_table)
+def test_acl_source_to_cidr(value, response):
+    assert acl_source_to_cidr(value) == response
+
+
+@pytest.mark.parametrize(
+    "normalizer, value",
+    [
+        (cidr_to_inverse_mask, "192.168.1.0/24"),
+        (ios_standard_acl_ipv4_subnet_normalizer, "192.168.1.1/32"),
+        (ios_standard_acl_ipv4_subnet_normalizer, "192.168.1.0/24"),
+        (ios_extended_acl_ipv4_subnet_normalizer, "192.168.1.1/32"),
+        (iosxr_standard_acl_ipv4_subnet_normalizer, "192.168.0.0/16"),
+        (iosxr_extended_acl_ipv4_subnet_normalizer, "192.168.1.1/32"),
+        (eos_standard_acl_ipv4_subnet_normalizer, "192.168.1.0/24"),
+        (eos_extended_acl_ipv4_subnet_normalizer, "192.168.1.1/32"),
+    ],
+)
+def test_normalizers_parsed_prefix(normalizer, value):
+    assert normalizer(parse_ipv4_subnet(value)) == normalizer(value)
+
+
+def test_normalizers_parsed_prefix_host_bits():
+    prefix = IPv4Prefix(address=3232235777, prefix_length=24)
+
+    with pytest.raises(AnsiblePluginError, match="is_ipv4_subnet error: 192.168.1.1/24 has host bits set"):
+        ios_standard_acl_ipv4_subnet_normalizer(prefix)
+
+    # The EOS normalizers only convert a /32, other values are returned as they are
+    assert eos_standard_acl_ipv4_subnet_normalizer(prefix) == "192.168.1.1/24"
+
+
+@pytest.mark.parametrize(
+    "normalizer, value, message",
+    [
+        (
+            cidr_to_inverse_mask,
+            24,
+            "exception: cidr_to_inverse_mask error: exception: is_ipv4_subnet error: 24 is not a valid ipv4 subnet "
+            "address",
+        ),
+        (
+            cidr_to_inverse_mask,
+            None,
+            "exception: cidr_to_inverse_mask error: exception: is_ipv4_subnet error: None is not a valid ipv4 subnet "
+            "address",
+        ),
+        (
+            cidr_to_inverse_mask,
+            ["192.168.1.0/24"],
+            "exception: cidr_to_inverse_mask error: exception: is_ipv4_subnet error: ['192.168.1.0/24'] is not a "
+            "valid ipv4 subnet address",
+        ),
+        (
+            ios_standard_acl_ipv4_subnet_normalizer,
+            24,
+            "exception: ios_standard_acl_ipv4_subnet_normalizer error: 'int' object has no attribute 'split'",
+        ),
+        (
+            eos_extended_acl_ipv4_subnet_normalizer,
+            None,
+            "exception: eos_extended_acl_ipv4_subnet_normalizer error: 'NoneType' object has no attribute 'split'",
+        ),
+    ],
+)
+def test_normalizers_not_a_string(normalizer, value, message):
+    # A value that is not a string or a parsed prefix fails with the same error as before the mask tables
+    with pytest.raises(AnsiblePluginError) as error:
+        normalizer(value)
+
+    assert error.value.message == message
+
+
+@pytest.mark.parametrize("prefix_length", range(33))
+def test_mask_tables(prefix_length):
+    ipv4_obj = ipaddress.IPv4Network(f"10.20.30.40/{prefix_length}", strict=False)
+
+    assert IPV4_INVERSE_MASKS[prefix_length] == str(ipv4_obj.hostmask)
+    assert INVERSE_MASK_PREFIX_LENGTHS[str(ipv4_obj.hostmask)] == prefix_length
+    assert cidr_to_inverse_mask(str(ipv4_obj)) == f"{ipv4_obj.network_address} {ipv4_obj.hostmask}"
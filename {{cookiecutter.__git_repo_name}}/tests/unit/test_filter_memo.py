@@ -0,0 +1,105 @@
+from plugins.module_utils.render.filter_memo import (
+    FilterMemo,
+    MemoizedFilter,
+    get_filter_memo,
+)
+from plugins.module_utils.render.render_settings import setting_name
+import pytest
+from ansible.errors import AnsibleFilterError
+from jinja2 import Undefined
+
+
+def make_filter():
+    calls = []
+
+    def double(value):
+        calls.append(value)
+        if value == "bad":
+            raise AnsibleFilterError(f"bad value {value}")
+
+        return value * 2
+
+    return double, calls
+
+
+def test_memoized_filter():
+    double, calls = make_filter()
+    memoized_filter = MemoizedFilter(function=double, max_size=2)
+
+    assert memoized_filter(2) == 4
+    assert memoized_filter(2) == 4
+    assert memoized_filter(value=2) == 4
+    assert memoized_filter("ab") == "abab"
+    assert memoized_filter(3) == 6
+    assert memoized_filter(2) == 4
+    assert calls == [2, 2, "ab", 3, 2]
+    assert memoized_filter.stats() == {"hits": 1, "misses": 5, "evictions": 3, "size": 2}
+    assert memoized_filter.__name__ == "double"
+
+    memoized_filter.clear()
+    assert memoized_filter.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0}
+
+
+def test_memoized_filter_caches_errors():
+    double, calls = make_filter()
+    memoized_filter = MemoizedFilter(function=double)
+
+    for _ in range(3):
+        with pytest.raises(AnsibleFilterError):
+            memoized_filter("bad")
+
+    assert calls == ["bad"]
+    assert memoized_filter.stats()["hits"] == 2
+
+
+def test_memoized_filter_keeps_types():
+    double, calls = make_filter()
+    memoized_filter = MemoizedFilter(function=double)
+
+    assert memoized_filter(1) == 2
+    assert memoized_filter(True) == 2
+    assert memoized_filter(["log"]) == ["log", "log"]
+    assert memoized_filter(("log",)) == ("log", "log")
+    assert calls == [1, True, ["log"], ("log",)]
+
+
+def test_memoized_filter_not_cached():
+    def name(value):
+        return type(value).__name__
+
+    memoized_filter = MemoizedFilter(function=name)
+
+    assert memoized_filter(Undefined()) == "Undefined"
+    assert memoized_filter({1: "a", "b": "c"}) == "dict"
+    assert memoized_filter.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0}
+
+
+def test_memoized_filter_bad():
+    with pytest.raises(ValueError):
+        MemoizedFilter(function=len, max_size=0)
+
+
+def test_filter_memo():
+    double, _ = make_filter()
+    filter_memo = FilterMemo(max_size=8)
+
+    memoized_filter = filter_memo.wrap(filter_name="double", function=double)
+    assert filter_memo.wrap(filter_name="double", function=double) is memoized_filter
+
+    memoized_filter(2)
+    memoized_filter(2)
+    assert filter_memo.stats() == {"double": {"hits": 1, "misses": 1, "evictions": 0, "size": 1}}
+
+    filter_memo.clear()
+    assert filter_memo.stats() == {"double": {"hits": 0, "misses": 0, "evictions": 0, "size": 0}}
+
+
+def test_get_filter_memo(monkeypatch):
+    monkeypatch.delenv(setting_name("FILTER_MEMO"), raising=False)
+    assert get_filter_memo() is None
+
+    monkeypatch.setenv(setting_name("FILTER_MEMO"), "true")
+    monkeypatch.setenv(setting_name("FILTER_MEMO_MAX_SIZE"), "16")
+    filter_memo = get_filter_memo()
+
+    assert filter_memo is get_filter_memo()
@@ -1,13 +1,17 @@
 from plugins.module_utils.validators.ip_address_validators import (
+    IPv4Prefix,
     is_ipv4_host,
     is_ipv4_subnet,
     is_ipv4_prefix,
     is_cidr_range,
+    parse_ipv4_prefix,
+    parse_ipv4_subnet,
 )
+import ipaddress
+import random
 import pytest
 from ansible.errors import AnsiblePluginError
 
-
 ipv4_host_table = [
     ("192.168.1.1", "192.168.1.1", None),
     ("172.16.1.25", "172.16.1.25", None),
@@ -92,3 +96,79 @@ def test_is_cidr_range(value, response, exception_raise):
 
     else:
         assert is_cidr_range(value) == response
+
+
+def test_parse_ipv4_prefix():
+    prefix = parse_ipv4_prefix("192.168.1.1/24")
+
+    assert prefix == IPv4Prefix(address=3232235777, prefix_length=24, version=4)
+    assert prefix.network == 3232235776
+    assert prefix.netmask == 0xFFFFFF00
+    assert prefix.hostmask == 0xFF
+    assert not prefix.is_subnet
+    assert str(prefix) == prefix.with_prefixlen == "192.168.1.1/24"
+    assert parse_ipv4_prefix(prefix) is prefix
+    assert is_ipv4_prefix(prefix) is prefix
+
+
+@pytest.mark.parametrize(
+    "value", ["192.168.01.1/24", "192.168.1.1/024", "192.168.1.1/33", "192.168.1/24", "+1.2.3.4/8", " 1.2.3.4/8"]
+)
+def test_parse_ipv4_prefix_bad(value):
+    with pytest.raises(AnsiblePluginError):
+        parse_ipv4_prefix(value)
+
+
+def test_parse_ipv4_subnet():
+    subnet = parse_ipv4_subnet("192.168.1.0/24")
+
+    assert subnet.is_subnet
+    assert parse_ipv4_subnet(subnet) is subnet
+    assert is_ipv4_subnet(subnet) is subnet
+
+    with pytest.raises(AnsiblePluginError):
+        parse_ipv4_subnet(parse_ipv4_prefix("192.168.1.1/24"))
+
+
+def test_parse_ipv4_prefix_matches_ipaddress():
+    generator = random.Random(4)
+
+    for _ in range(2000):
+        prefix_length = generator.randint(0, 32)
+        interface = ipaddress.IPv4Interface((generator.getrandbits(32), prefix_length))
+        prefix = parse_ipv4_prefix(interface.with_prefixlen)
+
+        assert prefix.address == int(interface.ip)
+        assert prefix.network == int(interface.network.network_address)
+        assert prefix.hostmask == int(interface.network.hostmask)
+        assert prefix.is_subnet == (interface.ip == interface.network.network_address)
+        assert prefix.with_prefixlen == interface.with_prefixlen
+
+
+@pytest.mark.parametrize(
+    "function,value,message",
+    [
+        (parse_ipv4_prefix, "x", "exception: is_ipv4_prefix error: x is not a valid ipv4 prefix address in CIDR format"),
+        (
+            parse_ipv4_prefix,
+            "10.0.0.256/24",
+            "exception: is_ipv4_prefix error: '10.0.0.256/24' does not appear to be an IPv4 or IPv6 interface",
+        ),
+        (parse_ipv4_subnet, "10.0.0.1/24", "exception: is_ipv4_subnet error: 10.0.0.1/24 has host bits set"),
+        (parse_ipv4_subnet, "10.0.0.1", "exception: is_ipv4_subnet error: 10.0.0.1 is not a valid ipv4 subnet address"),
+        (is_ipv4_subnet, "10.0.0.0/024", "exception: is_ipv4_subnet error: 10.0.0.0/024 is not a valid ipv4 subnet address"),
+        (is_ipv4_subnet, 24, "exception: is_ipv4_subnet error: 24 is not a valid ipv4 subnet address"),
+        (is_ipv4_subnet, None, "exception: is_ipv4_subnet error: None is not a valid ipv4 subnet address"),
+        (
+            is_ipv4_subnet,
+            ["10.0.0.0/24"],
+            "exception: is_ipv4_subnet error: ['10.0.0.0/24'] is not a valid ipv4 subnet address",
+        ),
+        (parse_ipv4_subnet, 24, "exception: is_ipv4_subnet error: 24 is not a valid ipv4 subnet address"),
+    ],
+)
+def test_parse_ipv4_errors(function, value, message):
+    with pytest.raises(AnsiblePluginError) as error:
+        function(value)
+
+    assert error.value.message == message
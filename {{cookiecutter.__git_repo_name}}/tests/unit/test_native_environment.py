@@ -0,0 +1,68 @@
+from plugins.module_utils.render.native_environment import (
+    create_native_environment,
+    get_native_environment,
+    has_template_syntax,
+    is_trusted_template,
+    native_finalize,
+)
+from plugins.module_utils.render.render_settings import COLLECTION_NAMESPACE, COLLECTION_NAME
+from plugins.filter.render_filters import ipv4_subnet
+import pytest
+from ansible.utils.unsafe_proxy import AnsibleUnsafeText
+from jinja2.defaults import (
+    BLOCK_END_STRING,
+    BLOCK_START_STRING,
+    COMMENT_END_STRING,
+    COMMENT_START_STRING,
+    VARIABLE_END_STRING,
+    VARIABLE_START_STRING,
+)
+from jinja2.exceptions import UndefinedError
+
+
+def test_native_finalize():
+    assert native_finalize(None) == ""
+    assert native_finalize("router1") == "router1"
+    assert native_finalize(iter([1, 2])) == [1, 2]
+    assert native_finalize({"a": 1}.keys()) == ["a"]
+    assert native_finalize(range(2)) == [0, 1]
+
+
+def test_native_finalize_undefined():
+    environment = create_native_environment()
+
+    with pytest.raises(UndefinedError):
+        native_finalize(environment.undefined(name="missing"))
+
+    with pytest.raises(UndefinedError):
+        native_finalize([1, {"a": environment.undefined(name="missing")}])
+
+
+def test_create_native_environment():
+    environment = create_native_environment()
+
+    assert environment.trim_blocks
+    assert environment.filters[f"{COLLECTION_NAMESPACE}.{COLLECTION_NAME}.ipv4_subnet"].__name__ == ipv4_subnet.__name__
+    assert "ipv4_subnet" not in environment.filters
+
+
+def test_get_native_environment():
+    assert get_native_environment() is get_native_environment()
+
+
+def test_is_trusted_template(tmp_path):
+    templates_directory = tmp_path / "templates"
+
+    assert is_trusted_template(str(templates_directory / "ios" / "main" / "acl.j2"), str(templates_directory))
+    assert not is_trusted_template(str(tmp_path / "templates_other" / "acl.j2"), str(templates_directory))
+    assert not is_trusted_template(str(templates_directory / ".." / "acl.j2"), str(templates_directory))
+    assert not is_trusted_template(str(templates_directory / "acl.j2"), None)
+
+
+def test_has_template_syntax():
+    assert has_template_syntax(f"owner {VARIABLE_START_STRING} name {VARIABLE_END_STRING}")
+    assert has_template_syntax([{"remark": f"{BLOCK_START_STRING} if true {BLOCK_END_STRING}"}])
+    assert has_template_syntax({f"{COMMENT_START_STRING} comment {COMMENT_END_STRING}": 1})
+    assert not has_template_syntax("no template {")
+    assert not has_template_syntax([{"sequence": 10, "remark": "plain"}])
+    assert not has_template_syntax(AnsibleUnsafeText(f"owner {VARIABLE_START_STRING} name {VARIABLE_END_STRING}"))
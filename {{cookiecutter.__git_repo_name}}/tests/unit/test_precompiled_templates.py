@@ -0,0 +1,98 @@
+from plugins.module_utils.render.precompiled_templates import (
+    source_checksum,
+    compiled_module_name,
+    compile_templates_directory,
+    PrecompiledTemplates,
+    get_precompiled_templates,
+)
+from plugins.module_utils.render.render_settings import setting_name
+from plugins.module_utils.render.template_cache import CompiledTemplateCache
+from jinja2 import Environment
+import pytest
+
+
+@pytest.fixture
+def templates_directory(tmp_path):
+    templates_path = tmp_path / "templates"
+    for relative_path in ["ios/main/ntp.j2", "nxos/main/ntp.j2"]:
+        template_path = templates_path.joinpath(*relative_path.split("/"))
+        template_path.parent.mkdir(parents=True, exist_ok=True)
+        template_path.write_text(f"ntp server for {relative_path.split('/')[0]}\n")
+
+    templates_path.joinpath("ios", "main", "override.j2").write_text("#jinja2: trim_blocks: False\nntp server\n")
+    templates_path.joinpath("README.md").write_text("not a template")
+
+    return templates_path
+
+
+def test_source_checksum():
+    assert source_checksum("ntp") == source_checksum("ntp")
+    assert source_checksum("ntp") != source_checksum("ntp ")
+
+
+def test_compiled_module_name():
+    assert compiled_module_name("ios/main/ntp.j2").startswith("tmpl_")
+    assert compiled_module_name("ios/main/ntp.j2") != compiled_module_name("nxos/main/ntp.j2")
+
+
+def test_compile_templates_directory(templates_directory):
+    compiled_directory = templates_directory.parent / "compiled_templates"
+    compiled_templates = compile_templates_directory(
+        templates_directory=str(templates_directory),
+        compiled_directory=str(compiled_directory),
+        environment=Environment(),
+    )
+
+    # The template with a #jinja2: override header is rendered with Templar.template, so it is not compiled
+    assert sorted(compiled_templates) == ["ios/main/ntp.j2", "nxos/main/ntp.j2"]
+    assert compiled_directory.joinpath(f"{compiled_module_name('ios/main/ntp.j2')}.py").is_file()
+
+
+def test_precompiled_templates_load(templates_directory):
+    environment = Environment()
+    compile_templates_directory(
+        templates_directory=str(templates_directory),
+        compiled_directory=str(templates_directory.parent / "compiled_templates"),
+        environment=environment,
+    )
+    template_path = templates_directory / "ios" / "main" / "ntp.j2"
+    precompiled_templates = PrecompiledTemplates(templates_directory=str(templates_directory))
+
+    template = precompiled_templates.load(environment, str(template_path), template_path.read_text())
+
+    assert template.render() == "ntp server for ios"
+    assert precompiled_templates.load(environment, str(template_path), "changed source") is None
+    assert (
+        precompiled_templates.load(Environment(trim_blocks=True), str(template_path), template_path.read_text()) is None
+    )
+    assert precompiled_templates.load(environment, "/other/ntp.j2", "ntp") is None
+    assert precompiled_templates.load_code(environment, "/other/ntp.j2", "ntp") is None
+
+
+def test_compiled_template_cache_uses_precompiled_templates(templates_directory):
+    environment = Environment()
+    compile_templates_directory(
+        templates_directory=str(templates_directory),
+        compiled_directory=str(templates_directory.parent / "compiled_templates"),
+        environment=environment,
+    )
+    template_path = templates_directory / "ios" / "main" / "ntp.j2"
+    cache = CompiledTemplateCache()
+
+    compiled_template = cache.get_template(
+        str(template_path),
+        environment,
+        precompiled_templates=PrecompiledTemplates(templates_directory=str(templates_directory)),
+    )
+
+    assert compiled_template.template.render() == "ntp server for ios"
+    assert cache.stats()["precompiled_loads"] == 1
+
+
+def test_get_precompiled_templates(monkeypatch, templates_directory):
+    monkeypatch.delenv(setting_name("PRECOMPILED_TEMPLATES"), raising=False)
+    assert get_precompiled_templates(None) is None
+    assert get_precompiled_templates(str(templates_directory)) is get_precompiled_templates(str(templates_directory))
+
+    monkeypatch.setenv(setting_name("PRECOMPILED_TEMPLATES"), "false")
+    assert get_precompiled_templates(str(templates_directory)) is None
@@ -0,0 +1,177 @@
+from plugins.module_utils.render import render_cache as render_cache_module
+from plugins.module_utils.render.render_cache import (
+    RenderCache,
+    get_render_cache,
+    plugins_checksum,
+    render_cache_key,
+)
+from plugins.module_utils.render.render_settings import setting_name
+import os
+import time
+import pytest
+from ansible import constants as C
+
+
+def test_render_cache_key():
+    key = render_cache_key(
+        source_checksum="abc",
+        template_variables={"name": "TEST", "sequences": [1, 2]},
+        ansible_network_os="ios",
+        render_mode="templar",
+    )
+
+    assert key == render_cache_key(
+        source_checksum="abc",
+        template_variables={"sequences": [1, 2], "name": "TEST"},
+        ansible_network_os="ios",
+        render_mode="templar",
+    )
+    assert key != render_cache_key(
+        source_checksum="abd",
+        template_variables={"name": "TEST", "sequences": [1, 2]},
+        ansible_network_os="ios",
+        render_mode="templar",
+    )
+    assert key != render_cache_key(
+        source_checksum="abc",
+        template_variables={"name": "TEST", "sequences": [2, 1]},
+        ansible_network_os="ios",
+        render_mode="templar",
+    )
+    assert key != render_cache_key(
+        source_checksum="abc",
+        template_variables={"name": "TEST", "sequences": [1, 2]},
+        ansible_network_os="nxos",
+        render_mode="templar",
+    )
+
+
+def test_render_cache_key_render_mode():
+    assert render_cache_key(
+        source_checksum="abc", template_variables={"name": "TEST"}, ansible_network_os="ios", render_mode="templar"
+    ) != render_cache_key(
+        source_checksum="abc", template_variables={"name": "TEST"}, ansible_network_os="ios", render_mode="native"
+    )
+
+
+def test_render_cache_key_plugins_checksum(monkeypatch):
+    def key():
+        return render_cache_key(
+            source_checksum="abc", template_variables={"name": "TEST"}, ansible_network_os="ios", render_mode="templar"
+        )
+
+    monkeypatch.setattr(render_cache_module, "plugins_checksum", lambda: "1" * 64)
+    first_key = key()
+    assert first_key == key()
+
+    monkeypatch.setattr(render_cache_module, "plugins_checksum", lambda: "2" * 64)
+    assert first_key != key()
+
+
+def test_plugins_checksum(tmp_path):
+    (tmp_path / "filter").mkdir()
+    (tmp_path / "filter" / "filters.py").write_text("VERSION = 1\n")
+    (tmp_path / "README.md").write_text("Not code\n")
+    checksum = plugins_checksum(plugins_directory=str(tmp_path))
+
+    assert len(checksum) == 64
+    assert checksum == plugins_checksum(plugins_directory=str(tmp_path))
+    assert plugins_checksum(plugins_directory=str(tmp_path / "filter")) != checksum
+    assert plugins_checksum() != checksum
+
+
+def test_render_cache_key_not_cacheable():
+    assert (
+        render_cache_key(
+            source_checksum="abc",
+            template_variables={"data": object()},
+            ansible_network_os="ios",
+            render_mode="templar",
+        )
+        is None
+    )
+
+
+def test_render_cache(tmp_path):
+    cache = RenderCache(directory=str(tmp_path / "cache"))
+
+    assert cache.get(key="one") is None
+    cache.set(key="one", rendered="hostname router1\n")
+
+    assert cache.get(key="one") == "hostname router1\n"
+    assert cache.size() == 17
+    assert RenderCache(directory=str(tmp_path / "cache")).get(key="one") == "hostname router1\n"
+
+    cache.clear()
+    assert cache.get(key="one") is None
+    assert cache.size() == 0
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(directory=str(tmp_path), max_size=10)
+
+    cache.set(key="one", rendered="1111")
+    time.sleep(0.01)
+    cache.set(key="two", rendered="2222")
+    time.sleep(0.01)
+    cache.get(key="one")
+    time.sleep(0.01)
+    cache.set(key="three", rendered="3333")
+
+    assert cache.get(key="one") == "1111"
+    assert cache.get(key="two") is None
+    assert cache.get(key="three") == "3333"
+    assert cache.size() == 8
+
+
+def test_render_cache_size_running_total(tmp_path):
+    cache = RenderCache(directory=str(tmp_path))
+
+    cache.set(key="one", rendered="1111")
+    cache.set(key="one", rendered="11")
+    cache.set(key="two", rendered="222")
+    assert cache.size() == 5
+
+    other_cache = RenderCache(directory=str(tmp_path))
+    other_cache.set(key="three", rendered="3")
+    assert cache.size() == 6
+
+    other_cache.clear()
+    assert cache.size() == 0
+
+
+def test_render_cache_too_large_is_not_cached(tmp_path):
+    cache = RenderCache(directory=str(tmp_path), max_size=2)
+    cache.set(key="one", rendered="111")
+
+    assert cache.get(key="one") is None
+
+
+def test_render_cache_bad(tmp_path):
+    with pytest.raises(ValueError):
+        RenderCache(directory=str(tmp_path), max_size=0)
+
+
+def test_get_render_cache(monkeypatch, tmp_path):
+    monkeypatch.delenv(setting_name("RENDER_CACHE_PATH"), raising=False)
+    monkeypatch.delenv(setting_name("RENDER_DEDUP"), raising=False)
+    assert get_render_cache() is None
+
+    monkeypatch.setenv(setting_name("RENDER_DEDUP"), "false")
+    assert get_render_cache() is None
+
+    monkeypatch.setenv(setting_name("RENDER_CACHE_PATH"), str(tmp_path / "cache"))
+    render_cache = get_render_cache()
+
+    assert render_cache is get_render_cache()
+    assert os.path.isdir(tmp_path / "cache")
+
+
+def test_get_render_cache_run(monkeypatch, tmp_path):
+    monkeypatch.delenv(setting_name("RENDER_CACHE_PATH"), raising=False)
+    monkeypatch.setenv(setting_name("RENDER_DEDUP"), "true")
+    monkeypatch.setattr(C, "DEFAULT_LOCAL_TMP", str(tmp_path))
+    render_cache = get_render_cache()
+
+    assert render_cache is get_render_cache()
+    assert os.path.isdir(tmp_path / "render_cache")
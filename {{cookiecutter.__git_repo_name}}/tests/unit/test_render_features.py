@@ -0,0 +1,148 @@
+from plugins.action.render_features import ActionModule
+from ansible.errors import AnsibleActionFail
+from ansible.parsing.dataloader import DataLoader
+from ansible.playbook.play_context import PlayContext
+from ansible.playbook.task import Task
+from ansible.plugins.connection.local import Connection
+from ansible.template import Templar
+import os
+import pathlib
+import pytest
+
+TEMPLATES_PATH = pathlib.Path(__file__).resolve().parents[2] / "templates"
+
+# The standard_acl.j2 templates are only generated with the example action plugins
+requires_example_templates = pytest.mark.skipif(
+    not (TEMPLATES_PATH / "ios" / "main" / "standard_acl.j2").is_file(),
+    reason="the collection was generated without the example action plugins and their templates",
+)
+
+STANDARD_ACLS = [
+    {
+        "name": "TEST",
+        "sequences": [
+            {"sequence": 10, "action": "remark", "remark": "TEST"},
+            {"sequence": 20, "action": "permit", "source": "10.0.0.0/8"},
+        ],
+    },
+]
+
+MANAGEMENT_ACLS = [{"name": "MGMT", "sequences": [{"sequence": 10, "action": "permit", "source": "192.168.1.1/32"}]}]
+
+TASK_VARS = {
+    "inventory_hostname": "router1",
+    "hostvars": {"router1": {"ansible_network_os": "ios", "standard_acls": STANDARD_ACLS}},
+}
+
+FEATURES = {
+    "standard_acls": {"template_name": "standard_acl.j2", "from_hostvars": True},
+    "management_acls": {"template_name": "standard_acl.j2", "validator": "standard_acls", "data": MANAGEMENT_ACLS},
+}
+
+
+def action_module(args: dict) -> ActionModule:
+    task = Task()
+    task.args = args
+    play_context = PlayContext()
+    loader = DataLoader()
+
+    return ActionModule(
+        task=task,
+        connection=Connection(play_context, os.devnull),
+        play_context=play_context,
+        loader=loader,
+        templar=Templar(loader=loader),
+        shared_loader_obj=None,
+    )
+
+
+@requires_example_templates
+@pytest.mark.parametrize("output", ["text", "lines", "both", None])
+def test_render_features(output):
+    args = {"features": FEATURES} if output is None else {"features": FEATURES, "output": output}
+    result = action_module(args=args).run(task_vars=TASK_VARS)
+    rendered = {
+        "standard_acls": "ip access-list standard TEST\n 10 remark TEST\n 20 permit 10.0.0.0/8\n",
+        "management_acls": "ip access-list standard MGMT\n 10 permit 192.168.1.1/32\n",
+    }
+
+    assert result["changed"] is False
+    assert list(result["features"]) == ["standard_acls", "management_acls"]
+
+    for feature_name, feature_result in result["features"].items():
+        expected = {}
+        if output in ("text", "both", None):
+            expected["rendered"] = [rendered[feature_name]]
+
+        if output in ("lines", "both", None):
+            expected["rendered_lines"] = rendered[feature_name].splitlines()
+
+        assert feature_result == expected
+
+
+@requires_example_templates
+def test_render_features_errors():
+    features = {
+        "standard_acls": {
+            "template_name": "standard_acl.j2",
+            "data": [{"name": "TEST", "sequences": [{"sequence": 10, "action": "allow", "source": "10.0.0.0/8"}]}],
+        },
+        "management_acls": {
+            "template_name": "standard_acl.j2",
+            "validator": "standard_acls",
+            "data": [{"name": "MGMT", "sequences": [{"sequence": 10, "action": "remark"}]}],
+        },
+    }
+
+    with pytest.raises(AnsibleActionFail) as error:
+        action_module(args={"features": features}).run(task_vars=TASK_VARS)
+
+    errors = error.value.result["errors"]
+    assert [feature_error.split(":")[0] for feature_error in errors] == [
+        "standard_acls[0].sequences[0].action",
+        "management_acls[0].sequences[0].remark",
+    ]
+    assert error.value.message == f"2 features errors: {'; '.join(errors)}"
+
+
+@requires_example_templates
+def test_render_features_no_validator():
+    features = {"hostnames": {"template_name": "standard_acl.j2", "data": [{"name": "TEST", "sequences": []}]}}
+
+    result = action_module(args={"features": features, "output": "lines"}).run(task_vars=TASK_VARS)
+
+    assert result["features"] == {"hostnames": {"rendered_lines": ["ip access-list standard TEST"]}}
+
+
+def test_render_features_src(tmp_path):
+    src = tmp_path / "hostname.j2"
+    src.write_text("hostname {{ name }}\n")
+    features = {"hostnames": {"src": str(src), "data": [{"name": "router1"}]}}
+
+    result = action_module(args={"features": features, "output": "lines"}).run(task_vars=TASK_VARS)
+
+    assert result["features"] == {"hostnames": {"rendered_lines": ["hostname router1"]}}
+
+
+@pytest.mark.parametrize(
+    "args,message",
+    [
+        ({}, "'features' must be of type dict"),
+        ({"features": {}}, "'features' must have at least one feature"),
+        ({"features": {"standard_acls": []}}, "feature 'standard_acls' must be of type dict"),
+        ({"features": {"standard_acls": {"data": STANDARD_ACLS}}}, "requires option 'template_name' or 'src'"),
+        ({"features": {"standard_acls": {"template_name": "standard_acl.j2"}}}, "required option 'data'"),
+        (
+            {"features": {"acls": {"template_name": "standard_acl.j2", "from_hostvars": True}}},
+            "could not find data for feature 'acls'",
+        ),
+        ({"features": FEATURES, "output": "file"}, "'output' must be one of"),
+        (
+            {"features": {"acls": {"template_name": "standard_acl.j2", "validator": "acls", "data": STANDARD_ACLS}}},
+            r"feature 'acls' option 'validator' must be one of \['standard_acls'\] but received 'acls'",
+        ),
+    ],
+)
+def test_render_features_bad(args, message):
+    with pytest.raises(AnsibleActionFail, match=message):
+        action_module(args=args).run(task_vars=TASK_VARS)
@@ -15,11 +15,16 @@ from plugins.filter.render_filters import (
     permit_deny,
     le_ge,
     cidr_range,
+    ipv4_subnet_list,
+    standard_acl_ipv4_subnet_normalizer_list,
+    protocol_list,
+    port_or_ports_list,
+    standard_acl_lines,
 )
+from plugins.module_utils.render.render_settings import setting_name
 import pytest
 from ansible.errors import AnsibleFilterError
 
-
 ipv4_host_table = [
     ("192.168.1.1", "192.168.1.1", None),
     ("172.16.1.25", "172.16.1.25", None),
@@ -121,6 +126,21 @@ extended_acl_ipv4_subnet_normalizer_table = [
 ]
 
 
+@pytest.mark.parametrize(
+    "value,message",
+    [
+        ("x", "error: exception: is_ipv4_prefix error: x is not a valid ipv4 prefix address in CIDR format"),
+        ("10.1.0.1/16", "error: 10.1.0.1/16 has host bits set"),
+    ],
+)
+def test_standard_acl_ipv4_subnet_normalizer_filter_errors(value, message):
+    for nos in ("ios", "iosxr", "eos", "nxos"):
+        with pytest.raises(AnsibleFilterError) as error:
+            standard_acl_ipv4_subnet_normalizer(value, nos)
+
+        assert error.value.message == f"exception: standard_acl_ipv4_subnet_normalizer {message}"
+
+
 @pytest.mark.parametrize("value,nos,response,exception_raise", extended_acl_ipv4_subnet_normalizer_table)
 def test_extended_acl_ipv4_subnet_normalizer_filter(value, nos, response, exception_raise):
     if exception_raise:
@@ -345,6 +365,120 @@ def test_cidr_range_filter(value, response, exception_raise):
         assert cidr_range(value) == response
 
 
+def test_ipv4_subnet_list_filter():
+    values = [value for value, _, exception_raise in ipv4_subnet_table if not exception_raise]
+
+    assert ipv4_subnet_list(values) == values
+    assert ipv4_subnet_list([]) == []
+
+    with pytest.raises(AnsibleFilterError, match="index 1"):
+        ipv4_subnet_list(["10.1.0.0/16", "10.1.0.0"])
+
+    with pytest.raises(AnsibleFilterError):
+        ipv4_subnet_list("10.1.0.0/16")
+
+
+@pytest.mark.parametrize("nos", ["ios", "iosxr", "eos", "nxos"])
+def test_standard_acl_ipv4_subnet_normalizer_list_filter(nos):
+    table = [row for row in standard_acl_ipv4_subnet_normalizer_table if row[1] == nos and not row[3]]
+
+    assert standard_acl_ipv4_subnet_normalizer_list([row[0] for row in table], nos) == [row[2] for row in table]
+
+    with pytest.raises(AnsibleFilterError, match="index 2"):
+        standard_acl_ipv4_subnet_normalizer_list(["any", "10.1.0.0/16", "10.1.0.0"], nos)
+
+
+def test_standard_acl_ipv4_subnet_normalizer_list_filter_errors():
+    with pytest.raises(AnsibleFilterError):
+        standard_acl_ipv4_subnet_normalizer_list(["10.1.0.0/16"], "other")
+
+    with pytest.raises(AnsibleFilterError):
+        standard_acl_ipv4_subnet_normalizer_list(None, "ios")
+
+
+def test_protocol_list_filter():
+    values = [value for value, _, exception_raise in protocol_table if not exception_raise]
+
+    assert protocol_list(values) == values
+
+    with pytest.raises(AnsibleFilterError, match="index 1"):
+        protocol_list(["ip", "other"])
+
+
+def test_port_or_ports_list_filter():
+    valid_table = [row for row in port_or_ports_table if not row[4]]
+
+    for value, port_match_value, nos, response, _ in valid_table:
+        assert port_or_ports_list([value], port_match_value, nos) == [response]
+
+    ios_table = [row for row in valid_table if row[2] == "ios"]
+    assert port_or_ports_list([row[0] for row in ios_table], [row[1] for row in ios_table], "ios") == [
+        row[3] for row in ios_table
+    ]
+    assert port_or_ports_list(["22", "80"], "eq", "ios") == [22, 80]
+    assert port_or_ports_list(["1000,2000"], "range", "other") == ["1000 2000"]
+
+    with pytest.raises(AnsibleFilterError, match="index 1"):
+        port_or_ports_list(["1000,2000", "2000,1000"], "range", "ios")
+
+    with pytest.raises(AnsibleFilterError, match="must have 2 items"):
+        port_or_ports_list(["22", "80"], ["eq"], "ios")
+
+    with pytest.raises(AnsibleFilterError):
+        port_or_ports_list(["22"], "other", "ios")
+
+
+standard_acl_lines_acl = {
+    "name": "MGMT",
+    "sequences": [
+        {"sequence": 10, "action": "remark", "remark": "management"},
+        {"sequence": 20, "action": "permit", "source": "10.0.0.0/8", "append_option_to_end": " log"},
+        {"sequence": 30, "action": "deny", "source": "any"},
+    ],
+}
+
+standard_acl_lines_table = [
+    (
+        "ios",
+        [
+            "ip access-list standard MGMT",
+            " 10 remark management",
+            " 20 permit 10.0.0.0 0.255.255.255 log",
+            " 30 deny any",
+        ],
+    ),
+    (
+        "nxos",
+        ["ip access-list MGMT", " 10 remark management", " 20 permit 10.0.0.0/8 any log", " 30 deny any any"],
+    ),
+    (
+        "eos",
+        ["ip access-list standard MGMT", " 10 remark management", " 20 permit 10.0.0.0/8 log", " 30 deny any"],
+    ),
+]
+
+
+@pytest.mark.parametrize("nos,response", standard_acl_lines_table)
+def test_standard_acl_lines_filter(nos, response):
+    assert standard_acl_lines(standard_acl_lines_acl, nos) == response
+
+
+def test_standard_acl_lines_filter_errors():
+    acl = {
+        "name": "MGMT",
+        "sequences": [
+            {"sequence": 10, "action": "permit", "source": "10.0.0.1/8"},
+            {"sequence": 10, "action": "other"},
+        ],
+    }
+
+    with pytest.raises(AnsibleFilterError, match="3 standard acl errors: sequences\\[0\\].source: .*sequences\\[1\\]"):
+        standard_acl_lines(acl, "ios")
+
+    with pytest.raises(AnsibleFilterError):
+        standard_acl_lines(standard_acl_lines_acl, "other")
+
+
 filter_module_table = [
     ("ipv4_host", ipv4_host),
     ("ipv4_subnet", ipv4_subnet),
@@ -361,6 +495,11 @@ filter_module_table = [
     ("permit_deny", permit_deny),
     ("le_ge", le_ge),
     ("cidr_range", cidr_range),
+    ("ipv4_subnet_list", ipv4_subnet_list),
+    ("standard_acl_ipv4_subnet_normalizer_list", standard_acl_ipv4_subnet_normalizer_list),
+    ("protocol_list", protocol_list),
+    ("port_or_ports_list", port_or_ports_list),
+    ("standard_acl_lines", standard_acl_lines),
 ]
 
 
@@ -373,3 +512,20 @@ def test_filter_module(filter_name, filter_callable):
     returned_filter_callable = obj.filters().get(filter_name)
 
     assert type(returned_filter_callable) == type(filter_callable)
+
+
+def test_filter_module_memo(monkeypatch):
+    monkeypatch.setenv(setting_name("FILTER_MEMO"), "true")
+    monkeypatch.setenv(setting_name("FILTER_MEMO_MAX_SIZE"), "128")
+    filters = FilterModule().filters()
+    normalizer = filters["standard_acl_ipv4_subnet_normalizer"]
+    normalizer.clear()
+
+    assert filters["ipv4_host"] is FilterModule().filters()["ipv4_host"]
+    for _ in range(3):
+        assert normalizer("10.1.0.0/16", "ios") == "10.1.0.0 0.0.255.255"
+
+        with pytest.raises(AnsibleFilterError):
+            normalizer("10.1.0.1/16", "ios")
+
+    assert normalizer.stats() == {"hits": 4, "misses": 2, "evictions": 0, "size": 2}
@@ -0,0 +1,63 @@
+from plugins.module_utils.render.render_pool import (
+    available_processes,
+    map_shards,
+    shard_bounds,
+)
+import os
+import pytest
+
+
+def test_available_processes():
+    assert available_processes() >= 1
+
+
+@pytest.mark.parametrize(
+    "item_count, shard_count, expected",
+    [
+        (10, 3, [(0, 4), (4, 7), (7, 10)]),
+        (4, 4, [(0, 1), (1, 2), (2, 3), (3, 4)]),
+        (2, 8, [(0, 1), (1, 2)]),
+        (5, 1, [(0, 5)]),
+        (0, 4, []),
+    ],
+)
+def test_shard_bounds(item_count, shard_count, expected):
+    assert shard_bounds(item_count=item_count, shard_count=shard_count) == expected
+
+
+def test_shard_bounds_bad():
+    with pytest.raises(ValueError):
+        shard_bounds(item_count=10, shard_count=0)
+
+
+def test_map_shards():
+    items = [f"ACL_{number}" for number in range(50)]
+
+    def shard_function(start, stop):
+        return items[start:stop], os.getpid()
+
+    results = map_shards(shard_function=shard_function, item_count=len(items), processes=3)
+
+    assert [item for shard_items, _ in results for item in shard_items] == items
+    assert os.getpid() not in {pid for _, pid in results}
+
+
+def test_map_shards_one_process():
+    def shard_function(start, stop):
+        return start, stop, os.getpid()
+
+    assert map_shards(shard_function=shard_function, item_count=50, processes=1) == [(0, 50, os.getpid())]
+    assert map_shards(shard_function=shard_function, item_count=0, processes=4) == []
+
+
+def test_map_shards_error():
+    def shard_function(start, stop):
+        raise ValueError(f"bad shard {start}:{stop}")
+
+    with pytest.raises(ValueError):
+        map_shards(shard_function=shard_function, item_count=4, processes=2)
+
+
+def test_map_shards_bad():
+    with pytest.raises(ValueError):
+        map_shards(shard_function=lambda start, stop: None, item_count=4, processes=0)
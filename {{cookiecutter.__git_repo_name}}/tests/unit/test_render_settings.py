@@ -0,0 +1,60 @@
+from plugins.module_utils.render.render_settings import (
+    setting_name,
+    get_setting,
+    get_bool_setting,
+    get_int_setting,
+    SETTINGS_PREFIX,
+)
+import pytest
+
+
+def test_setting_name():
+    assert setting_name("templates_path") == f"{SETTINGS_PREFIX}_TEMPLATES_PATH"
+
+
+def test_get_setting(monkeypatch):
+    monkeypatch.delenv(setting_name("TEST_SETTING"), raising=False)
+    assert get_setting("TEST_SETTING") is None
+    assert get_setting("TEST_SETTING", "default") == "default"
+
+    monkeypatch.setenv(setting_name("TEST_SETTING"), "")
+    assert get_setting("TEST_SETTING", "default") == "default"
+
+    monkeypatch.setenv(setting_name("TEST_SETTING"), "value")
+    assert get_setting("TEST_SETTING", "default") == "value"
+
+
+get_bool_setting_table = [
+    ("1", True),
+    ("true", True),
+    ("Yes", True),
+    ("ON", True),
+    ("0", False),
+    ("false", False),
+    ("no", False),
+    ("other", False),
+]
+
+
+@pytest.mark.parametrize("value,response", get_bool_setting_table)
+def test_get_bool_setting(monkeypatch, value, response):
+    monkeypatch.setenv(setting_name("TEST_SETTING"), value)
+    assert get_bool_setting("TEST_SETTING") is response
+
+
+def test_get_bool_setting_default(monkeypatch):
+    monkeypatch.delenv(setting_name("TEST_SETTING"), raising=False)
+    assert get_bool_setting("TEST_SETTING") is False
+    assert get_bool_setting("TEST_SETTING", True) is True
+
+
+def test_get_int_setting(monkeypatch):
+    monkeypatch.delenv(setting_name("TEST_SETTING"), raising=False)
+    assert get_int_setting("TEST_SETTING", 10) == 10
+
+    monkeypatch.setenv(setting_name("TEST_SETTING"), "20")
+    assert get_int_setting("TEST_SETTING", 10) == 20
+
+    monkeypatch.setenv(setting_name("TEST_SETTING"), "other")
+    with pytest.raises(ValueError):
+        get_int_setting("TEST_SETTING", 10)
@@ -0,0 +1,123 @@
+from plugins.module_utils.render.render_stream import (
+    iter_lines,
+    file_checksum,
+    replace_lines,
+)
+import hashlib
+import os
+import pytest
+
+
+@pytest.mark.parametrize(
+    "chunks,trailing_newlines",
+    [
+        ([], 0),
+        ([], 2),
+        (["hostname router1"], 0),
+        (["hostname ", "router1", "\n"], 1),
+        (["line 1\nli", "ne 2\n\n", "\n"], 1),
+        (["line 1\r", "\nline 2\r"], 0),
+        (["line 1\n", "", "line 2"], 3),
+        (["\n", "\n"], 1),
+        (["line 1\x0bline 2 "], 0),
+    ],
+)
+def test_iter_lines(chunks, trailing_newlines):
+    rendered = "".join(chunks)
+    rendered_newlines = len(rendered) - len(rendered.rstrip("\n"))
+    rendered += "\n" * max(trailing_newlines - rendered_newlines, 0)
+
+    assert list(iter_lines(chunks=chunks, trailing_newlines=trailing_newlines)) == rendered.splitlines()
+
+
+def test_iter_lines_is_lazy():
+    def chunks():
+        yield "line 1\n"
+        raise RuntimeError("not lazy")
+
+    lines = iter_lines(chunks=chunks())
+
+    assert next(lines) == "line 1"
+    with pytest.raises(RuntimeError):
+        next(lines)
+
+
+def test_replace_lines(tmp_path):
+    file_path = tmp_path / "rendered.txt"
+    lines = ["line 1", "", "líne 2"]
+
+    line_count, checksum, changed = replace_lines(lines=iter(lines), file_path=str(file_path))
+
+    assert (line_count, changed) == (3, True)
+    assert file_path.read_text(encoding="utf-8") == "line 1\n\nlíne 2\n"
+    assert checksum == hashlib.sha256(file_path.read_bytes()).hexdigest() == file_checksum(file_path=str(file_path))
+
+    file_path.chmod(0o640)
+    mtime = file_path.stat().st_mtime_ns
+
+    assert replace_lines(lines=iter(lines), file_path=str(file_path)) == (3, checksum, False)
+    assert file_path.stat().st_mtime_ns == mtime
+
+    line_count, changed_checksum, changed = replace_lines(
+        lines=iter(["line 1", "", "line 2"]), file_path=str(file_path)
+    )
+
+    assert (line_count, changed) == (3, True)
+    assert changed_checksum != checksum
+    assert file_path.read_text(encoding="utf-8") == "line 1\n\nline 2\n"
+    assert file_path.stat().st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["rendered.txt"]
+
+
+def test_replace_lines_new_file_mode(tmp_path):
+    file_path = tmp_path / "rendered.txt"
+    umask = os.umask(0o027)
+
+    try:
+        replace_lines(lines=iter(["line 1"]), file_path=str(file_path))
+
+        # The kernel applies the umask, the umask of the process is never changed
+        assert os.umask(0o027) == 0o027
+
+    finally:
+        os.umask(umask)
+
+    assert file_path.stat().st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["rendered.txt"]
+
+
+def test_replace_lines_check_mode(tmp_path):
+    file_path = tmp_path / "rendered.txt"
+    lines = ["line 1", "", "líne 2"]
+
+    line_count, checksum, changed = replace_lines(lines=iter(lines), file_path=str(file_path), check_mode=True)
+
+    assert (line_count, changed) == (3, True)
+    assert os.listdir(tmp_path) == []
+
+    assert replace_lines(lines=iter(lines), file_path=str(file_path)) == (3, checksum, True)
+    assert replace_lines(lines=iter(lines), file_path=str(file_path), check_mode=True) == (3, checksum, False)
+
+    line_count, changed_checksum, changed = replace_lines(
+        lines=iter(["line 1"]), file_path=str(file_path), check_mode=True
+    )
+
+    assert (line_count, changed) == (1, True)
+    assert changed_checksum != checksum
+    assert file_path.read_text(encoding="utf-8") == "line 1\n\nlíne 2\n"
+    assert os.listdir(tmp_path) == ["rendered.txt"]
+
+
+def test_replace_lines_error(tmp_path):
+    file_path = tmp_path / "rendered.txt"
+    file_path.write_text("line 1\n")
+
+    def lines():
+        yield "line 2"
+        raise RuntimeError("render failed")
+
+    with pytest.raises(RuntimeError):
+        replace_lines(lines=lines(), file_path=str(file_path))
+
+    assert file_path.read_text() == "line 1\n"
+    assert os.listdir(tmp_path) == ["rendered.txt"]
@@ -0,0 +1,70 @@
+from plugins.module_utils.render.render_timings import (
+    RENDER_STAGES,
+    RenderTimings,
+    DISABLED_RENDER_TIMINGS,
+)
+import time
+import pytest
+
+
+def test_render_timings_stage():
+    timings = RenderTimings()
+
+    with timings.stage("render", item=1):
+        time.sleep(0.01)
+
+    with timings.stage("render", item=1):
+        pass
+
+    with timings.stage("find_template"):
+        pass
+
+    totals = timings.totals()
+    items = timings.items()
+
+    assert list(totals) == list(RENDER_STAGES)
+    assert totals["render"] >= 0.01
+    assert totals["compile"] == 0.0
+    assert items[0] == {}
+    assert items[1]["render"] == totals["render"]
+    assert list(items[1]) == ["render"]
+
+
+def test_render_timings_stage_exception():
+    timings = RenderTimings()
+
+    with pytest.raises(ValueError):
+        with timings.stage("validate", item=0):
+            raise ValueError("bad data")
+
+    assert list(timings.items()[0]) == ["validate"]
+
+
+def test_render_timings_timed_iter():
+    def chunks():
+        time.sleep(0.01)
+        yield "one"
+        yield "two"
+
+    timings = RenderTimings()
+    values = []
+
+    for value in timings.timed_iter("render", chunks(), item=0):
+        time.sleep(0.05)
+        values.append(value)
+
+    assert values == ["one", "two"]
+    assert 0.01 <= timings.totals()["render"] < 0.05
+    assert timings.items()[0]["render"] == timings.totals()["render"]
+
+
+def test_disabled_render_timings():
+    chunks = iter(["one"])
+
+    with DISABLED_RENDER_TIMINGS.stage("render", item=0):
+        pass
+
+    assert DISABLED_RENDER_TIMINGS.timed_iter("render", chunks) is chunks
+    assert not DISABLED_RENDER_TIMINGS.enabled
+    assert DISABLED_RENDER_TIMINGS.totals() == dict.fromkeys(RENDER_STAGES, 0.0)
+    assert DISABLED_RENDER_TIMINGS.items() == []
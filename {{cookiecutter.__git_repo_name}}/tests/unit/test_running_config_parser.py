@@ -0,0 +1,163 @@
+from plugins.module_utils.acl.running_config_parser import (
+    RunningConfigError,
+    parse_running_config_acls,
+    parse_running_config_acls_file,
+    validate_running_config_acls,
+)
+from plugins.module_utils.acl.standard_acl_diff import diff_standard_acls
+import pytest
+from ansible.errors import AnsiblePluginError
+
+IOS_RUNNING_CONFIG = """!
+hostname r1
+!
+ip access-list standard MGMT
+ 10 remark management  hosts
+ 20 permit 10.0.0.0 0.255.255.255
+ 30 permit 192.168.1.1 log
+ 40 deny   any
+ip access-list extended WEB
+ 10 permit tcp any any eq 443
+ip access-list standard OLD
+ permit 172.16.0.0 0.15.255.255
+ remark no sequence numbers
+!
+interface GigabitEthernet1
+ ip access-group MGMT in
+!
+"""
+
+IOSXR_RUNNING_CONFIG = """ipv4 access-list MGMT
+ 10 permit ipv4 10.0.0.0 0.255.255.255 any
+ 20 permit ipv4 host 192.168.1.1 any log
+ 30 permit ipv4 172.16.0.0/12 any
+ 40 permit tcp any any eq 22
+!
+"""
+
+NXOS_RUNNING_CONFIG = """ip access-list MGMT
+  statistics per-entry
+  10 permit ip 10.0.0.0/8 any
+  20 deny 192.168.1.1/32 any log
+"""
+
+EOS_RUNNING_CONFIG = """ip access-list standard MGMT
+   10 permit 10.0.0.0/8
+   20 permit host 192.168.1.1
+   30 deny any log
+"""
+
+
+def test_parse_running_config_acls_ios():
+    assert parse_running_config_acls(running_config=IOS_RUNNING_CONFIG, ansible_network_os="cisco.ios.ios") == {
+        "MGMT": [
+            {"sequence": 10, "action": "remark", "remark": "management  hosts"},
+            {"sequence": 20, "action": "permit", "source": "10.0.0.0/8"},
+            {"sequence": 30, "action": "permit", "source": "192.168.1.1/32", "append_option_to_end": " log"},
+            {"sequence": 40, "action": "deny", "source": "any"},
+        ],
+        "OLD": [
+            {"sequence": 10, "action": "permit", "source": "172.16.0.0/12"},
+            {"sequence": 20, "action": "remark", "remark": "no sequence numbers"},
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "running_config, ansible_network_os, expected",
+    [
+        (
+            IOSXR_RUNNING_CONFIG,
+            "iosxr",
+            [
+                {"sequence": 10, "action": "permit", "source": "10.0.0.0/8"},
+                {"sequence": 20, "action": "permit", "source": "192.168.1.1/32", "append_option_to_end": " log"},
+                {"sequence": 30, "action": "permit", "source": "172.16.0.0/12"},
+                {"sequence": 40, "action": "permit", "line": "permit tcp any any eq 22"},
+            ],
+        ),
+        (
+            NXOS_RUNNING_CONFIG,
+            "nxos",
+            [
+                {"sequence": 10, "action": "permit", "source": "10.0.0.0/8"},
+                {"sequence": 20, "action": "deny", "source": "192.168.1.1/32", "append_option_to_end": " log"},
+            ],
+        ),
+        (
+            EOS_RUNNING_CONFIG,
+            "arista.eos.eos",
+            [
+                {"sequence": 10, "action": "permit", "source": "10.0.0.0/8"},
+                {"sequence": 20, "action": "permit", "source": "192.168.1.1/32"},
+                {"sequence": 30, "action": "deny", "source": "any", "append_option_to_end": " log"},
+            ],
+        ),
+    ],
+)
+def test_parse_running_config_acls(running_config, ansible_network_os, expected):
+    assert parse_running_config_acls(running_config=running_config, ansible_network_os=ansible_network_os) == {
+        "MGMT": expected
+    }
+
+
+def test_parse_running_config_acls_file(tmp_path):
+    running_config_path = tmp_path / "running_config.txt"
+    running_config_path.write_text(IOS_RUNNING_CONFIG, encoding="utf-8")
+
+    assert parse_running_config_acls_file(
+        file_path=str(running_config_path), ansible_network_os="ios"
+    ) == parse_running_config_acls(running_config=IOS_RUNNING_CONFIG.splitlines(), ansible_network_os="ios")
+
+
+def test_parse_running_config_acls_diff():
+    intended = [
+        {
+            "name": "MGMT",
+            "sequences": [
+                {"sequence": 10, "action": "permit", "source": "10.0.0.0/8"},
+                {"sequence": 20, "action": "permit", "source": "192.168.1.1/32", "append_option_to_end": " log"},
+                {"sequence": 30, "action": "permit", "source": "172.16.0.0/12"},
+            ],
+        }
+    ]
+    current = parse_running_config_acls(running_config=IOSXR_RUNNING_CONFIG, ansible_network_os="iosxr")
+
+    assert diff_standard_acls(intended=intended, current=current, ansible_network_os="iosxr") == [
+        "ipv4 access-list MGMT",
+        " no 40",
+    ]
+
+
+@pytest.mark.parametrize(
+    "running_config, ansible_network_os, error",
+    [
+        (None, "ios", TypeError),
+        (IOS_RUNNING_CONFIG, "junos", AnsiblePluginError),
+    ],
+)
+def test_parse_running_config_acls_bad(running_config, ansible_network_os, error):
+    with pytest.raises(error):
+        parse_running_config_acls(running_config=running_config, ansible_network_os=ansible_network_os)
+
+
+def test_validate_running_config_acls():
+    current = parse_running_config_acls(running_config=IOS_RUNNING_CONFIG, ansible_network_os="ios")
+
+    assert validate_running_config_acls(acls=current) is current
+
+
+def test_validate_running_config_acls_bad():
+    running_config = (
+        "ip access-list standard MGMT\n 10 permit 10.0.0.1 0.0.0.255\n 20 permit 10.0.0.256\n 20 deny any\n"
+    )
+    current = parse_running_config_acls(running_config=running_config, ansible_network_os="ios")
+
+    with pytest.raises(RunningConfigError) as error:
+        validate_running_config_acls(acls=current)
+
+    assert [item_error.split(":")[0] for item_error in error.value.errors] == [
+        "running_config[MGMT].sequences[0].source",
+        "running_config[MGMT].sequences[1].source",
+        "running_config[MGMT].sequences[2].sequence",
+    ]
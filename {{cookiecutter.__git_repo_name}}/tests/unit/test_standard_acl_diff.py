@@ -0,0 +1,80 @@
+from plugins.module_utils.acl.standard_acl_diff import diff_standard_acls
+import pytest
+from ansible.errors import AnsiblePluginError
+
+INTENDED = [
+    {
+        "name": "MGMT",
+        "sequences": [
+            {"sequence": 10, "action": "remark", "remark": "management"},
+            {"sequence": 20, "action": "permit", "source": "10.0.0.0/8"},
+            {"sequence": 30, "action": "permit", "source": "192.168.1.1/32", "append_option_to_end": " log"},
+            {"sequence": 40, "action": "deny", "source": "any"},
+        ],
+    },
+    {"name": "NEW", "sequences": [{"sequence": 10, "action": "permit", "source": "172.16.0.0/12"}]},
+]
+
+
+def test_diff_standard_acls():
+    current = {
+        "MGMT": [
+            {"sequence": 10, "action": "remark", "remark": "management"},
+            {"sequence": 20, "action": "permit", "source": "10.0.0.0/16"},
+            {"sequence": 30, "action": "permit", "source": "192.168.1.1/32", "append_option_to_end": " log"},
+            {"sequence": 35, "action": "permit", "source": "192.168.2.0/24"},
+        ],
+        "OTHER": [{"sequence": 10, "action": "permit", "source": "any"}],
+    }
+
+    assert diff_standard_acls(intended=INTENDED, current=current, ansible_network_os="ios") == [
+        "ip access-list standard MGMT",
+        " no 20",
+        " no 35",
+        " 20 permit 10.0.0.0 0.255.255.255",
+        " 40 deny any",
+        "ip access-list standard NEW",
+        " 10 permit 172.16.0.0 0.15.255.255",
+    ]
+
+
+def test_diff_standard_acls_no_changes():
+    assert diff_standard_acls(intended=INTENDED, current=INTENDED, ansible_network_os="iosxr") == []
+
+
+def test_diff_standard_acls_no_current():
+    assert diff_standard_acls(intended=INTENDED[1:], current=None, ansible_network_os="nxos") == [
+        "ip access-list NEW",
+        " 10 permit 172.16.0.0/12 any",
+    ]
+
+
+@pytest.mark.parametrize(
+    "intended, current, ansible_network_os, error",
+    [
+        ({"name": "MGMT"}, None, "ios", TypeError),
+        (INTENDED, "MGMT", "ios", TypeError),
+        (
+            [{"name": "BAD", "sequences": [{"sequence": "ten", "action": "deny", "source": "any"}]}],
+            None,
+            "ios",
+            ValueError,
+        ),
+        (
+            [{"name": "BAD", "sequences": [{"sequence": 10, "action": "deny", "source": "any"}] * 2}],
+            None,
+            "ios",
+            ValueError,
+        ),
+        (
+            [{"name": "BAD", "sequences": [{"sequence": 10, "action": "deny", "source": "bad"}]}],
+            None,
+            "ios",
+            AnsiblePluginError,
+        ),
+        (INTENDED, None, "junos", AnsiblePluginError),
+    ],
+)
+def test_diff_standard_acls_bad(intended, current, ansible_network_os, error):
+    with pytest.raises(error):
+        diff_standard_acls(intended=intended, current=current, ansible_network_os=ansible_network_os)
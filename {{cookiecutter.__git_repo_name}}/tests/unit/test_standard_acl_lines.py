@@ -0,0 +1,115 @@
+import pathlib
+
+from plugins.filter.render_filters import standard_acl_lines
+from plugins.module_utils.render.standard_acl_lines import (
+    standard_acl_config_lines,
+    standard_acl_entry_command,
+)
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+import pytest
+
+TEMPLATES_PATH = pathlib.Path(__file__).resolve().parents[2] / "templates"
+
+INTENDED = [
+    {
+        "name": "MGMT",
+        "sequences": [
+            {"sequence": 10, "action": "remark", "remark": "management"},
+            {"sequence": 20, "action": "permit", "source": "10.0.0.0/8"},
+            {"sequence": 30, "action": "permit", "source": "192.168.1.1/32", "append_option_to_end": " log"},
+            {"sequence": 40, "action": "deny", "source": "any"},
+        ],
+    },
+    {"name": "NEW", "sequences": [{"sequence": 10, "action": "permit", "source": "172.16.0.0/12"}]},
+]
+
+
+@pytest.mark.parametrize(
+    "ansible_network_os, sequence, expected",
+    [
+        ("ios", {"sequence": 10, "action": "permit", "source": "10.0.0.0/8"}, "10 permit 10.0.0.0 0.255.255.255"),
+        ("cisco.ios.ios", {"sequence": 10, "action": "deny", "source": "10.1.1.1/32"}, "10 deny 10.1.1.1"),
+        ("iosxr", {"sequence": 10, "action": "permit", "source": "10.1.1.1/32"}, "10 permit ipv4 host 10.1.1.1 any"),
+        ("nxos", {"sequence": 10, "action": "permit", "source": "10.0.0.0/8"}, "10 permit 10.0.0.0/8 any"),
+        ("eos", {"sequence": 10, "action": "permit", "source": "10.1.1.1/32"}, "10 permit host 10.1.1.1"),
+        (
+            "eos",
+            {"sequence": 10, "action": "permit", "source": "any", "append_option_to_end": " log"},
+            "10 permit any log",
+        ),
+        ("ios", {"sequence": 10, "action": "permit", "source": "host 10.1.1.1"}, "10 permit 10.1.1.1"),
+        (
+            "iosxr",
+            {"sequence": 10, "action": "permit", "source": "10.0.0.0 0.255.255.255"},
+            "10 permit ipv4 10.0.0.0 0.255.255.255 any",
+        ),
+        ("nxos", {"sequence": 10, "action": "permit", "source": "10.1.1.1"}, "10 permit 10.1.1.1/32 any"),
+        ("ios", {"sequence": 5, "action": "remark", "remark": "hello world"}, "5 remark hello world"),
+    ],
+)
+def test_standard_acl_entry_command(ansible_network_os, sequence, expected):
+    assert standard_acl_entry_command(sequence=sequence, ansible_network_os=ansible_network_os) == expected
+
+
+@pytest.mark.parametrize(
+    "ansible_network_os, expected",
+    [
+        (
+            "ios",
+            [
+                "ip access-list standard MGMT",
+                " 10 remark management",
+                " 20 permit 10.0.0.0 0.255.255.255",
+                " 30 permit 192.168.1.1 log",
+                " 40 deny any",
+            ],
+        ),
+        (
+            "iosxr",
+            [
+                "ipv4 access-list MGMT",
+                " 10 remark management",
+                " 20 permit ipv4 10.0.0.0 0.255.255.255 any",
+                " 30 permit ipv4 host 192.168.1.1 any log",
+                " 40 deny ipv4 any any",
+            ],
+        ),
+    ],
+)
+def test_standard_acl_config_lines(ansible_network_os, expected):
+    assert standard_acl_config_lines(acl=INTENDED[0], ansible_network_os=ansible_network_os) == expected
+
+
+def test_standard_acl_config_lines_no_sequences():
+    assert standard_acl_config_lines(acl={"name": "EMPTY"}, ansible_network_os="nxos") == ["ip access-list EMPTY"]
+
+
+@pytest.mark.parametrize(
+    "ansible_network_os, network_source, host_source",
+    [
+        ("ios", "10.0.0.0 0.255.255.255", "192.168.1.1"),
+        ("iosxr", "10.0.0.0 0.255.255.255", "host 192.168.1.1"),
+        ("nxos", "10.0.0.0/8", "192.168.1.1/32"),
+    ],
+)
+def test_standard_acl_lines_template_parity(ansible_network_os, network_source, host_source):
+    template_path = TEMPLATES_PATH / ansible_network_os / "main" / "standard_acl.j2"
+    if not template_path.is_file():
+        pytest.skip("the collection was generated without the example action plugins and their templates")
+
+    # The templates print the sources as they are, so the sources are given as the network OS takes them
+    acl = {
+        "name": "MGMT",
+        "sequences": [
+            {"sequence": 10, "action": "remark", "remark": "management"},
+            {"sequence": 20, "action": "permit", "source": network_source},
+            {"sequence": 30, "action": "permit", "source": host_source, "append_option_to_end": " log"},
+            {"sequence": 40, "action": "deny", "source": "any"},
+        ],
+    }
+    templar = Templar(loader=DataLoader(), variables=acl)
+
+    rendered = templar.template(template_path.read_text())
+
+    assert standard_acl_lines(acl, ansible_network_os) == rendered.splitlines()
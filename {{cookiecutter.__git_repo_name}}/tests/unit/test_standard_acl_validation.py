@@ -0,0 +1,151 @@
+from plugins.module_utils.acl.standard_acl_validation import (
+    running_config_acls_errors,
+    standard_acl_errors,
+    standard_acls_errors,
+)
+import pytest
+
+VALID_ACL = {
+    "name": "MGMT",
+    "sequences": [
+        {"sequence": 10, "action": "remark", "remark": "management"},
+        {"sequence": "20", "action": "permit", "source": "10.0.0.0/8", "append_option_to_end": " log"},
+        {"sequence": 30, "action": "deny", "source": "any", "append_option_to_end": " log"},
+        {"sequence": 40, "action": "permit", "source": "host 192.168.1.1"},
+        {"sequence": 50, "action": "permit", "source": "172.16.0.0 0.15.255.255"},
+        {"sequence": 60, "action": "deny", "source": "192.168.2.1"},
+    ],
+}
+
+
+def test_standard_acl_errors_valid():
+    assert standard_acl_errors(acl=VALID_ACL) == []
+    assert standard_acls_errors(acls=[VALID_ACL, VALID_ACL]) == []
+
+
+@pytest.mark.parametrize(
+    "acl, paths",
+    [
+        ({"name": "MGMT ACL", "sequences": []}, []),
+        ({"name": " ", "sequences": []}, ["name"]),
+        ({"sequences": []}, ["name"]),
+        ({"name": "MGMT"}, ["sequences"]),
+        ({"name": "MGMT", "sequences": ["10 permit any"]}, ["sequences[0]"]),
+        (
+            {"name": "MGMT", "sequences": [{"sequence": "ten", "action": "deny", "source": "any"}]},
+            ["sequences[0].sequence"],
+        ),
+        (
+            {
+                "name": "MGMT",
+                "sequences": [
+                    {"sequence": 10, "action": "deny", "source": "any"},
+                    {"sequence": 10, "action": "permit", "source": "any"},
+                ],
+            },
+            ["sequences[1].sequence"],
+        ),
+        (
+            {"name": "MGMT", "sequences": [{"sequence": 10, "action": "allow", "source": "any"}]},
+            ["sequences[0].action"],
+        ),
+        ({"name": "MGMT", "sequences": [{"sequence": 10, "action": "remark"}]}, ["sequences[0].remark"]),
+        (
+            {"name": "MGMT", "sequences": [{"sequence": 10, "action": "permit", "source": "10.0.0.1/8"}]},
+            ["sequences[0].source"],
+        ),
+        (
+            {"name": "MGMT", "sequences": [{"sequence": 10, "action": "permit", "source": "10.0.0.0 0.0.255.0"}]},
+            ["sequences[0].source"],
+        ),
+        (
+            {"name": "MGMT", "sequences": [{"sequence": 10, "action": "permit", "source": "host"}]},
+            ["sequences[0].source"],
+        ),
+        ({"name": "MGMT", "sequences": [{"sequence": 10, "action": "permit"}]}, ["sequences[0].source"]),
+        (
+            {
+                "name": "MGMT",
+                "sequences": [
+                    {"sequence": 10, "action": "permit", "source": "any", "append_option_to_end": " log echo"}
+                ],
+            },
+            ["sequences[0].append_option_to_end"],
+        ),
+        (
+            {
+                "name": "MGMT",
+                "sequences": [{"sequence": 10, "action": "permit", "source": "any", "append_option_to_end": 1}],
+            },
+            ["sequences[0].append_option_to_end"],
+        ),
+        (
+            {
+                "name": "MGMT",
+                "sequences": [{"sequence": 10, "action": "permit", "source": "any", "append_option_to_end": ["log"]}],
+            },
+            ["sequences[0].append_option_to_end"],
+        ),
+        (
+            {
+                "name": "MGMT",
+                "sequences": [{"sequence": 10, "action": "permit", "source": "any", "append_option_to_end": "log"}],
+            },
+            ["sequences[0].append_option_to_end"],
+        ),
+    ],
+)
+def test_standard_acl_errors(acl, paths):
+    assert [error.split(":")[0] for error in standard_acl_errors(acl=acl)] == paths
+
+
+def test_standard_acls_errors_collects_every_error():
+    acls = [
+        VALID_ACL,
+        {
+            "name": "BAD",
+            "sequences": [
+                {"sequence": 10, "action": "permit", "source": "192.168.1.1/24"},
+                {"sequence": 10, "action": "deny", "source": "any", "append_option_to_end": " echo"},
+            ],
+        },
+        "MGMT",
+    ]
+
+    assert [error.split(":")[0] for error in standard_acls_errors(acls=acls)] == [
+        "standard_acls[1].sequences[0].source",
+        "standard_acls[1].sequences[1].sequence",
+        "standard_acls[1].sequences[1].append_option_to_end",
+        "standard_acls[2]",
+    ]
+    assert standard_acls_errors(acls={"name": "MGMT"}) == [
+        "standard_acls: must be of type list but received a <class 'dict'>"
+    ]
+
+
+def test_running_config_acls_errors():
+    acls = {
+        "MGMT": VALID_ACL["sequences"] + [{"sequence": 70, "action": "permit", "line": "permit tcp any any eq 22"}],
+        "BAD": [
+            {"sequence": 10, "action": "permit", "source": "10.0.0.1/24"},
+            {"sequence": 10, "action": "deny", "line": " "},
+            {"sequence": 20, "action": "permit", "source": "300.0.0.0/8"},
+        ],
+        "OTHER": None,
+    }
+
+    assert [error.split(":")[0] for error in running_config_acls_errors(acls=acls)] == [
+        "running_config[BAD].sequences[0].source",
+        "running_config[BAD].sequences[1].sequence",
+        "running_config[BAD].sequences[1].line",
+        "running_config[BAD].sequences[2].source",
+        "running_config[OTHER].sequences",
+    ]
+    assert running_config_acls_errors(acls=[]) == ["running_config: must be of type dict but received a <class 'list'>"]
+
+
+def test_standard_acl_errors_no_parsed_line():
+    # Only an entry parsed from a running config can have a line, the data can not push a raw line
+    acl = {"name": "MGMT", "sequences": [{"sequence": 10, "action": "permit", "line": "permit tcp any any eq 22"}]}
+
+    assert [error.split(":")[0] for error in standard_acl_errors(acl=acl)] == ["sequences[0].source"]
@@ -0,0 +1,248 @@
+from plugins.action.standard_acls import ActionModule
+from plugins.module_utils.render.render_settings import setting_name
+from ansible.errors import AnsibleActionFail
+from ansible.parsing.dataloader import DataLoader
+from ansible.playbook.play_context import PlayContext
+from ansible.playbook.task import Task
+from ansible.plugins.connection.local import Connection
+from ansible.template import Templar
+import os
+import pytest
+
+STANDARD_ACLS = [
+    {
+        "name": "TEST",
+        "sequences": [
+            {"sequence": 10, "action": "remark", "remark": "TEST"},
+            {"sequence": 20, "action": "permit", "source": "10.0.0.0/8"},
+        ],
+    },
+]
+
+RENDERED = "ip access-list standard TEST\n 10 remark TEST\n 20 permit 10.0.0.0/8\n"
+
+TASK_VARS = {"inventory_hostname": "router1", "hostvars": {"router1": {"ansible_network_os": "ios"}}}
+
+
+def action_module(args: dict, check_mode: bool = False) -> ActionModule:
+    task = Task()
+    task.args = args
+    task.check_mode = check_mode
+    play_context = PlayContext()
+    play_context.check_mode = check_mode
+    loader = DataLoader()
+
+    return ActionModule(
+        task=task,
+        connection=Connection(play_context, os.devnull),
+        play_context=play_context,
+        loader=loader,
+        templar=Templar(loader=loader),
+        shared_loader_obj=None,
+    )
+
+
+@pytest.mark.parametrize("check_mode", [False, True])
+def test_standard_acls_dest_check_mode(tmp_path, check_mode):
+    dest = tmp_path / "standard_acls.cfg"
+
+    result = action_module(args={"data": STANDARD_ACLS, "dest": str(dest)}, check_mode=check_mode).run(
+        task_vars=TASK_VARS
+    )
+
+    assert result["changed"] is True
+    assert result["line_count"] == 3
+    assert dest.exists() is not check_mode
+
+    dest.write_text(RENDERED)
+    result_again = action_module(args={"data": STANDARD_ACLS, "dest": str(dest)}, check_mode=check_mode).run(
+        task_vars=TASK_VARS
+    )
+
+    assert result_again == {
+        "changed": False,
+        "dest": str(dest),
+        "checksum": result["checksum"],
+        "line_count": 3,
+    }
+
+
+@pytest.mark.parametrize(
+    "output,expected",
+    [
+        ("text", {"rendered": [RENDERED]}),
+        ("lines", {"rendered_lines": RENDERED.splitlines()}),
+        ("both", {"rendered": [RENDERED], "rendered_lines": RENDERED.splitlines()}),
+        (None, {"rendered": [RENDERED], "rendered_lines": RENDERED.splitlines()}),
+    ],
+)
+def test_standard_acls_output(output, expected):
+    args = {"data": STANDARD_ACLS} if output is None else {"data": STANDARD_ACLS, "output": output}
+
+    assert action_module(args=args).run(task_vars=TASK_VARS) == {"changed": False, **expected}
+
+
+@pytest.mark.parametrize("output", [None, "file"])
+def test_standard_acls_output_file(tmp_path, output):
+    dest = tmp_path / "standard_acls.cfg"
+    args = {"data": STANDARD_ACLS, "dest": str(dest)}
+    if output is not None:
+        args["output"] = output
+
+    result = action_module(args=args).run(task_vars=TASK_VARS)
+
+    assert sorted(result) == ["changed", "checksum", "dest", "line_count"]
+    assert dest.read_text() == RENDERED
+
+
+@pytest.mark.parametrize(
+    "args,message",
+    [
+        ({"output": "json"}, "'output' must be one of text, lines, both, file but received 'json'"),
+        ({"output": "file"}, "option 'dest' is required with output 'file'"),
+        ({"output": "text", "dest": "standard_acls.cfg"}, "option 'dest' is only used with output 'file'"),
+    ],
+)
+def test_standard_acls_output_bad(args, message):
+    with pytest.raises(AnsibleActionFail, match=message):
+        action_module(args={"data": STANDARD_ACLS, **args}).run(task_vars=TASK_VARS)
+
+
+@pytest.mark.parametrize("perf_arg,perf_setting", [(True, None), (None, "true"), (False, "true")])
+def test_standard_acls_perf(monkeypatch, perf_arg, perf_setting):
+    if perf_setting is None:
+        monkeypatch.delenv(setting_name("PERF"), raising=False)
+
+    else:
+        monkeypatch.setenv(setting_name("PERF"), perf_setting)
+
+    args = {"data": STANDARD_ACLS * 2, "output": "lines"}
+    if perf_arg is not None:
+        args["perf"] = perf_arg
+
+    result = action_module(args=args).run(task_vars=TASK_VARS)
+
+    if perf_arg is False:
+        assert "perf" not in result
+        return
+
+    perf = result["perf"]
+    assert sorted(perf) == ["per_acl", "stages", "total"]
+    assert perf["total"] >= 0
+    assert {"validate", "render", "split"} <= set(perf["stages"])
+    assert [acl_timings["name"] for acl_timings in perf["per_acl"]] == ["TEST", "TEST"]
+    assert all(list(acl_timings) == ["name", "validate", "render", "split"] for acl_timings in perf["per_acl"])
+
+
+def test_standard_acls_no_perf(monkeypatch):
+    monkeypatch.delenv(setting_name("PERF"), raising=False)
+
+    assert "perf" not in action_module(args={"data": STANDARD_ACLS}).run(task_vars=TASK_VARS)
+
+
+@pytest.mark.parametrize(
+    "parallel_arg,min_batch,processes",
+    [
+        (None, None, 1),
+        (False, "1", 1),
+        (True, None, 1),
+        (True, "5", 1),
+        (True, "4", 4),
+    ],
+)
+def test_standard_acls_processes(monkeypatch, parallel_arg, min_batch, processes):
+    monkeypatch.delenv(setting_name("PARALLEL"), raising=False)
+    monkeypatch.setattr("plugins.action.standard_acls.available_processes", lambda: 4)
+
+    if min_batch is None:
+        monkeypatch.delenv(setting_name("PARALLEL_MIN_BATCH"), raising=False)
+
+    else:
+        monkeypatch.setenv(setting_name("PARALLEL_MIN_BATCH"), min_batch)
+
+    args = {"data": STANDARD_ACLS * 2}
+    if parallel_arg is not None:
+        args["parallel"] = parallel_arg
+
+    # 4 ACL entries, below the default minimum batch they render in one process
+    assert action_module(args=args)._get_processes(config_data=args["data"]) == processes
+
+
+@pytest.mark.parametrize(
+    "running_config,commands",
+    [
+        ("ip access-list standard TEST\n 10 remark TEST\n 20 permit 10.0.0.0 0.255.255.255\n", []),
+        (
+            "ip access-list standard TEST\n 10 remark TEST\n 20 permit 10.0.0.0 0.255.255.255\n 30 deny any\n",
+            ["ip access-list standard TEST", " no 30"],
+        ),
+        (
+            "ip access-list standard TEST\n 20 permit 10.0.0.0 0.0.0.255\n",
+            ["ip access-list standard TEST", " no 20", " 10 remark TEST", " 20 permit 10.0.0.0 0.255.255.255"],
+        ),
+        ("", ["ip access-list standard TEST", " 10 remark TEST", " 20 permit 10.0.0.0 0.255.255.255"]),
+    ],
+)
+def test_standard_acls_running_config_commands(running_config, commands):
+    result = action_module(args={"data": STANDARD_ACLS, "output": "lines", "running_config": running_config}).run(
+        task_vars=TASK_VARS
+    )
+
+    assert result["commands"] == commands
+
+
+def test_standard_acls_running_config_errors():
+    args = {
+        "data": STANDARD_ACLS,
+        "output": "lines",
+        "running_config": "ip access-list standard TEST\n 10 remark TEST\n 20 permit 10.0.0.1 0.255.255.255\n",
+    }
+
+    # A malformed device line fails the task instead of being diffed into commands
+    with pytest.raises(AnsibleActionFail) as error:
+        action_module(args=args).run(task_vars=TASK_VARS)
+
+    errors = error.value.result["errors"]
+    assert [item_error.split(":")[0] for item_error in errors] == ["running_config[TEST].sequences[1].source"]
+    assert error.value.message == f"1 running_config errors: {errors[0]}"
+
+
+def test_standard_acls_current_commands():
+    args = {
+        "data": STANDARD_ACLS,
+        "output": "lines",
+        "current": {"TEST": [{"sequence": 10, "action": "remark", "remark": "TEST"}]},
+        "running_config": "ip access-list standard TEST\n 10 remark TEST\n 20 permit 10.0.0.0 0.255.255.255\n",
+    }
+
+    # current is used over running_config
+    assert action_module(args=args).run(task_vars=TASK_VARS)["commands"] == [
+        "ip access-list standard TEST",
+        " 20 permit 10.0.0.0 0.255.255.255",
+    ]
+    assert "commands" not in action_module(args={"data": STANDARD_ACLS}).run(task_vars=TASK_VARS)
+
+
+def test_standard_acls_errors():
+    data = [
+        {
+            "name": "TEST",
+            "sequences": [
+                {"sequence": 10, "action": "allow", "source": "10.0.0.0/8"},
+                {"sequence": 10, "action": "permit", "source": "10.0.0.0/8"},
+            ],
+        },
+        STANDARD_ACLS[0],
+        {"name": "OTHER", "sequences": [{"sequence": 10, "action": "remark"}]},
+    ]
+
+    with pytest.raises(AnsibleActionFail) as error:
+        action_module(args={"data": data}).run(task_vars=TASK_VARS)
+
+    errors = error.value.result["errors"]
+    assert [item_error.split(":")[0] for item_error in errors] == [
+        "standard_acls[0].sequences[0].action",
+        "standard_acls[0].sequences[1].sequence",
+        "standard_acls[2].sequences[0].remark",
+    ]
+    assert error.value.message == f"3 standard_acls errors: {'; '.join(errors)}"
@@ -0,0 +1,113 @@
+import os
+
+import pytest
+from jinja2 import Environment
+
+from plugins.module_utils.render.template_cache import CompiledTemplateCache
+
+
+def test_compiled_template_cache_hit_returns_same_template(tmp_path):
+    template_path = tmp_path / "test.j2"
+    template_path.write_text("hostname {{ name }}\n")
+    cache = CompiledTemplateCache()
+    environment = Environment()
+
+    first = cache.get_template(template_path=str(template_path), environment=environment)
+    second = cache.get_template(template_path=str(template_path), environment=environment)
+
+    assert first is second
+    assert first.template.render(name="router1") == "hostname router1"
+    assert first.trailing_newlines == 1
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "bytecode_loads": 0,
+        "precompiled_loads": 0,
+        "size": 1,
+        "max_size": 128,
+    }
+
+
+def test_compiled_template_cache_changed_template_is_recompiled(tmp_path):
+    template_path = tmp_path / "test.j2"
+    template_path.write_text("hostname {{ name }}")
+    cache = CompiledTemplateCache()
+    environment = Environment()
+
+    first = cache.get_template(template_path=str(template_path), environment=environment)
+    template_path.write_text("hostname {{ name }}-changed")
+    os.utime(template_path, ns=(0, 0))
+    second = cache.get_template(template_path=str(template_path), environment=environment)
+
+    assert first is not second
+    assert second.template.render(name="router1") == "hostname router1-changed"
+    assert cache.stats()["misses"] == 2
+
+
+def test_compiled_template_cache_evicts_least_recently_used(tmp_path):
+    cache = CompiledTemplateCache(max_size=2)
+    environment = Environment()
+    template_paths = []
+    for number in range(3):
+        template_path = tmp_path / f"test{number}.j2"
+        template_path.write_text(f"template {number}")
+        template_paths.append(str(template_path))
+
+    cache.get_template(template_path=template_paths[0], environment=environment)
+    cache.get_template(template_path=template_paths[1], environment=environment)
+    cache.get_template(template_path=template_paths[0], environment=environment)
+    cache.get_template(template_path=template_paths[2], environment=environment)
+    cache.get_template(template_path=template_paths[0], environment=environment)
+
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 3,
+        "evictions": 1,
+        "bytecode_loads": 0,
+        "precompiled_loads": 0,
+        "size": 2,
+        "max_size": 2,
+    }
+
+
+def test_compiled_template_cache_clear(tmp_path):
+    template_path = tmp_path / "test.j2"
+    template_path.write_text("hostname")
+    cache = CompiledTemplateCache()
+
+    cache.get_template(template_path=str(template_path), environment=Environment())
+    cache.clear()
+
+    assert cache.stats() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "bytecode_loads": 0,
+        "precompiled_loads": 0,
+        "size": 0,
+        "max_size": 128,
+    }
+
+
+def test_compiled_template_cache_bad():
+    with pytest.raises(ValueError):
+        CompiledTemplateCache(max_size=0)
+
+    with pytest.raises(FileNotFoundError):
+        CompiledTemplateCache().get_template(template_path="/does/not/exist.j2", environment=Environment())
+
+
+def test_compiled_template_cache_override_header(tmp_path):
+    template_path = tmp_path / "override.j2"
+    template_source = "#jinja2: trim_blocks: False\nhostname {{ name }}\n"
+    template_path.write_text(template_source)
+    cache = CompiledTemplateCache()
+
+    compiled_template = cache.get_template(template_path=str(template_path), environment=Environment())
+
+    # Only Templar.template applies the header, so the template is not compiled
+    assert compiled_template.template is None
+    assert compiled_template.code is None
+    assert compiled_template.override_source == template_source
+    assert compiled_template.trailing_newlines == 1
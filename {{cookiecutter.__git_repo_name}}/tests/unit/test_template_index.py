@@ -0,0 +1,86 @@
+from plugins.module_utils.render.template_index import (
+    template_relative_paths,
+    TemplateIndex,
+    get_template_index,
+    clear_template_indexes,
+)
+import os
+import pytest
+
+
+@pytest.fixture
+def templates_directory(tmp_path):
+    for relative_path in [
+        "ios/main/ntp.j2",
+        "ios/C3560/main/ntp.j2",
+        "ios/C3560/WS-C3560G-48TS-E/ntp.j2",
+        "ios/campus/main/ntp.j2",
+        "nxos/main/ntp.j2",
+    ]:
+        template_path = tmp_path.joinpath(*relative_path.split("/"))
+        template_path.parent.mkdir(parents=True, exist_ok=True)
+        template_path.write_text("ntp")
+
+    return tmp_path
+
+
+def test_template_relative_paths():
+    assert template_relative_paths(
+        network_os="ios", template_name="ntp.j2", solution="campus", family="C3560", model="WS-C3560G-48TS-E"
+    ) == [
+        "ios/campus/C3560/WS-C3560G-48TS-E/ntp.j2",
+        "ios/campus/C3560/main/ntp.j2",
+        "ios/campus/main/ntp.j2",
+        "ios/C3560/WS-C3560G-48TS-E/ntp.j2",
+        "ios/C3560/main/ntp.j2",
+        "ios/main/ntp.j2",
+    ]
+    assert template_relative_paths(network_os="ios", template_name="ntp.j2") == ["ios/main/ntp.j2"]
+
+
+template_index_resolve_table = [
+    ("ios", None, "C3560", "WS-C3560G-48TS-E", "ntp.j2", "ios/C3560/WS-C3560G-48TS-E/ntp.j2"),
+    ("ios", None, "C3560", "WS-C3560X-24T-S", "ntp.j2", "ios/C3560/main/ntp.j2"),
+    ("ios", "campus", "C3560", "WS-C3560G-48TS-E", "ntp.j2", "ios/campus/main/ntp.j2"),
+    ("ios", None, None, None, "ntp.j2", "ios/main/ntp.j2"),
+    ("nxos", None, "N9K", None, "ntp.j2", "nxos/main/ntp.j2"),
+    ("iosxr", None, None, None, "ntp.j2", None),
+    ("ios", None, None, None, "other.j2", None),
+]
+
+
+@pytest.mark.parametrize("network_os,solution,family,model,template_name,response", template_index_resolve_table)
+def test_template_index_resolve(templates_directory, network_os, solution, family, model, template_name, response):
+    template_index = TemplateIndex(templates_directory=str(templates_directory))
+    found_template = template_index.resolve(
+        network_os=network_os, template_name=template_name, solution=solution, family=family, model=model
+    )
+
+    if response:
+        assert found_template == os.path.join(str(templates_directory), *response.split("/"))
+
+    else:
+        assert found_template is None
+
+
+def test_template_index_rebuilds_when_tree_changes(templates_directory):
+    template_index = TemplateIndex(templates_directory=str(templates_directory), check_interval=0)
+
+    assert template_index.resolve(network_os="iosxr", template_name="ntp.j2") is None
+    assert template_index.resolve(network_os="ios", template_name="ntp.j2") is not None
+    assert template_index.builds == 1
+
+    templates_directory.joinpath("iosxr", "main").mkdir(parents=True)
+    templates_directory.joinpath("iosxr", "main", "ntp.j2").write_text("ntp")
+    os.utime(templates_directory, ns=(0, 0))
+
+    assert template_index.resolve(network_os="iosxr", template_name="ntp.j2") is not None
+    assert template_index.builds == 2
+
+
+def test_get_template_index_is_shared(templates_directory):
+    clear_template_indexes()
+
+    assert get_template_index(str(templates_directory)) is get_template_index(str(templates_directory))
+
+    clear_template_indexes()
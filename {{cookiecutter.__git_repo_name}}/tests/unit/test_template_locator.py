@@ -0,0 +1,55 @@
+from plugins.module_utils.render.template_locator import (
+    templates_directory_candidates,
+    find_templates_directory,
+    clear_templates_directory_cache,
+)
+from plugins.module_utils.render.render_settings import setting_name
+import os
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clean_templates_directory_cache():
+    clear_templates_directory_cache()
+    yield
+    clear_templates_directory_cache()
+
+
+def test_templates_directory_candidates(monkeypatch):
+    monkeypatch.setenv("ANSIBLE_COLLECTIONS_PATH", f"/first{os.pathsep}/second")
+    candidates = templates_directory_candidates(namespace="namespace", collection="name")
+
+    assert candidates[0] == os.path.abspath("templates")
+    assert candidates[1] == os.path.join("/first", "ansible_collections", "namespace", "name", "templates")
+    assert candidates[2] == os.path.join("/second", "ansible_collections", "namespace", "name", "templates")
+
+
+def test_find_templates_directory_from_collection(monkeypatch):
+    monkeypatch.delenv(setting_name("TEMPLATES_PATH"), raising=False)
+
+    assert find_templates_directory() == os.path.abspath("templates")
+
+
+def test_find_templates_directory_setting(monkeypatch, tmp_path):
+    monkeypatch.setenv(setting_name("TEMPLATES_PATH"), str(tmp_path))
+
+    assert find_templates_directory() == str(tmp_path)
+
+
+def test_find_templates_directory_is_memoized(monkeypatch, tmp_path):
+    templates_path = tmp_path / "templates"
+    templates_path.mkdir()
+    monkeypatch.setenv(setting_name("TEMPLATES_PATH"), str(templates_path))
+
+    assert find_templates_directory() == str(templates_path)
+
+    templates_path.rmdir()
+
+    assert find_templates_directory() == str(templates_path)
+
+
+def test_find_templates_directory_setting_bad(monkeypatch, tmp_path):
+    monkeypatch.setenv(setting_name("TEMPLATES_PATH"), str(tmp_path / "does-not-exist"))
+
+    with pytest.raises(FileNotFoundError):
+        find_templates_directory()
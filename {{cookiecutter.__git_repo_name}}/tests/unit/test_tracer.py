@@ -0,0 +1,133 @@
+from plugins.module_utils.tracing.tracer import (
+    DISABLED_TRACER,
+    NULL_SPAN,
+    Tracer,
+    get_tracer,
+)
+from plugins.module_utils.render.render_settings import setting_name
+from plugins.filter.render_filters import FilterModule
+import json
+import os
+import pytest
+
+
+def read_events(trace_path):
+    with open(trace_path, encoding="utf-8") as trace_file:
+        return [json.loads(line) for line in trace_file]
+
+
+def test_tracer_disabled(tmp_path):
+    tracer = Tracer()
+
+    def message():
+        raise AssertionError("message built while disabled")
+
+    def function():
+        return "value"
+
+    assert not tracer.enabled
+    assert tracer.span("render", host="router1") is NULL_SPAN
+    assert tracer.traced("filter")(function) is function
+
+    with tracer.span("render") as span:
+        span.set("acls", 1)
+
+    tracer.v(message)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_disabled_tracer():
+    assert not DISABLED_TRACER.enabled
+    assert DISABLED_TRACER.span("mongo_ping") is NULL_SPAN
+
+
+def test_tracer_span(tmp_path):
+    trace_path = str(tmp_path / "trace.jsonl")
+    tracer = Tracer(trace_path=trace_path)
+
+    with tracer.span("standard_acls", host="router1", src=None) as outer:
+        outer.set("acls", 2)
+
+        with tracer.span("render_many", template_name="standard_acls.j2"):
+            pass
+
+    inner_event, outer_event = read_events(trace_path)
+
+    assert tracer.enabled
+    assert inner_event["span"] == "render_many"
+    assert inner_event["parent"] == "standard_acls"
+    assert inner_event["host"] == "router1"
+    assert inner_event["attributes"] == {"template_name": "standard_acls.j2"}
+    assert outer_event["span"] == "standard_acls"
+    assert outer_event["parent"] is None
+    assert outer_event["attributes"] == {"src": None, "acls": 2}
+    assert outer_event["duration"] >= inner_event["duration"] >= 0
+    assert outer_event["pid"] == os.getpid()
+    assert tracer.current_span() is None
+
+
+def test_tracer_span_error(tmp_path):
+    trace_path = str(tmp_path / "trace.jsonl")
+    tracer = Tracer(trace_path=trace_path)
+
+    with pytest.raises(ValueError):
+        with tracer.span("validate"):
+            raise ValueError("bad data")
+
+    assert read_events(trace_path)[0]["attributes"] == {"error": "ValueError"}
+
+
+def test_tracer_traced(tmp_path):
+    trace_path = str(tmp_path / "trace.jsonl")
+    tracer = Tracer(trace_path=trace_path)
+
+    def ipv4_host(value):
+        return value
+
+    traced_ipv4_host = tracer.traced("filter.ipv4_host")(ipv4_host)
+
+    assert traced_ipv4_host("192.168.1.1") == "192.168.1.1"
+    assert traced_ipv4_host.__name__ == "ipv4_host"
+    assert read_events(trace_path)[0]["span"] == "filter.ipv4_host"
+
+
+def test_tracer_v(tmp_path):
+    trace_path = str(tmp_path / "trace.jsonl")
+    tracer = Tracer(trace_path=trace_path)
+
+    with tracer.span("find_template", host="router1"):
+        tracer.v(lambda: "FOUND: templates_path /templates/ios/main/standard_acls.j2")
+
+    log_event = read_events(trace_path)[0]
+
+    assert log_event["event"] == "log"
+    assert log_event["parent"] == "find_template"
+    assert log_event["host"] == "router1"
+    assert log_event["attributes"] == {"message": "FOUND: templates_path /templates/ios/main/standard_acls.j2"}
+
+
+def test_get_tracer(tmp_path, monkeypatch):
+    monkeypatch.delenv(setting_name("TRACE_PATH"), raising=False)
+
+    assert not get_tracer().enabled
+    assert get_tracer() is get_tracer()
+
+    monkeypatch.setenv(setting_name("TRACE_PATH"), str(tmp_path / "trace.jsonl"))
+
+    assert get_tracer().enabled
+    assert get_tracer() is get_tracer()
+
+
+def test_tracer_filters(tmp_path, monkeypatch):
+    monkeypatch.delenv(setting_name("TRACE_PATH"), raising=False)
+    untraced_filters = FilterModule().filters()
+
+    trace_path = tmp_path / "trace.jsonl"
+    monkeypatch.setenv(setting_name("TRACE_PATH"), str(trace_path))
+    traced_filters = FilterModule().filters()
+
+    assert list(traced_filters) == list(untraced_filters)
+    assert traced_filters["ipv4_host"] is not untraced_filters["ipv4_host"]
+    assert traced_filters["ipv4_host"]("192.168.1.1") == untraced_filters["ipv4_host"]("192.168.1.1")
+    assert read_events(trace_path)[0]["span"] == "filter.ipv4_host"